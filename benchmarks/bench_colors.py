@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк перефарбування QR-коду: попередній цикл по пікселях проти таблиць PIL
+
+Запуск:
+    python benchmarks/bench_colors.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PIL import Image
+
+from src.design.colors import apply_colors, hex_to_rgb
+
+# Розміри вихідних зображень
+SIZES = (330, 4000)
+
+# Варіанти стилізації: (колір модулів, колір фону, прозорий фон)
+STYLES = (
+    ("#1E3A8A", "#FFFFFF", False),
+    ("#7C3AED", "#FFFFFF", True),
+)
+
+def legacy_apply_colors(qr_image, fg_color, bg_color, transparent_bg):
+    """Попередня реалізація з циклом по пікселях (для порівняння)"""
+    styled_image = qr_image.copy().convert("RGBA")
+    new_data = []
+    for item in styled_image.getdata():
+        if item[:3] == (0, 0, 0):
+            new_data.append(hex_to_rgb(fg_color) + (255,))
+        elif item[:3] == (255, 255, 255):
+            if transparent_bg:
+                new_data.append((255, 255, 255, 0))
+            else:
+                new_data.append(hex_to_rgb(bg_color) + (255,))
+        else:
+            new_data.append(item)
+    styled_image.putdata(new_data)
+    if not transparent_bg:
+        styled_image = styled_image.convert("RGB")
+    return styled_image
+
+def make_source(size: int) -> Image.Image:
+    """Чорно-біле зображення, схоже на QR-код з box_size=10"""
+    modules = size // 10
+    random.seed(size)
+    small = Image.new('1', (modules, modules))
+    small.putdata([random.randint(0, 1) * 255 for _ in range(modules * modules)])
+    return small.resize((size, size), Image.Resampling.NEAREST)
+
+def make_smooth_source(size: int) -> Image.Image:
+    """Код з проміжними відтінками сірого (згладжене масштабування)"""
+    return make_source(size // 2).convert('L').resize((size, size), Image.Resampling.LANCZOS)
+
+def measure(func, *args, repeat: int = 1) -> float:
+    """Найкращий час виконання у секундах"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    print(f"{'Розмір':>10} {'Стиль':>22} {'Цикл, мс':>12} {'Таблиці, мс':>12} {'Прискорення':>12}")
+    for size in SIZES:
+        source = make_source(size)
+        for fg_color, bg_color, transparent_bg in STYLES:
+            args = (source, fg_color, bg_color, transparent_bg)
+            
+            # Перевірка ідентичності результату, зокрема для проміжних
+            # відтінків сірого, які мають залишатися без змін
+            for check_source in (source, make_smooth_source(size)):
+                check_args = (check_source,) + args[1:]
+                if legacy_apply_colors(*check_args).tobytes() != apply_colors(*check_args).tobytes():
+                    raise SystemExit(f"Результати відрізняються для {size}px "
+                                     f"{check_source.mode} {args[1:]}")
+            
+            legacy_time = measure(legacy_apply_colors, *args)
+            new_time = measure(apply_colors, *args, repeat=5)
+            style = f"{fg_color}{' прозорий' if transparent_bg else ''}"
+            print(f"{size:>6}x{size:<4} {style:>22} {legacy_time * 1000:>12.1f} "
+                  f"{new_time * 1000:>12.2f} {legacy_time / new_time:>11.0f}x")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
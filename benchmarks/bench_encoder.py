@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк кодерів матриці: qrcode проти векторизованого numpy
+
+Для кожної версії 1-40 (рівень корекції M) дані підбираються так, щоб
+заповнити версію повністю. Вимірюється повне кодування без кешу
+(сегментація, кодові слова, вибір маски, розміщення) і перевіряється,
+що матриці та маски обох кодерів збігаються.
+
+Запуск:
+    python benchmarks/bench_encoder.py
+"""
+
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from qrcode import util
+
+from src.core import QREngine, RenderConfig
+
+# Кількість запусків (береться найкращий час)
+RUNS = 3
+ERROR_CORRECTION = 'M'
+
+def payload_for_version(version: int, rng: random.Random) -> str:
+    """Текст у байтовому режимі, що повністю заповнює версію"""
+    level = util.BIT_LIMIT_TABLE[0][version]  # ERROR_CORRECT_M == 0
+    length = (level - 4 - util.length_in_bits(util.MODE_8BIT_BYTE, version)) // 8
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(length))
+
+def best_time(engine: QREngine, payload: str):
+    """Найкращий час кодування і його результат"""
+    best = None
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        encoded = engine.encode_matrix(payload)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, encoded
+
+def main():
+    config = RenderConfig(error_correction=ERROR_CORRECTION)
+    reference = QREngine(config, cache=None, encoder='qrcode')
+    vectorized = QREngine(config, cache=None, encoder='numpy')
+    rng = random.Random(2024)
+    
+    print(f"{'Версія':>6}{'модулів':>9}{'qrcode мс':>12}{'numpy мс':>11}{'прискорення':>13}{'збіг':>6}")
+    totals = [0.0, 0.0]
+    mismatches = 0
+    for version in range(1, 41):
+        payload = payload_for_version(version, rng)
+        ref_time, ref = best_time(reference, payload)
+        vec_time, vec = best_time(vectorized, payload)
+        
+        same = ref == vec and ref.version == version
+        mismatches += not same
+        totals[0] += ref_time
+        totals[1] += vec_time
+        print(f"{version:>6}{len(ref.matrix):>9}{ref_time * 1000:>12.1f}{vec_time * 1000:>11.1f}"
+              f"{ref_time / vec_time:>12.1f}x{'так' if same else 'НІ':>6}")
+    
+    print(f"\nУсього: qrcode {totals[0]:.2f} с, numpy {totals[1]:.2f} с "
+          f"({totals[0] / totals[1]:.1f}x), розбіжностей: {mismatches}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк профілю фіксованої геометрії
+
+Порівнюється кодування пакету даних у матриці з автоматичним підбором
+версії і маски, з фіксованою версією та з фіксованими версією і маскою
+(без оцінки штрафів) для обох кодерів. Окремо вимірюється час відмови
+для даних, що не вміщуються у зафіксовану версію.
+
+Запуск:
+    python benchmarks/bench_fixed_profile.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from qrcode.exceptions import DataOverflowError
+
+from src.core import QREngine, RenderConfig
+
+# Розмір пакету
+COUNT = 500
+
+# Профілі: (назва, версія, маска)
+PROFILES = (
+    ("авто", None, None),
+    ("версія 4", 4, None),
+    ("версія 4, маска 2", 4, 2),
+)
+
+def main():
+    payloads = [f"https://example.com/ticket/{i:010d}?seat=A{i % 40:02d}" for i in range(COUNT)]
+    
+    print(f"Кодування {COUNT} символів без кешу, мс на символ")
+    print(f"{'Профіль':<20}{'qrcode':>10}{'numpy':>10}")
+    for name, version, mask in PROFILES:
+        config = RenderConfig(version=version, mask=mask)
+        times = []
+        for encoder in ('qrcode', 'numpy'):
+            engine = QREngine(config, cache=None, encoder=encoder)
+            start = time.perf_counter()
+            for payload in payloads:
+                engine.encode_matrix(payload)
+            times.append((time.perf_counter() - start) / COUNT * 1000)
+        print(f"{name:<20}" + "".join(f"{t:>10.3f}" for t in times))
+    
+    # Відмова для даних, що не вміщуються
+    print()
+    engine = QREngine(RenderConfig(version=4), cache=None)
+    for length in (120, 2000):
+        start = time.perf_counter()
+        try:
+            engine.encode_matrix("x" * length)
+        except DataOverflowError as e:
+            print(f"{length} символів у версії 4: {(time.perf_counter() - start) * 1000:.2f} мс - {e}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк вартості імпорту логіки типів QR-кодів у процесі-виконавці
+
+Кожен варіант імпортується у новому процесі інтерпретатора; вимірюється
+час імпорту, кількість завантажених модулів і чи завантажено tkinter.
+
+Запуск:
+    python benchmarks/bench_imports.py
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Кількість запусків кожного варіанту
+RUNS = 30
+
+# Варіанти: (назва, код імпорту)
+CASES = (
+    ("представлення Tk (base + *_qr)",
+     "from src.qr_types import text_qr, url_qr, email_qr, phone_qr"),
+    ("моделі даних (models)",
+     "from src.qr_types.models import get_payload_model"),
+    ("виконавець: batch + представлення",
+     "import src.core.batch; from src.qr_types import text_qr, url_qr, email_qr, phone_qr"),
+    ("виконавець: batch + моделі",
+     "import src.core.batch; from src.qr_types.models import get_payload_model"),
+)
+
+# Код, що виконується у дочірньому процесі
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'elapsed': elapsed, 'modules': len(sys.modules),
+                   'tkinter': 'tkinter' in sys.modules}}))
+"""
+
+def probe(code: str) -> dict:
+    """Один запуск у новому процесі"""
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE.format(code=code)],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+def main():
+    print(f"{'Варіант':<36}{'медіана мс':>12}{'модулів':>10}{'tkinter':>9}")
+    for name, code in CASES:
+        results = [probe(code) for _ in range(RUNS)]
+        median = statistics.median(r['elapsed'] for r in results) * 1000
+        last = results[-1]
+        print(f"{name:<36}{median:>12.1f}{last['modules']:>10}"
+              f"{'так' if last['tkinter'] else 'ні':>9}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
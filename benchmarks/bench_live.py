@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк затримки введення у живому режимі
+
+До тексту з ~3900 символів (алфавітно-цифровий режим) дописуються
+100 символів з інтервалом 30 мс і паузою після кожних 20 символів, щоб
+кодування у фоновому потоці запускалося посеред введення. Вимірюється час кожного виклику у потоці
+Tk (натискання, передача запиту, отримання результату) і порівнюється з
+часом синхронної генерації, яку довелося б виконувати на кожне натискання.
+
+Запуск:
+    python benchmarks/bench_live.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from bench_preview import FakeLoop
+
+from src.core import QREngine, RenderConfig
+from src.ui.utils import BackgroundRenderer
+
+# Параметри введення
+BASE_LENGTH = 3900
+TYPED = 100
+KEY_INTERVAL_MS = 30
+PAUSE_EVERY = 20
+PAUSE_MS = 400
+LIVE_DEBOUNCE_MS = 250
+
+class LiveSession:
+    """Логіка живого режиму головного вікна без віджетів"""
+    
+    def __init__(self, loop: FakeLoop):
+        self.loop = loop
+        self.text = "LOREM IPSUM DOLOR SIT AMET. " * (BASE_LENGTH // 28)
+        self.config = RenderConfig(error_correction='L')
+        self.renderer = BackgroundRenderer(loop, self.encode, self.show, delay_ms=0)
+        self.after_id = None
+        self.last_request = None
+        self.results = []
+        self.key_times = []
+    
+    def key(self, char: str):
+        """Натискання клавіші: зміна тексту і перепланування таймера"""
+        start = time.perf_counter()
+        self.text += char
+        if self.after_id is not None:
+            self.loop.after_cancel(self.after_id)
+        self.after_id = self.loop.after(LIVE_DEBOUNCE_MS, self.submit)
+        self.key_times.append(time.perf_counter() - start)
+    
+    def submit(self):
+        """Знімок даних і запит кодування"""
+        self.after_id = None
+        payload = self.text.strip()
+        if len(payload) > 4296:
+            return
+        request = (payload, self.config)
+        if request == self.last_request:
+            return
+        self.last_request = request
+        self.renderer.request(payload, self.config)
+    
+    def encode(self, payload, config):
+        return QREngine(config).generate(payload)
+    
+    def show(self, result):
+        self.results.append(result)
+
+def main():
+    loop = FakeLoop()
+    session = LiveSession(loop)
+    
+    moment = 0
+    for i in range(TYPED):
+        loop.after(moment, lambda c=chr(65 + i % 26): session.key(c))
+        moment += KEY_INTERVAL_MS
+        if (i + 1) % PAUSE_EVERY == 0:
+            moment += PAUSE_MS
+    
+    start = time.perf_counter()
+    loop.run()
+    total = time.perf_counter() - start
+    
+    # Синхронна генерація на кожне натискання для порівняння
+    engine = QREngine(session.config, cache=None)
+    sync_start = time.perf_counter()
+    final = engine.generate(session.text.strip())
+    sync_time = time.perf_counter() - sync_start
+    
+    key_times = session.key_times
+    print(f"Довжина даних: {len(final.payload)} символів, версія {final.version}")
+    print(f"Натискань: {len(key_times)}, сеанс {total:.2f} с")
+    print(f"Натискання у потоці Tk: макс. {max(key_times) * 1000:.3f} мс, "
+          f"серед. {sum(key_times) / len(key_times) * 1000:.3f} мс")
+    print(f"Усі виклики у потоці Tk: макс. {max(loop.busy_time) * 1000:.2f} мс")
+    print(f"Фонових кодувань: {session.renderer.rendered}, "
+          f"відкинуто: {session.renderer.dropped}")
+    print(f"Синхронна генерація на натискання: {sync_time * 1000:.1f} мс")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
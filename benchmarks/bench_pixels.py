@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк виведення сирих пікселів
+
+Порівнюється отримання масиву RGBA через зображення PIL
+(render_matrix, convert, np.asarray - дві копії) з QREngine.pixels,
+де масив NumPy і є буфером результату. Перевіряється, що пікселі
+збігаються, а перегляди спільно використовують пам'ять буфера.
+
+Запуск:
+    python benchmarks/bench_pixels.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+
+from src.core import QREngine, RenderConfig
+from src.core.raster import render_matrix
+
+# Кількість повторів на розмір
+REPEATS = 50
+
+SIZES = (400, 800, 4000)
+
+def main():
+    config = RenderConfig(fg_color='#1A237E', transparent_bg=True)
+    engine = QREngine(config)
+    result = engine.generate("https://example.com/pixels/0000000001")
+    failures = 0
+    
+    print(f"Масив RGBA для символу версії {result.version}, мс")
+    print(f"{'розмір':>7}{'через PIL':>12}{'pixels':>10}{'прискорення':>13}")
+    for size in SIZES:
+        repeats = max(1, REPEATS * 400 // size)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            image = render_matrix(result.matrix, size=size, fg_color=config.fg_color,
+                                  transparent_bg=True).convert('RGBA')
+            reference = np.asarray(image)
+        pil_time = (time.perf_counter() - start) / repeats
+        
+        start = time.perf_counter()
+        for _ in range(repeats):
+            pixels = engine.pixels(result, 'RGBA', size)
+            array = pixels.to_numpy()
+        buffer_time = (time.perf_counter() - start) / repeats
+        
+        shared = np.shares_memory(array, np.frombuffer(pixels.memoryview(), dtype=np.uint8))
+        failures += not (shared and np.array_equal(reference, array))
+        print(f"{size:>7}{pil_time * 1000:>12.3f}{buffer_time * 1000:>10.3f}"
+              f"{pil_time / buffer_time:>12.1f}x")
+    
+    print(f"\nПомилок (пікселі або спільна пам'ять): {failures}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
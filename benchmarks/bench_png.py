@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк 1-бітного PNG
+
+Порівнюється попередній експорт PNG (render_image і
+image.save(optimize=True) у 8 або 32 бітах на піксель) з новими
+шляхами: QRExporter.export_bytes пише 1-бітний PNG прямо з матриці,
+пакетна генерація (process_chunk) растеризує блок символів у 1-бітні
+буфери (render_bits) і записує кожен через export_bits, а export_image
+зберігає вже растеризоване зображення з 1 бітом на піксель. Для
+кожного розміру і стилю виводяться розмір файлу і час на символ, а
+декодовані пікселі звіряються з render_image.
+
+Запуск:
+    python benchmarks/bench_png.py
+"""
+
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+from PIL import Image
+
+from src.core import QREngine, generate_qr
+from src.design.export import QRExporter
+
+# Стилі: (назва, налаштування дизайну)
+STYLES = (
+    ("чорно-білий", {}),
+    ("кольоровий", {'fg_color': '#1A237E', 'bg_color': '#FFF8E1'}),
+    ("прозорий фон", {'fg_color': '#1A237E', 'transparent_bg': True}),
+)
+
+SIZES = (400, 800, 4000)
+
+# Розмір блоку пакетної генерації
+BATCH_SIZE = 16
+
+def measure(function, repeats: int):
+    """Найкращий час виклику у мілісекундах і результат"""
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000, result
+
+def old_png(exporter: QRExporter, result, settings) -> bytes:
+    """Попередній _export_png: повний растр і optimize=True"""
+    output = io.BytesIO()
+    exporter.render_image(result, settings).save(output, 'PNG', optimize=True)
+    return output.getvalue()
+
+def raster_png(exporter: QRExporter, result, settings) -> bytes:
+    """Новий _export_png для вже растеризованого зображення"""
+    output = io.BytesIO()
+    exporter.export_image(exporter.render_image(result, settings), output, settings, 'png')
+    return output.getvalue()
+
+def batch_png(exporter: QRExporter, matrices, settings) -> list:
+    """Шлях пакетної генерації: блок 1-бітних буферів і запис кожного"""
+    files = []
+    for pixels in exporter.render_bits(matrices, settings):
+        output = io.BytesIO()
+        exporter.export_bits(pixels, output, settings)
+        files.append(output.getvalue())
+    return files
+
+def same_pixels(data: bytes, reference: Image.Image) -> bool:
+    """Чи збігаються декодовані пікселі з еталоном"""
+    with Image.open(io.BytesIO(data)) as image:
+        return np.array_equal(np.asarray(image.convert('RGBA')),
+                              np.asarray(reference.convert('RGBA')))
+
+def main():
+    exporter = QRExporter()
+    result = generate_qr("https://example.com/some/longer/path?id=1234567890")
+    payloads = [result.payload] + [f"https://example.com/some/longer/path?id={i:010d}"
+                                   for i in range(1, BATCH_SIZE)]
+    engine = QREngine(cache=None)
+    matrices = [entry.matrix for entry in engine.encode_matrices(payloads)]
+    mismatches = 0
+    
+    print(f"PNG символу версії {result.version}: байти / мс на символ (найкращий з повторів);")
+    print(f"пакет - блок з {BATCH_SIZE} символів, як у process_chunk")
+    print(f"{'Стиль':<15}{'розмір':>7}{'optimize=True':>20}{'1 біт з матриці':>20}"
+          f"{'пакет':>20}{'1 біт з растру':>20}")
+    for name, style in STYLES:
+        for size in SIZES:
+            settings = dict(style, high_quality=False, size=size)
+            repeats = 20 if size < 4000 else 3
+            
+            old_time, old_data = measure(lambda: old_png(exporter, result, settings), repeats)
+            new_time, new_data = measure(
+                lambda: exporter.export_bytes(result, settings, 'png'), repeats)
+            batch_time, batch_files = measure(
+                lambda: batch_png(exporter, matrices, settings), max(1, repeats // 4))
+            batch_time /= BATCH_SIZE
+            raster_time, raster_data = measure(
+                lambda: raster_png(exporter, result, settings), repeats)
+            
+            reference = exporter.render_image(result, settings)
+            mismatches += not (same_pixels(new_data, reference) and
+                               same_pixels(batch_files[0], reference) and
+                               same_pixels(raster_data, reference))
+            print(f"{name:<15}{size:>7}"
+                  f"{len(old_data):>10} /{old_time:>8.2f}"
+                  f"{len(new_data):>10} /{new_time:>8.2f}"
+                  f"{len(batch_files[0]):>10} /{batch_time:>8.2f}"
+                  f"{len(raster_data):>10} /{raster_time:>8.2f}")
+    
+    print(f"\nРозбіжностей пікселів: {mismatches}")
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк часу потоку Tk при оновленні превью дизайну
+
+Імітується перебір кольорових схем: серія змін з інтервалом у кадр.
+Порівнюється синхронне оновлення (перефарбування базового зображення і
+LANCZOS до 250 та 300 пікселів на кожну зміну) з BackgroundRenderer.
+Цикл подій Tk замінено простим планувальником after(), тому скрипт
+працює без дисплея; створення PhotoImage імітується копіюванням пікселів.
+
+Запуск:
+    python benchmarks/bench_preview.py
+"""
+
+import heapq
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PIL import Image
+
+from src.core import RenderConfig, generate_qr
+from src.core.raster import render_matrix
+from src.design.colors import apply_colors
+from src.ui.utils import BackgroundRenderer
+
+# Кольорові схеми, що перебираються
+PRESETS = (
+    ("#1E3A8A", "#FFFFFF"), ("#166534", "#FFFFFF"), ("#991B1B", "#FFFFFF"),
+    ("#7C3AED", "#FFFFFF"), ("#FFFFFF", "#1F2937"), ("#1E40AF", "#DBEAFE"),
+)
+
+# Кількість змін та інтервал між ними (мс)
+CHANGES = 60
+INTERVAL_MS = 16
+
+class FakeLoop:
+    """Мінімальний планувальник з інтерфейсом after/after_cancel"""
+    
+    def __init__(self):
+        self._timers = []
+        self._cancelled = set()
+        self._ids = itertools.count()
+        self.busy_time = []
+    
+    def after(self, ms, func):
+        timer_id = next(self._ids)
+        heapq.heappush(self._timers, (time.perf_counter() + ms / 1000, timer_id, func))
+        return timer_id
+    
+    def after_cancel(self, timer_id):
+        self._cancelled.add(timer_id)
+    
+    def run(self):
+        """Виконання таймерів, доки вони є"""
+        while self._timers:
+            due, timer_id, func = heapq.heappop(self._timers)
+            if timer_id in self._cancelled:
+                continue
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            start = time.perf_counter()
+            func()
+            self.busy_time.append(time.perf_counter() - start)
+
+def to_photo(image: Image.Image) -> bytes:
+    """Замінник ImageTk.PhotoImage: копіювання пікселів у RGB"""
+    return image.convert('RGB').tobytes()
+
+def run_sync(result) -> list:
+    """Попередній шлях: усе у потоці Tk на кожну зміну"""
+    loop = FakeLoop()
+    
+    def change(fg, bg):
+        styled = apply_colors(result.image, fg, bg, False)
+        to_photo(styled.resize((250, 250), Image.Resampling.LANCZOS))
+        styled = apply_colors(result.image, fg, bg, False)
+        to_photo(styled.resize((300, 300), Image.Resampling.LANCZOS))
+    
+    for i in range(CHANGES):
+        fg, bg = PRESETS[i % len(PRESETS)]
+        loop.after(i * INTERVAL_MS, lambda fg=fg, bg=bg: change(fg, bg))
+    loop.run()
+    return loop.busy_time
+
+def run_background(result):
+    """Новий шлях: потік Tk лише знімає параметри і показує результат"""
+    loop = FakeLoop()
+    
+    def render(qr_result, style):
+        return (render_matrix(qr_result.matrix, size=250, **style),
+                render_matrix(qr_result.matrix, size=300, **style))
+    
+    def deliver(images):
+        for image in images:
+            to_photo(image)
+    
+    renderer = BackgroundRenderer(loop, render, deliver)
+    
+    for i in range(CHANGES):
+        fg, bg = PRESETS[i % len(PRESETS)]
+        style = {'border': 4, 'fg_color': fg, 'bg_color': bg, 'transparent_bg': False}
+        loop.after(i * INTERVAL_MS, lambda style=style: renderer.request(result, style))
+    loop.run()
+    return loop.busy_time, renderer.stats()
+
+def main():
+    payload = "https://example.com/catalog/item?id=" + "7" * 300
+    result = generate_qr(payload, RenderConfig(error_correction='H'))
+    print(f"Версія {result.version}, базове зображення {result.image.size[0]}px, "
+          f"{CHANGES} змін з інтервалом {INTERVAL_MS} мс\n")
+    
+    sync_times = run_sync(result)
+    bg_times, stats = run_background(result)
+    
+    print(f"{'Шлях':<14}{'макс. мс':>10}{'серед. мс':>11}{'всього мс':>11}")
+    for name, times in (("синхронний", sync_times), ("фоновий", bg_times)):
+        print(f"{name:<14}{max(times) * 1000:>10.2f}"
+              f"{sum(times) / len(times) * 1000:>11.2f}{sum(times) * 1000:>11.1f}")
+    
+    print(f"\nBackgroundRenderer: відрендерено {stats['rendered']}, "
+          f"відкинуто {stats['dropped']}, макс. час у потоці Tk "
+          f"{stats['ui_time_max_ms']:.2f} мс")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк пакетної растеризації
+
+Для пакету символів однієї версії порівнюється render_matrix по одному
+символу з render_batch (один буфер NumPy на пакет) для чорно-білих,
+кольорових і прозорих кодів. Перед вимірюванням пікселі обох шляхів
+звіряються. Окремо перевіряється, що пакет PNG з іменами файлів .svg і
+.jpg у рядках записує кожен файл у форматі свого розширення.
+
+Запуск:
+    python benchmarks/bench_raster_batch.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+
+from src.core import QREngine, RenderConfig
+from src.core.batch import run_batch
+from src.core.raster import render_matrix
+from src.core.raster_batch import render_batch
+
+# Розмір пакету (один блок пакетної генерації)
+BATCH_SIZE = 64
+
+# Стилі: (назва, параметри)
+STYLES = (
+    ("чорно-білий", {}),
+    ("кольоровий", {'fg_color': '#1A237E', 'bg_color': '#FFF8E1'}),
+    ("прозорий фон", {'fg_color': '#1A237E', 'transparent_bg': True}),
+)
+
+SIZES = (400, 800)
+
+def same_pixels(single, batch) -> bool:
+    """Чи однакові пікселі зображень обох шляхів"""
+    return all(np.array_equal(np.asarray(a), np.asarray(b.convert(a.mode)))
+               for a, b in zip(single, batch))
+
+# Рядки пакету з різними розширеннями імен файлів при форматі PNG
+MIXED_ROWS = (
+    ("alpha", "a.svg"),
+    ("beta", "b"),
+    ("gamma", "c.svg"),
+    ("delta", "d.jpg"),
+)
+
+def check_mixed_extensions() -> int:
+    """Кількість рядків пакету з різними розширеннями, що не записали свій файл"""
+    with tempfile.TemporaryDirectory() as directory:
+        jobs_path = os.path.join(directory, "jobs.csv")
+        with open(jobs_path, 'w', encoding='utf-8') as f:
+            f.write("text,filename\n")
+            f.writelines(f"{text},{filename}\n" for text, filename in MIXED_ROWS)
+        
+        out_dir = os.path.join(directory, "out")
+        report = run_batch(jobs_path, out_dir, workers=1, export_format='png')
+        expected = {name if os.path.splitext(name)[1] else f"{name}.png" for _, name in MIXED_ROWS}
+        written = set(os.listdir(out_dir))
+        not_svg = 0
+        for name in written:
+            if name.endswith('.svg'):
+                with open(os.path.join(out_dir, name), 'rb') as f:
+                    not_svg += f.read(5) != b'<?xml'
+    return len(report.errors) + len(expected - written) + not_svg
+
+def main():
+    payloads = [f"https://example.com/t/{i:012d}" for i in range(BATCH_SIZE)]
+    engine = QREngine(RenderConfig(version=3), cache=None)
+    matrices = [entry.matrix for entry in engine.encode_matrices(payloads)]
+    mismatches = 0
+    
+    print(f"Пакет з {BATCH_SIZE} символів версії 3, мс на символ")
+    print(f"{'Стиль':<16}{'розмір':>7}{'по одному':>11}{'пакет':>9}{'прискорення':>13}")
+    for name, style in STYLES:
+        for size in SIZES:
+            start = time.perf_counter()
+            single = [render_matrix(matrix, size=size, **style) for matrix in matrices]
+            single_time = (time.perf_counter() - start) / BATCH_SIZE
+            
+            start = time.perf_counter()
+            batch = render_batch(matrices, size=size, **style)
+            batch_time = (time.perf_counter() - start) / BATCH_SIZE
+            
+            mismatches += not same_pixels(single, batch)
+            print(f"{name:<16}{size:>7}{single_time * 1000:>11.3f}{batch_time * 1000:>9.3f}"
+                  f"{single_time / batch_time:>12.1f}x")
+    
+    print(f"\nРозбіжностей пікселів: {mismatches}")
+    
+    failures = check_mixed_extensions()
+    print(f"Пакет PNG з іменами .svg/.jpg: помилок {failures}")
+    return 1 if mismatches or failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк табличного коду Ріда-Соломона
+
+Спочатку виконується перевірка check_reed_solomon (порівняння з
+qrcode.util.create_data для всіх версій і рівнів корекції), потім
+вимірюється час обчислення кодових слів для пакету символів і повного
+пакетного кодування рушієм. Саму перевірку без вимірювань запускає
+benchmarks/check_reed_solomon.py.
+
+Запуск:
+    python benchmarks/bench_reed_solomon.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from qrcode import util
+
+from src.core import QREngine, RenderConfig
+from src.core import reed_solomon
+
+from check_reed_solomon import CHECK_SAMPLES, check_all, random_segments
+
+# Розмір пакету і версії для вимірювань
+BATCH_SIZE = 500
+BATCH_VERSIONS = (5, 15, 25, 40)
+
+def timed(func) -> float:
+    """Час виконання функції"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def main():
+    rng = random.Random(7)
+    
+    mismatches = check_all(rng)
+    print(f"Перевірено 160 комбінацій версії і рівня корекції по {CHECK_SAMPLES} символи: "
+          f"розбіжностей {mismatches}\n")
+    
+    print(f"Кодові слова для пакету з {BATCH_SIZE} символів (рівень M), мс на символ")
+    print(f"{'Версія':>6}{'qrcode':>10}{'таблиці':>10}{'пакет':>10}")
+    for version in BATCH_VERSIONS:
+        data_lists = [random_segments(version, 0, rng) for _ in range(BATCH_SIZE)]
+        reference = timed(lambda: [util.create_data(version, 0, d) for d in data_lists])
+        tables = timed(lambda: [reed_solomon.create_data(version, 0, d) for d in data_lists])
+        batch = timed(lambda: reed_solomon.create_data_batch(version, 0, data_lists))
+        print(f"{version:>6}" + "".join(f"{t / BATCH_SIZE * 1000:>10.3f}"
+                                         for t in (reference, tables, batch)))
+    
+    # Повне кодування серійних номерів без кешу
+    payloads = [f"https://example.com/item/{i:08d}" for i in range(BATCH_SIZE)]
+    engine = QREngine(RenderConfig(), cache=None, encoder='numpy')
+    single = timed(lambda: [engine.encode_matrix(p) for p in payloads])
+    batch = timed(lambda: engine.encode_matrices(payloads))
+    assert engine.encode_matrices(payloads[:20]) == [engine.encode_matrix(p) for p in payloads[:20]]
+    print(f"\nРушій, {BATCH_SIZE} серійних URL: encode_matrix {single * 1000:.0f} мс, "
+          f"encode_matrices {batch * 1000:.0f} мс")
+    
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Порівняння версій QR-кодів: розбиття на сегменти qrcode проти оптимального
+
+Для зразкового набору даних (URL з числовими ідентифікаторами, телефони,
+vCard, Wi-Fi, email, квитки з серійними номерами) порівнюється версія,
+яку дає qrcode.add_data, з версією після оптимального розбиття на
+цифрові, алфавітно-цифрові та байтові сегменти.
+
+Запуск:
+    python benchmarks/bench_segments.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from qrcode import util
+
+from src.core import QREngine, RenderConfig
+
+# Зразковий набір даних: (назва, рядок)
+CORPUS = (
+    ("URL з ID", "https://shop.example.com/product/84920175532098?ref=10492"),
+    ("URL з ID (верхній регістр)", "HTTPS://EXAMPLE.COM/T/20240517000123456789"),
+    ("URL довгий", "https://example.com/orders/2024/05/17/"
+                   "000000123456789012345678901234567890/invoice.pdf"),
+    ("Телефон", "tel:+380501234567"),
+    ("SMS", "SMSTO:+380501234567:Код підтвердження 845120"),
+    ("Email", "mailto:office@example.com?subject=%D0%97%D0%B0%D0%BC%D0%BE%D0%B2%D0%BB%D0%B5%D0%BD%D0%BD%D1%8F%2012345"),
+    ("Wi-Fi", "WIFI:T:WPA;S:Office-5G;P:84920175532098;;"),
+    ("vCard", "BEGIN:VCARD\nVERSION:3.0\nN:Шевченко;Тарас\nTEL;TYPE=CELL:+380501234567\n"
+              "TEL;TYPE=WORK:+380442345678\nORG:ТОВ Приклад\nEMAIL:taras@example.com\n"
+              "ADR:;;вул. Хрещатик 1;Київ;;01001;Україна\nEND:VCARD"),
+    ("Квиток", "TICKET-2024-CONCERT-000000000184920175532098"),
+    ("Серійний номер", "SN:4006381333931-20240517-000123"),
+    ("Платіж", "BCD\n002\n1\nSCT\n\nТОВ Приклад\nUA213223130000026007233566001\n"
+               "UAH1500.00\n\n\nОплата рахунку 1029384756"),
+    ("Числа", "1234567890" * 12),
+    ("Текст", "Звичайний текст без довгих числових фрагментів."),
+)
+
+def stream_bits(qr) -> int:
+    """Довжина потоку сегментів у бітах (без термінатора і доповнення)"""
+    buffer = util.BitBuffer()
+    for data in qr.data_list:
+        buffer.put(data.mode, 4)
+        buffer.put(len(data), util.length_in_bits(data.mode, qr.version))
+        data.write(buffer)
+    return len(buffer)
+
+def main():
+    config = RenderConfig(error_correction='M')
+    reference = QREngine(config, cache=None, segmentation='qrcode')
+    optimal = QREngine(config, cache=None, segmentation='optimal')
+    
+    print(f"{'Дані':<28}{'символів':>9}{'бітів':>14}{'версія':>9}{'модулів':>14}")
+    total_ref = total_opt = bits_ref = bits_opt = smaller = 0
+    elapsed = 0.0
+    for name, payload in CORPUS:
+        ref_qr = reference.prepare(payload)
+        start = time.perf_counter()
+        opt_qr = optimal.prepare(payload)
+        elapsed += time.perf_counter() - start
+        
+        ref, opt = ref_qr.version, opt_qr.version
+        ref_bits, opt_bits = stream_bits(ref_qr), stream_bits(opt_qr)
+        bits_ref += ref_bits
+        bits_opt += opt_bits
+        total_ref += (ref * 4 + 17) ** 2
+        total_opt += (opt * 4 + 17) ** 2
+        smaller += opt < ref
+        print(f"{name:<28}{len(payload):>9}{ref_bits:>7}->{opt_bits:<6}{ref:>4}->{opt:<4}"
+              f"{(ref * 4 + 17) ** 2:>7}->{(opt * 4 + 17) ** 2:<6}")
+    
+    print(f"\nБітів даних разом: {bits_ref} -> {bits_opt} ({(1 - bits_opt / bits_ref) * 100:.1f}% менше)")
+    print(f"Менша версія: {smaller} з {len(CORPUS)}; модулів разом: {total_ref} -> {total_opt} "
+          f"({(1 - total_opt / total_ref) * 100:.1f}% менше площі)")
+    print(f"Оптимальне розбиття всього набору: {elapsed * 1000:.1f} мс")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк шаблону символу для серійних номерів
+
+Порівнюється кодування серійних номерів зі спільним префіксом у матриці:
+рушій по одному символу, пакетне кодування рушієм і генератор
+SymbolTemplate.generate. Час перераховується на мільйон символів
+(один процес). Перед вимірюванням матриці шаблону звіряються з
+векторизованим кодером на тій самій версії і масці.
+
+Запуск:
+    python benchmarks/bench_template.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.core import QREngine, RenderConfig
+from src.core import numpy_encoder, reed_solomon, segments
+from src.core.engine import ERROR_CORRECTION_LEVELS
+from src.core.template import SymbolTemplate, serial_payloads
+
+# Кількість символів у кожному вимірюванні
+COUNT = 20000
+
+# Шаблони серійних номерів
+PATTERNS = (
+    "TICKET-2024-CONCERT-{:09d}",
+    "https://example.com/t/{:012d}",
+    "SN:4006381333931-20240517-{:06d}",
+)
+
+def check(template: SymbolTemplate, payloads) -> int:
+    """Кількість розбіжностей з векторизованим кодером для тієї ж маски"""
+    level = ERROR_CORRECTION_LEVELS[template.error_correction]
+    mismatches = 0
+    for payload, matrix in zip(payloads, template.generate(payloads)):
+        data_list, _ = segments.optimal_segments(payload, template.version)
+        data = reed_solomon.create_data(template.version, level, data_list)
+        expected, _ = numpy_encoder.build_matrix(template.version, level, data, template.mask)
+        mismatches += not (expected == matrix).all()
+    return mismatches
+
+def per_million(func) -> float:
+    """Час виконання функції у перерахунку на мільйон символів, с"""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) / COUNT * 1_000_000
+
+def main():
+    config = RenderConfig(error_correction='M')
+    engine = QREngine(config, cache=None, encoder='numpy')
+    mismatches = 0
+    
+    print(f"{'Шаблон':<36}{'версія':>7}{'по одному':>11}{'пакет':>9}{'шаблон':>9}  с/млн")
+    for pattern in PATTERNS:
+        payloads = list(serial_payloads(pattern, start=1, count=COUNT))
+        template = SymbolTemplate.for_payload(payloads[0], config.error_correction)
+        mismatches += check(template, payloads[:200])
+        
+        single = per_million(lambda: [engine.encode_matrix(p) for p in payloads])
+        batch = per_million(lambda: engine.encode_matrices(payloads))
+        templated = per_million(lambda: sum(1 for _ in template.generate(payloads)))
+        print(f"{pattern:<36}{template.version:>7}{single:>11.0f}{batch:>9.0f}{templated:>9.0f}")
+    
+    print(f"\nРозбіжностей з векторизованим кодером: {mismatches}")
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Перевірка табличного коду Ріда-Соломона без вимірювань часу
+
+Для кожної комбінації версії 1-40 і рівня корекції L/M/Q/H потоки
+кодових слів reed_solomon.create_data і create_data_batch порівнюються
+з qrcode.util.create_data (випадкові дані різної довжини). Код виходу
+ненульовий, якщо є хоча б одна розбіжність.
+
+Запуск:
+    python benchmarks/check_reed_solomon.py
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from qrcode import util
+
+from src.core import reed_solomon
+
+# Символів на комбінацію версії і рівня при перевірці
+CHECK_SAMPLES = 4
+
+# Рівні корекції у порядку констант qrcode (M=0, L=1, H=2, Q=3)
+LEVEL_NAMES = ('M', 'L', 'H', 'Q')
+
+def random_segments(version: int, error_correction: int, rng: random.Random):
+    """Один байтовий сегмент випадкової довжини, що вміщується у версію"""
+    limit = util.BIT_LIMIT_TABLE[error_correction][version]
+    capacity = (limit - 4 - util.length_in_bits(util.MODE_8BIT_BYTE, version)) // 8
+    data = bytes(rng.getrandbits(8) for _ in range(rng.randint(0, capacity)))
+    return [util.QRData(data, mode=util.MODE_8BIT_BYTE)]
+
+def check_all(rng: random.Random) -> int:
+    """Порівняння з qrcode для всіх версій і рівнів; повертає кількість розбіжностей"""
+    mismatches = 0
+    for version in range(1, 41):
+        for error_correction in range(4):
+            data_lists = [random_segments(version, error_correction, rng)
+                          for _ in range(CHECK_SAMPLES)]
+            expected = [util.create_data(version, error_correction, segments)
+                        for segments in data_lists]
+            single = [reed_solomon.create_data(version, error_correction, segments)
+                      for segments in data_lists]
+            batch = reed_solomon.create_data_batch(version, error_correction, data_lists)
+            if single != expected or batch != expected:
+                mismatches += 1
+                print(f"Розбіжність: версія {version}, рівень {LEVEL_NAMES[error_correction]}")
+    return mismatches
+
+def main():
+    mismatches = check_all(random.Random(7))
+    print(f"Перевірено 160 комбінацій версії і рівня корекції по {CHECK_SAMPLES} символи: "
+          f"розбіжностей {mismatches}")
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
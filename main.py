@@ -3,32 +3,53 @@
 """
 QR Code Generator Pro v2.0
 Головний файл додатку
+
+Запуск:
+    python main.py                                   - графічний інтерфейс
+    python main.py batch jobs.csv --out DIR --workers N  - пакетна генерація
+    python main.py --startup-profile                 - GUI зі звітом про фази запуску
 """
 
 import sys
 import os
-import tkinter as tk
-from tkinter import messagebox
-
-# Додаємо src папку до шляху
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+import multiprocessing
 
-try:
-    from ui.main_window import QRCodeGenerator
-except ImportError as e:
-    print(f"Помилка імпорту: {e}")
-    print("Переконайтесь, що всі необхідні модулі встановлені:")
-    print("pip install -r requirements.txt")
-    sys.exit(1)
+# Додаємо кореневу папку проекту до шляху
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-def main():
-    """Головна функція додатку"""
+def run_gui():
+    """Запуск графічного інтерфейсу"""
+    from src.utils.profiling import startup_profiler
+    
+    with startup_profiler.phase("імпорти"):
+        import tkinter as tk
+        from tkinter import messagebox
+        
+        try:
+            from src.ui.main_window import QRCodeGenerator
+        except ImportError as e:
+            print(f"Помилка імпорту: {e}")
+            print("Переконайтесь, що всі необхідні модулі встановлені:")
+            print("pip install -r requirements.txt")
+            sys.exit(1)
+    
     try:
         # Створення головного вікна
-        root = tk.Tk()
+        with startup_profiler.phase("корінь Tk"):
+            root = tk.Tk()
         
         # Ініціалізація додатку
-        app = QRCodeGenerator(root)
+        with startup_profiler.phase("додаток"):
+            app = QRCodeGenerator(root)
+        
+        # Звіт друкується, коли цикл подій обробив відкладене малювання
+        # вікна і воно готове приймати введення
+        if startup_profiler.enabled:
+            def report_startup():
+                startup_profiler.mark("перша інтерактивність")
+                print(startup_profiler.format_report())
+            
+            root.after_idle(report_startup)
         
         # Обробка закриття додатку
         def on_closing():
@@ -39,10 +60,35 @@ def main():
         
         # Запуск головного циклу
         root.mainloop()
-        
+    
     except Exception as e:
         messagebox.showerror("Критична помилка", f"Не вдалося запустити додаток:\n{str(e)}")
         sys.exit(1)
 
+def run_batch(argv):
+    """Запуск пакетної генерації"""
+    try:
+        from src.core.batch import main as batch_main
+    except ImportError as e:
+        print(f"Помилка імпорту: {e}")
+        print("pip install -r requirements.txt")
+        sys.exit(1)
+    
+    sys.exit(batch_main(argv))
+
+def main():
+    """Головна функція додатку"""
+    if '--startup-profile' in sys.argv:
+        sys.argv.remove('--startup-profile')
+        from src.utils.profiling import startup_profiler
+        startup_profiler.enable()
+    
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        run_batch(sys.argv[2:])
+    else:
+        run_gui()
+
 if __name__ == "__main__":
+    # Потрібно для пулу процесів у зібраному exe
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
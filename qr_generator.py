@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext, colorchooser
-import qrcode
 from PIL import Image, ImageTk, ImageDraw
 import os
 import json
@@ -10,12 +9,9 @@ import urllib.parse
 import io
 import base64
 
-# Для SVG експорту
-try:
-    import svgwrite
-    SVG_AVAILABLE = True
-except ImportError:
-    SVG_AVAILABLE = False
+from src.core import QREngine, RenderConfig
+from src.core.raster import render_matrix
+from src.design.svg_writer import write_svg
 
 class QRCodeGenerator:
     def __init__(self, root):
@@ -29,7 +25,7 @@ class QRCodeGenerator:
         self.load_settings()
         
         # QR код переменные
-        self.current_qr_image = None
+        self.current_qr_result = None
         self.qr_photo = None
         self.current_qr_type = "text"
         self.preview_qr = None
@@ -294,9 +290,7 @@ class QRCodeGenerator:
         self.export_format_var = tk.StringVar(value=self.settings.get('export_format', 'PNG'))
         
         formats = ['PNG', 'JPG', 'SVG']
-        if not SVG_AVAILABLE:
-            formats.remove('SVG')
-            
+        
         for fmt in formats:
             ttk.Radiobutton(export_frame, text=fmt, variable=self.export_format_var, 
                            value=fmt, command=self.update_export_options).pack(anchor='w')
@@ -383,16 +377,12 @@ class QRCodeGenerator:
     
     def update_preview(self):
         """Обновление превью QR-кода"""
-        if not self.current_qr_image:
+        if not self.current_qr_result:
             return
             
         try:
-            # Создаем превью с текущими настройками дизайна
-            preview_image = self.create_styled_qr_image(self.current_qr_image, preview=True)
-            
-            # Изменяем размер для превью
-            display_size = (250, 250)
-            preview_display = preview_image.resize(display_size, Image.Resampling.LANCZOS)
+            # Создаем превью с текущими настройками дизайна прямо из матрицы
+            preview_display = self.create_styled_qr_image(self.current_qr_result, 250)
             
             # Конвертация для tkinter
             self.preview_qr = ImageTk.PhotoImage(preview_display)
@@ -407,45 +397,16 @@ class QRCodeGenerator:
         except Exception as e:
             print(f"Помилка оновлення превью: {e}")
     
-    def create_styled_qr_image(self, base_qr_image, preview=False):
-        """Создание стилизованного QR-кода"""
-        # Получаем цвета
-        fg_color = self.fg_color_var.get()
-        bg_color = self.bg_color_var.get() if not self.transparent_var.get() else None
-        
-        # Для простоты пока используем стандартные цвета
-        # В будущих версиях можно добавить более сложную стилизацию
-        styled_image = base_qr_image.copy()
-        
-        # Применяем цвета
-        if fg_color != "#000000" or bg_color != "#FFFFFF":
-            # Конвертируем в RGBA для работы с цветами
-            styled_image = styled_image.convert("RGBA")
-            data = styled_image.getdata()
-            
-            new_data = []
-            for item in data:
-                # Заменяем черный на выбранный цвет переднего плана
-                if item[:3] == (0, 0, 0):  # черный пиксель
-                    rgb = tuple(int(fg_color[i:i+2], 16) for i in (1, 3, 5))
-                    new_data.append(rgb + (255,))
-                # Заменяем белый на цвет фона или делаем прозрачным
-                elif item[:3] == (255, 255, 255):  # белый пиксель
-                    if self.transparent_var.get():
-                        new_data.append((255, 255, 255, 0))  # прозрачный
-                    else:
-                        rgb = tuple(int(bg_color[i:i+2], 16) for i in (1, 3, 5))
-                        new_data.append(rgb + (255,))
-                else:
-                    new_data.append(item)
-            
-            styled_image.putdata(new_data)
-            
-            # Конвертируем обратно в RGB если фон не прозрачный
-            if not self.transparent_var.get():
-                styled_image = styled_image.convert("RGB")
-        
-        return styled_image
+    def create_styled_qr_image(self, qr_result, size):
+        """Создание стилизованного QR-кода нужного размера из матрицы модулей"""
+        return render_matrix(
+            qr_result.matrix,
+            size=size,
+            border=self.settings['border'],
+            fg_color=self.fg_color_var.get(),
+            bg_color=self.bg_color_var.get(),
+            transparent_bg=self.transparent_var.get()
+        )
     
     def on_type_change(self, event=None):
         """Обработка изменения типа QR-кода"""
@@ -462,7 +423,7 @@ class QRCodeGenerator:
         self.update_type_info()
         
         # Очищаем QR-код
-        self.current_qr_image = None
+        self.current_qr_result = None
         self.qr_photo = None
         self.preview_qr = None
         self.qr_label.configure(image='', text="QR-код з'явиться тут після генерації")
@@ -823,33 +784,16 @@ class QRCodeGenerator:
             # Генерация текста для QR-кода
             qr_text = self.qr_types[self.current_qr_type]["generator"](input_data)
             
-            # Создание QR-кода
-            error_levels = {
-                'L': qrcode.constants.ERROR_CORRECT_L,
-                'M': qrcode.constants.ERROR_CORRECT_M,
-                'Q': qrcode.constants.ERROR_CORRECT_Q,
-                'H': qrcode.constants.ERROR_CORRECT_H
-            }
-            
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=error_levels.get(self.settings['error_correction'], qrcode.constants.ERROR_CORRECT_M),
-                box_size=self.settings['box_size'],
-                border=self.settings['border'],
+            # Создание QR-кода: матрица, версия, маска и базовое изображение
+            config = RenderConfig(
+                error_correction=self.settings['error_correction'],
+                box_size=int(self.settings['box_size']),
+                border=int(self.settings['border'])
             )
+            self.current_qr_result = QREngine(config).generate(qr_text)
             
-            qr.add_data(qr_text)
-            qr.make(fit=True)
-            
-            # Создание базового изображения
-            self.current_qr_image = qr.make_image(fill_color="black", back_color="white")
-            
-            # Создание стилизованного изображения для отображения
-            styled_image = self.create_styled_qr_image(self.current_qr_image)
-            
-            # Изменение размера для отображения в основной вкладке
-            display_size = (300, 300)
-            display_image = styled_image.resize(display_size, Image.Resampling.LANCZOS)
+            # Стилизованное изображение для отображения в основной вкладке
+            display_image = self.create_styled_qr_image(self.current_qr_result, 300)
             
             # Конвертация для tkinter
             self.qr_photo = ImageTk.PhotoImage(display_image)
@@ -871,7 +815,7 @@ class QRCodeGenerator:
     
     def save_qr(self):
         """Сохранение QR-кода"""
-        if not self.current_qr_image:
+        if not self.current_qr_result:
             messagebox.showwarning("Попередження", "Спочатку згенеруйте QR-код")
             return
         
@@ -887,13 +831,13 @@ class QRCodeGenerator:
             filename = f"QR_{type_name}_{timestamp}.{export_format}"
             filepath = os.path.join(self.settings['save_folder'], filename)
             
-            # Создание финального изображения
-            final_image = self.create_styled_qr_image(self.current_qr_image)
-            
-            # Определение размера
-            if self.high_quality_var.get() and export_format != 'svg':
-                final_size = (800, 800)
-                final_image = final_image.resize(final_size, Image.Resampling.LANCZOS)
+            # Создание финального изображения (для SVG растр не нужен)
+            if export_format != 'svg':
+                if self.high_quality_var.get():
+                    final_size = 800
+                else:
+                    final_size = self.current_qr_result.image.size[0]
+                final_image = self.create_styled_qr_image(self.current_qr_result, final_size)
             
             # Сохранение в зависимости от формата
             if export_format == 'svg':
@@ -917,70 +861,19 @@ class QRCodeGenerator:
     
     def save_as_svg(self, filepath):
         """Сохранение в формате SVG"""
-        if not SVG_AVAILABLE:
-            messagebox.showerror("Помилка", "SVG експорт недоступний. Встановіть svgwrite: pip install svgwrite")
-            return
-        
         try:
-            # Создаем базовый QR-код для получения матрицы
-            input_data = self.get_input_data()
-            qr_text = self.qr_types[self.current_qr_type]["generator"](input_data)
-            
-            error_levels = {
-                'L': qrcode.constants.ERROR_CORRECT_L,
-                'M': qrcode.constants.ERROR_CORRECT_M,
-                'Q': qrcode.constants.ERROR_CORRECT_Q,
-                'H': qrcode.constants.ERROR_CORRECT_H
-            }
-            
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=error_levels.get(self.settings['error_correction'], qrcode.constants.ERROR_CORRECT_M),
-                box_size=1,  # Для SVG используем размер 1
-                border=self.settings['border'],
-            )
-            
-            qr.add_data(qr_text)
-            qr.make(fit=True)
-            
-            # Получаем матрицу
-            matrix = qr.get_matrix()
-            
-            # Создаем SVG
-            module_size = 10  # Размер одного модуля в SVG
-            border_size = self.settings['border'] * module_size
-            svg_size = len(matrix) * module_size + 2 * border_size
-            
-            dwg = svgwrite.Drawing(filepath, size=(svg_size, svg_size))
-            
-            # Фон
-            if not self.transparent_var.get():
-                dwg.add(dwg.rect(insert=(0, 0), size=(svg_size, svg_size), 
-                               fill=self.bg_color_var.get()))
-            
-            # Модули QR-кода
-            fg_color = self.fg_color_var.get()
-            
-            for row in range(len(matrix)):
-                for col in range(len(matrix[row])):
-                    if matrix[row][col]:
-                        x = col * module_size + border_size
-                        y = row * module_size + border_size
-                        
-                        if self.module_style_var.get() == "circle":
-                            # Круглые модули
-                            dwg.add(dwg.circle(center=(x + module_size/2, y + module_size/2), 
-                                             r=module_size/2, fill=fg_color))
-                        elif self.module_style_var.get() == "rounded":
-                            # Закругленные модули
-                            dwg.add(dwg.rect(insert=(x, y), size=(module_size, module_size), 
-                                           fill=fg_color, rx=module_size/4, ry=module_size/4))
-                        else:
-                            # Квадратные модули
-                            dwg.add(dwg.rect(insert=(x, y), size=(module_size, module_size), 
-                                           fill=fg_color))
-            
-            dwg.save()
+            # Матрица уже получена при генерации, повторное кодирование не нужно
+            with open(filepath, 'w', encoding='utf-8', newline='\n') as f:
+                write_svg(
+                    f,
+                    self.current_qr_result.matrix,
+                    module_size=10,
+                    border=self.settings['border'],
+                    fg_color=self.fg_color_var.get(),
+                    bg_color=self.bg_color_var.get(),
+                    transparent_bg=self.transparent_var.get(),
+                    module_style=self.module_style_var.get()
+                )
             
         except Exception as e:
             messagebox.showerror("Помилка", f"Помилка збереження SVG: {str(e)}")
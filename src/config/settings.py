@@ -6,7 +6,9 @@
 
 import json
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from ..utils.profiling import startup_profiler
 
 class Settings:
     """Клас для управління налаштуваннями додатку"""
@@ -16,6 +18,8 @@ class Settings:
         self.default_settings = {
             "save_folder": os.path.expanduser("~/Desktop/QR_Codes"),
             "error_correction": "M",
+            "version": None,
+            "mask": None,
             "border": 4,
             "box_size": 10,
             "last_qr_type": "text",
@@ -28,9 +32,23 @@ class Settings:
             "window_geometry": "1100x900",
             "auto_save": False,
             "show_tips": True,
-            "language": "uk"
+            "language": "uk",
+            "live_mode": False
         }
-        self.settings = self.load_settings()
+        # Файл читається при першому зверненні до налаштувань
+        self._settings: Optional[Dict[str, Any]] = None
+    
+    @property
+    def settings(self) -> Dict[str, Any]:
+        """Словник налаштувань, що завантажується з файлу при першому зверненні"""
+        if self._settings is None:
+            with startup_profiler.phase("налаштування"):
+                self._settings = self.load_settings()
+        return self._settings
+    
+    @settings.setter
+    def settings(self, value: Dict[str, Any]):
+        self._settings = value
     
     def load_settings(self) -> Dict[str, Any]:
         """Завантаження налаштувань з файлу"""
@@ -0,0 +1,23 @@
+"""
+Ядро генерації QR-кодів без залежності від GUI
+
+Рушій (engine) імпортує qrcode і завантажується при першому зверненні,
+тому імпорт окремих підмодулів (raster, cache) не тягне за собою qrcode.
+"""
+
+# Імена та модулі, з яких вони завантажуються
+_LAZY_EXPORTS = {
+    'QREngine': 'engine', 'RenderConfig': 'engine', 'QRResult': 'engine',
+    'generate_qr': 'engine', 'MatrixCache': 'cache', 'matrix_cache': 'cache',
+    'SymbolTemplate': 'template', 'ModuleMatrix': 'matrix', 'PixelBuffer': 'pixels',
+}
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        module = importlib.import_module(f'.{_LAZY_EXPORTS[name]}', __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = ['QREngine', 'RenderConfig', 'QRResult', 'generate_qr', 'MatrixCache', 'matrix_cache',
+           'SymbolTemplate', 'ModuleMatrix', 'PixelBuffer']
\ No newline at end of file
@@ -0,0 +1,536 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Пакетна генерація QR-кодів з CSV або JSONL файлу
+
+Рядки читаються потоково і розподіляються між процесами пулу блоками,
+тому пам'ять не залежить від розміру файлу завдань. Кожен блок
+кодується і растеризується пакетно (process_chunk).
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
+
+from qrcode.exceptions import DataOverflowError
+
+from .engine import QREngine, RenderConfig
+
+# Типи QR-кодів, доступні у пакетному режимі
+BATCH_QR_TYPES = ('text', 'url', 'email', 'phone')
+
+# Розмір блоку рядків, що передається процесу за один раз
+DEFAULT_CHUNKSIZE = 64
+
+# Завдання: (номер рядка, дані рядка, помилка читання)
+BatchJob = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+# Результат: (номер рядка, ім'я файлу, помилка)
+BatchOutcome = Tuple[int, Optional[str], Optional[str]]
+
+# Підготовлене до кодування завдання: (номер рядка, ім'я файлу, дані для кодування)
+PreparedJob = Tuple[int, str, str]
+
+@dataclass
+class BatchReport:
+    """Звіт про виконання пакетної генерації"""
+    
+    total: int = 0
+    succeeded: int = 0
+    elapsed: float = 0.0
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+    
+    @property
+    def failed(self) -> int:
+        """Кількість рядків з помилками"""
+        return len(self.errors)
+    
+    @property
+    def rows_per_second(self) -> float:
+        """Швидкість обробки"""
+        return self.total / self.elapsed if self.elapsed > 0 else 0.0
+    
+    @property
+    def seconds_per_million(self) -> float:
+        """Оцінка часу на мільйон рядків за поточної швидкості"""
+        return 1_000_000 / self.rows_per_second if self.rows_per_second > 0 else 0.0
+    
+    def format_summary(self) -> str:
+        """Текстовий підсумок для консолі"""
+        return (f"Оброблено рядків: {self.total} за {self.elapsed:.2f} с "
+                f"({self.rows_per_second:.1f} рядків/с, "
+                f"{self.seconds_per_million / 60:.1f} хв на мільйон) | "
+                f"успішно: {self.succeeded}, з помилками: {self.failed}")
+    
+    def format_errors(self) -> str:
+        """Звіт про помилки по рядках"""
+        return "\n".join(f"Рядок {row}: {message}" for row, message in sorted(self.errors))
+
+def _normalize_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Приведення значень рядка до формату, який очікують типи QR-кодів"""
+    normalized = {}
+    for key, value in record.items():
+        if key is None or value is None:
+            continue
+        key = str(key).strip()
+        if isinstance(value, bool):
+            normalized[key] = value
+        else:
+            normalized[key] = str(value)
+    return normalized
+
+def iter_jobs(jobs_path: str) -> Iterator[BatchJob]:
+    """
+    Потокове читання завдань з CSV або JSONL файлу
+    
+    Args:
+        jobs_path: Шлях до файлу завдань (.csv або .jsonl)
+    
+    Yields:
+        Кортежі (номер рядка, дані, помилка читання)
+    """
+    extension = os.path.splitext(jobs_path)[1].lower()
+    
+    with open(jobs_path, 'r', encoding='utf-8-sig', newline='') as f:
+        if extension == '.csv':
+            reader = csv.DictReader(f)
+            for row_number, record in enumerate(reader, start=1):
+                yield row_number, _normalize_record(record), None
+        elif extension in ('.jsonl', '.ndjson'):
+            for row_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield row_number, None, f"Невірний JSON: {e.msg}"
+                    continue
+                if not isinstance(record, dict):
+                    yield row_number, None, "Рядок JSONL повинен бути об'єктом"
+                    continue
+                yield row_number, _normalize_record(record), None
+        else:
+            raise ValueError(f"Непідтримуваний формат файлу завдань: {extension}")
+
+# Стан процесу-виконавця, ініціалізується один раз на процес
+_worker_state: Dict[str, Any] = {}
+
+def _init_worker(config: RenderConfig, out_dir: str, export_format: str,
+                 export_settings: Dict[str, Any],
+                 template_params: Optional[Tuple[int, int]] = None):
+    """Ініціалізація процесу-виконавця"""
+    # Моделі даних без tkinter
+    from ..qr_types.models import get_payload_model
+    from ..design.export import QRExporter
+    
+    template = None
+    if template_params is not None:
+        from .template import SymbolTemplate
+        version, mask = template_params
+        template = SymbolTemplate(version, config.error_correction, mask)
+    
+    _worker_state.update({
+        'engine': QREngine(config, template=template),
+        'exporter': QRExporter(),
+        'qr_types': {key: get_payload_model(key) for key in BATCH_QR_TYPES},
+        'out_dir': out_dir,
+        'export_format': export_format,
+        'export_settings': export_settings
+    })
+
+def _type_key(data: Dict[str, Any]) -> str:
+    """Ключ типу QR-коду рядка (за замовчуванням text)"""
+    return str(data.get('type', 'text')).strip().lower() or 'text'
+
+def output_filename(data: Dict[str, Any], row_number: int, export_format: str) -> str:
+    """
+    Ім'я файлу рядка: колонка filename без шляху або ім'я за типом і номером
+    
+    Args:
+        data: Дані рядка
+        row_number: Номер рядка у файлі завдань
+        export_format: Формат файлів, якщо ім'я задано без розширення
+    
+    Returns:
+        Ім'я файлу у папці збереження
+    """
+    filename = os.path.basename(str(data.get('filename', '')).strip())
+    if not filename:
+        return f"QR_{_type_key(data).upper()}_{row_number:06d}.{export_format}"
+    if not os.path.splitext(filename)[1]:
+        return f"{filename}.{export_format}"
+    return filename
+
+def mark_duplicate_filenames(jobs: Iterator[BatchJob], export_format: str) -> Iterator[BatchJob]:
+    """
+    Позначення рядків, що записали б файл з уже зайнятим ім'ям
+    
+    Виконується в основному процесі, який бачить усі рядки: інакше
+    пізніший рядок мовчки перезаписав би файл попереднього (можливо, з
+    іншого процесу), а обидва вважалися б успішними. Ім'я займає перший
+    коректний рядок, що його використовує; наступні отримують помилку
+    рядка. Рядки, що не проходять валідацію, імен не займають, а їхню
+    помилку звітує виконавець.
+    
+    Args:
+        jobs: Завдання з iter_jobs
+        export_format: Формат файлів
+    
+    Yields:
+        Ті самі завдання; дублікати - з помилкою замість даних
+    """
+    from ..qr_types.models import get_payload_model
+    
+    models = {key: get_payload_model(key) for key in BATCH_QR_TYPES}
+    owners: Dict[str, int] = {}
+    for job in jobs:
+        row_number, data, read_error = job
+        if read_error:
+            yield job
+            continue
+        
+        model = models.get(_type_key(data))
+        try:
+            is_valid = model is not None and model.validate(model.coerce(data))[0]
+        except Exception:
+            is_valid = False
+        if not is_valid:
+            yield job
+            continue
+        
+        filename = output_filename(data, row_number, export_format)
+        key = os.path.normcase(filename)
+        owner = owners.setdefault(key, row_number)
+        if owner != row_number:
+            yield row_number, None, f"Ім'я файлу {filename} вже використано у рядку {owner}"
+        else:
+            yield job
+
+def _prepare_job(job: BatchJob) -> Tuple[Optional[PreparedJob], Optional[BatchOutcome]]:
+    """
+    Валідація рядка і підготовка даних для кодування
+    
+    Returns:
+        Кортеж (підготовлене завдання, None) або (None, результат з помилкою)
+    """
+    row_number, data, read_error = job
+    if read_error:
+        return None, (row_number, None, read_error)
+    
+    type_key = _type_key(data)
+    model = _worker_state['qr_types'].get(type_key)
+    if model is None:
+        return None, (row_number, None, f"Невідомий тип QR-коду: {type_key}")
+    
+    # Валідація
+    data = model.coerce(data)
+    is_valid, message = model.validate(data)
+    if not is_valid:
+        return None, (row_number, None, message)
+    
+    filename = output_filename(data, row_number, _worker_state['export_format'])
+    return (row_number, filename, model.build_payload(data)), None
+
+def process_job(job: BatchJob) -> BatchOutcome:
+    """
+    Обробка одного рядка: валідація, генерація та експорт
+    
+    Args:
+        job: Завдання з iter_jobs
+    
+    Returns:
+        Кортеж (номер рядка, ім'я файлу, помилка)
+    """
+    try:
+        prepared, outcome = _prepare_job(job)
+        if outcome is not None:
+            return outcome
+        row_number, filename, payload = prepared
+        
+        # Генерація
+        result = _worker_state['engine'].generate(payload)
+        
+        # Експорт
+        filepath = os.path.join(_worker_state['out_dir'], filename)
+        if not _worker_state['exporter'].export_qr(result, filepath,
+                                                   _worker_state['export_settings']):
+            return row_number, None, f"Не вдалося зберегти {filename}"
+        
+        return row_number, filename, None
+    
+    except Exception as e:
+        return job[0], None, f"Помилка генерації: {e}"
+
+def _map_block(function: Callable[[List[Any]], List[Any]],
+               items: List[Any]) -> List[Tuple[Any, Optional[Exception]]]:
+    """
+    Пакетний виклик з переходом на поелементний при помилці
+    
+    Якщо блок не обробляється цілком (наприклад, дані одного рядка не
+    вміщуються в QR-код), кожен елемент обробляється окремо, тож помилку
+    отримують лише погані рядки.
+    
+    Args:
+        function: Функція, що обробляє список елементів
+        items: Елементи блоку
+    
+    Returns:
+        Пари (результат, None) або (None, помилка) у порядку елементів
+    """
+    try:
+        return [(result, None) for result in function(items)]
+    except Exception:
+        pass
+    
+    results = []
+    for item in items:
+        try:
+            results.append((function([item])[0], None))
+        except Exception as e:
+            results.append((None, e))
+    return results
+
+def process_chunk(jobs: List[BatchJob]) -> List[BatchOutcome]:
+    """
+    Обробка блоку рядків з пакетним кодуванням і растеризацією
+    
+    Матриці блоку кодуються одним викликом encode_matrices, а символи
+    однієї версії растеризуються разом: для PNG у 1-бітні буфери
+    (QRExporter.render_bits), для JPG у зображення (render_images).
+    SVG не потребує растру, тож такі рядки (зокрема з ім'ям файлу .svg у
+    растровому пакеті) обробляються по одному. Якщо блок не кодується
+    або не растеризується цілком, рядки обробляються окремо: помилку
+    отримують лише погані, а решта блоку записується як звичайно.
+    
+    Args:
+        jobs: Завдання з iter_jobs
+    
+    Returns:
+        Результати у довільному порядку
+    """
+    if _worker_state['export_format'] == 'svg':
+        return [process_job(job) for job in jobs]
+    
+    engine = _worker_state['engine']
+    exporter = _worker_state['exporter']
+    outcomes = []
+    prepared = []
+    for job in jobs:
+        try:
+            item, outcome = _prepare_job(job)
+        except Exception as e:
+            item, outcome = None, (job[0], None, f"Помилка генерації: {e}")
+        if outcome is not None:
+            outcomes.append(outcome)
+        elif os.path.splitext(item[1])[1].lower().lstrip('.') not in exporter.raster_writers:
+            # Формат з розширення імені файлу без растру (SVG)
+            outcomes.append(process_job(job))
+        else:
+            prepared.append((job, item))
+    
+    settings = _worker_state['export_settings']
+    rows = []
+    encoded = _map_block(engine.encode_matrices, [payload for _, (_, _, payload) in prepared])
+    for (_, (row_number, filename, _)), (entry, error) in zip(prepared, encoded):
+        if error is not None:
+            outcomes.append((row_number, None, f"Помилка генерації: {error}"))
+        else:
+            rows.append((row_number, filename, entry.matrix))
+    
+    # PNG пишеться з 1-бітних буферів, інші растрові формати - із зображень
+    png_rows = [row for row in rows if row[1].lower().endswith('.png')]
+    image_rows = [row for row in rows if not row[1].lower().endswith('.png')]
+    rendered = itertools.chain(
+        zip(png_rows, _map_block(lambda matrices: exporter.render_bits(matrices, settings),
+                                 [matrix for _, _, matrix in png_rows]),
+            itertools.repeat(exporter.export_bits)),
+        zip(image_rows, _map_block(lambda matrices: exporter.render_images(matrices, settings),
+                                   [matrix for _, _, matrix in image_rows]),
+            itertools.repeat(exporter.export_image))
+    )
+    
+    for (row_number, filename, _), (raster, error), save in rendered:
+        if error is not None:
+            outcomes.append((row_number, None, f"Помилка генерації: {error}"))
+        elif save(raster, os.path.join(_worker_state['out_dir'], filename), settings):
+            outcomes.append((row_number, filename, None))
+        else:
+            outcomes.append((row_number, None, f"Не вдалося зберегти {filename}"))
+    return outcomes
+
+def iter_chunks(jobs: Iterator[BatchJob], size: int) -> Iterator[List[BatchJob]]:
+    """Групування потоку завдань у блоки заданого розміру"""
+    chunk = []
+    for job in jobs:
+        chunk.append(job)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def sample_payload(jobs_path: str) -> Optional[str]:
+    """
+    Дані першого коректного рядка файлу завдань
+    
+    Args:
+        jobs_path: Файл завдань (.csv або .jsonl)
+    
+    Returns:
+        Рядок для кодування або None, якщо коректних рядків немає
+    """
+    from ..qr_types.models import get_payload_model
+    
+    for _, data, read_error in iter_jobs(jobs_path):
+        if read_error:
+            continue
+        type_key = _type_key(data)
+        if type_key not in BATCH_QR_TYPES:
+            continue
+        model = get_payload_model(type_key)
+        data = model.coerce(data)
+        if model.validate(data)[0]:
+            return model.build_payload(data)
+    return None
+
+def run_batch(jobs_path: str, out_dir: str, workers: Optional[int] = None,
+              export_format: str = 'png', config: Optional[RenderConfig] = None,
+              export_settings: Optional[Dict[str, Any]] = None,
+              chunksize: int = DEFAULT_CHUNKSIZE,
+              template_params: Optional[Tuple[int, int]] = None) -> BatchReport:
+    """
+    Пакетна генерація QR-кодів у пулі процесів
+    
+    Args:
+        jobs_path: Файл завдань (.csv або .jsonl)
+        out_dir: Папка для збереження
+        workers: Кількість процесів (за замовчуванням - кількість ядер)
+        export_format: Формат файлів (png, jpg, svg)
+        config: Конфігурація генерації
+        export_settings: Налаштування дизайну для QRExporter
+        chunksize: Кількість рядків, що передаються процесу за раз
+        template_params: (версія, маска) шаблону символу для всіх рядків
+            (template.SymbolTemplate) або None для звичайного кодування
+    
+    Returns:
+        Звіт про виконання
+    """
+    config = config if config is not None else RenderConfig()
+    if export_settings is None:
+        export_settings = config.design_settings()
+    workers = workers or os.cpu_count() or 1
+    export_format = export_format.lower()
+    
+    os.makedirs(out_dir, exist_ok=True)
+    
+    report = BatchReport()
+    initargs = (config, out_dir, export_format, export_settings, template_params)
+    start_time = time.perf_counter()
+    
+    jobs = mark_duplicate_filenames(iter_jobs(jobs_path), export_format)
+    if workers == 1:
+        # Без пулу - зручно для налагодження
+        _init_worker(*initargs)
+        chunks = map(process_chunk, iter_chunks(jobs, chunksize))
+        _collect_outcomes(itertools.chain.from_iterable(chunks), report)
+    else:
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=initargs) as pool:
+            chunks = pool.imap_unordered(process_chunk, iter_chunks(jobs, chunksize))
+            _collect_outcomes(itertools.chain.from_iterable(chunks), report)
+    
+    report.elapsed = time.perf_counter() - start_time
+    return report
+
+def _collect_outcomes(outcomes, report: BatchReport):
+    """Збір результатів у звіт"""
+    for row_number, filename, error in outcomes:
+        report.total += 1
+        if error:
+            report.errors.append((row_number, error))
+        else:
+            report.succeeded += 1
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Точка входу команди `main.py batch`
+    
+    Returns:
+        Код завершення: 0 - успіх, 1 - є помилки в рядках, 2 - критична помилка
+    """
+    from ..config.settings import app_settings
+    
+    parser = argparse.ArgumentParser(
+        prog="main.py batch",
+        description="Пакетна генерація QR-кодів з CSV або JSONL файлу"
+    )
+    parser.add_argument('jobs', help="Файл завдань (.csv або .jsonl)")
+    parser.add_argument('--out', required=True, help="Папка для збереження QR-кодів")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Кількість процесів (за замовчуванням - кількість ядер)")
+    parser.add_argument('--format', dest='export_format', choices=['png', 'jpg', 'svg'],
+                        default=str(app_settings.get('export_format', 'PNG')).lower(),
+                        help="Формат файлів")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE,
+                        help="Кількість рядків у блоці для одного процесу")
+    parser.add_argument('--template', action='store_true',
+                        help="Шаблон символу: версія і маска визначаються за першим рядком "
+                             "і однакові для всіх кодів (для серійних номерів)")
+    parser.add_argument('--qr-version', dest='qr_version', type=int, default=None,
+                        help="Фіксована версія всіх кодів (1-40); рядки, що не вміщуються, "
+                             "потрапляють у звіт про помилки")
+    parser.add_argument('--mask', type=int, default=None,
+                        help="Фіксована маска всіх кодів (0-7) без оцінки штрафів")
+    args = parser.parse_args(argv)
+    
+    try:
+        # Фіксована геометрія з командного рядка має пріоритет над налаштуваннями
+        overrides = {name: value for name, value in
+                     (('version', args.qr_version), ('mask', args.mask)) if value is not None}
+        config = RenderConfig.from_settings(app_settings, **overrides)
+        export_settings = config.design_settings()
+        export_settings['high_quality'] = app_settings.get('high_quality', True)
+        
+        template_params = None
+        if args.template and config.version is not None and config.mask is not None:
+            template_params = (config.version, config.mask)
+        elif args.template:
+            from .template import SymbolTemplate
+            
+            sample = sample_payload(args.jobs)
+            if sample is None:
+                raise ValueError("У файлі завдань немає коректних рядків для шаблону")
+            template = SymbolTemplate.for_payload(sample, config.error_correction,
+                                                  mask=config.mask, version=config.version)
+            template_params = (template.version, template.mask)
+        if template_params is not None:
+            print(f"Шаблон символу: версія {template_params[0]}, маска {template_params[1]}")
+        
+        report = run_batch(
+            args.jobs,
+            args.out,
+            workers=args.workers,
+            export_format=args.export_format,
+            config=config,
+            export_settings=export_settings,
+            chunksize=max(1, args.chunksize),
+            template_params=template_params
+        )
+    except (OSError, ValueError, DataOverflowError) as e:
+        print(f"Помилка: {e}", file=sys.stderr)
+        return 2
+    
+    print(report.format_summary())
+    if report.errors:
+        print("Помилки:", file=sys.stderr)
+        print(report.format_errors(), file=sys.stderr)
+        return 1
+    
+    return 0
\ No newline at end of file
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LRU кеш закодованих матриць QR-кодів
+
+Кодування (підбір версії, Reed-Solomon, оцінка всіх 8 масок) - найдорожча
+частина генерації, а її результат залежить лише від даних і параметрів
+кодування. Кеш зберігає матрицю, версію та маску за ключем
+(байти даних, рівень корекції, обмеження версії, обмеження маски,
+спосіб розбиття на сегменти) і
+обмежений як кількістю записів, так і приблизним обсягом пам'яті.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Any, NamedTuple, Optional, Tuple
+
+from .matrix import ModuleMatrix
+
+# Обмеження кешу за замовчуванням
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Ключ: (байти даних, рівень корекції, версія або None, маска або None, розбиття)
+CacheKey = Tuple[bytes, str, Optional[int], Optional[int], str]
+
+class EncodedMatrix(NamedTuple):
+    """Результат кодування, що зберігається у кеші"""
+    matrix: ModuleMatrix
+    version: int
+    mask: int
+
+def make_key(payload: str, error_correction: str, version: Optional[int] = None,
+             mask: Optional[int] = None, segmentation: str = 'optimal') -> CacheKey:
+    """
+    Формування ключа кешу
+    
+    Args:
+        payload: Рядок для кодування
+        error_correction: Рівень корекції помилок (L, M, Q, H)
+        version: Зафіксована версія або None для автоматичного підбору
+        mask: Зафіксована маска або None для автоматичного вибору
+        segmentation: Спосіб розбиття даних на сегменти
+    
+    Returns:
+        Ключ кешу
+    """
+    return (payload.encode('utf-8'), error_correction, version, mask, segmentation)
+
+def _entry_size(key: CacheKey, entry: EncodedMatrix) -> int:
+    """Приблизний обсяг пам'яті, який займає запис"""
+    return (sys.getsizeof(key[0]) + sys.getsizeof(entry.matrix)
+            + sys.getsizeof(entry.matrix.data))
+
+class MatrixCache:
+    """Потокобезпечний LRU кеш закодованих матриць"""
+    
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            max_entries: Максимальна кількість записів
+            max_bytes: Максимальний приблизний обсяг пам'яті у байтах
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        
+        self._entries: 'OrderedDict[CacheKey, Tuple[EncodedMatrix, int]]' = OrderedDict()
+        self._lock = threading.Lock()
+        
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: CacheKey) -> Optional[EncodedMatrix]:
+        """
+        Отримання запису з оновленням його позиції у черзі LRU
+        
+        Returns:
+            Запис або None, якщо його немає у кеші
+        """
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return item[0]
+    
+    def put(self, key: CacheKey, entry: EncodedMatrix):
+        """Додавання запису з витісненням найдавніших"""
+        size = _entry_size(key, entry)
+        
+        with self._lock:
+            # Запис, більший за весь кеш, не зберігається
+            if size > self.max_bytes or self.max_entries < 1:
+                return
+            
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            
+            self._entries[key] = (entry, size)
+            self.current_bytes += size
+            
+            while (len(self._entries) > self.max_entries
+                   or self.current_bytes > self.max_bytes):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+    
+    def get_or_encode(self, key: CacheKey,
+                      encode: Callable[[], EncodedMatrix]) -> EncodedMatrix:
+        """
+        Запис з кешу або результат кодування, який одразу додається до кешу
+        
+        Args:
+            key: Ключ кешу
+            encode: Функція кодування, що викликається при промаху
+        
+        Returns:
+            Закодована матриця
+        """
+        entry = self.get(key)
+        if entry is None:
+            entry = encode()
+            self.put(key, entry)
+        return entry
+    
+    def clear(self):
+        """Очищення кешу та лічильників"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        """Частка запитів, знайдених у кеші"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Статистика кешу"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hit_rate
+            }
+
+# Спільний кеш процесу для GUI, пакетного режиму та інших викликів
+matrix_cache = MatrixCache()
\ No newline at end of file
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Рушій генерації QR-кодів без залежності від tkinter
+
+Модуль можна імпортувати у фонових процесах, серверах та пакетних
+задачах: він не читає глобальні налаштування і не торкається віджетів.
+"""
+
+from dataclasses import dataclass, field, replace
+from importlib.util import find_spec
+from typing import Dict, Any, List, Sequence, Optional
+import qrcode
+from PIL import Image
+
+from ..design.colors import apply_colors
+from .cache import EncodedMatrix, MatrixCache, make_key, matrix_cache
+from .matrix import ModuleMatrix
+from .raster import matrix_to_mask
+
+# Рівні корекції помилок
+ERROR_CORRECTION_LEVELS = {
+    'L': qrcode.constants.ERROR_CORRECT_L,
+    'M': qrcode.constants.ERROR_CORRECT_M,
+    'Q': qrcode.constants.ERROR_CORRECT_Q,
+    'H': qrcode.constants.ERROR_CORRECT_H
+}
+
+# Підтримувані стилі модулів
+MODULE_STYLES = ('square', 'circle', 'rounded')
+
+# Кодери матриці: auto - numpy, якщо встановлено, інакше qrcode
+ENCODERS = ('auto', 'qrcode', 'numpy')
+
+# Розбиття даних на сегменти: optimal - мінімальна довжина у бітах
+# (segments.py), qrcode - евристика qrcode.add_data
+SEGMENTATIONS = ('optimal', 'qrcode')
+
+@dataclass(frozen=True)
+class RenderConfig:
+    """Незмінна конфігурація генерації та стилізації QR-коду"""
+    
+    error_correction: str = 'M'
+    box_size: int = 10
+    border: int = 4
+    fg_color: str = '#000000'
+    bg_color: str = '#FFFFFF'
+    transparent_bg: bool = False
+    module_style: str = 'square'
+    # Фіксована геометрія: версія і маска (None - підбір найменшої версії
+    # і маски з найменшим штрафом)
+    version: Optional[int] = None
+    mask: Optional[int] = None
+    
+    def __post_init__(self):
+        if self.error_correction not in ERROR_CORRECTION_LEVELS:
+            raise ValueError(f"Невідомий рівень корекції помилок: {self.error_correction}")
+        if self.box_size < 1:
+            raise ValueError(f"Розмір блоку повинен бути додатним: {self.box_size}")
+        if self.border < 0:
+            raise ValueError(f"Розмір границі не може бути від'ємним: {self.border}")
+        if self.module_style not in MODULE_STYLES:
+            raise ValueError(f"Невідомий стиль модулів: {self.module_style}")
+        if self.version is not None and not 1 <= self.version <= 40:
+            raise ValueError(f"Версія повинна бути від 1 до 40: {self.version}")
+        if self.mask is not None and not 0 <= self.mask <= 7:
+            raise ValueError(f"Маска повинна бути від 0 до 7: {self.mask}")
+    
+    @classmethod
+    def from_settings(cls, settings, **overrides) -> 'RenderConfig':
+        """
+        Створення конфігурації з об'єкта налаштувань
+        
+        Args:
+            settings: Будь-який об'єкт з методом get (Settings або dict)
+            **overrides: Значення, що мають пріоритет над налаштуваннями
+        
+        Returns:
+            Нова конфігурація
+        """
+        values = {}
+        for name in cls.__dataclass_fields__:
+            value = settings.get(name)
+            if value is not None:
+                values[name] = value
+        values.update(overrides)
+        
+        # Значення зі слайдерів tkinter можуть бути float
+        for name in ('box_size', 'border', 'version', 'mask'):
+            if name in values:
+                values[name] = int(values[name])
+        
+        return cls(**values)
+    
+    def with_changes(self, **changes) -> 'RenderConfig':
+        """Копія конфігурації зі зміненими полями"""
+        return replace(self, **changes)
+    
+    def design_settings(self) -> Dict[str, Any]:
+        """Налаштування дизайну у форматі, який очікує QRExporter"""
+        return {
+            'fg_color': self.fg_color,
+            'bg_color': self.bg_color,
+            'transparent_bg': self.transparent_bg,
+            'module_style': self.module_style,
+            'border': self.border
+        }
+
+@dataclass(frozen=True)
+class QRResult:
+    """
+    Результат генерації QR-коду
+    
+    Містить усе, що потрібно експортерам і превью: матрицю модулів для
+    векторних форматів і растеризації, параметри кодування та базове
+    зображення. Повторне кодування даних не потрібне.
+    """
+    
+    payload: str
+    matrix: ModuleMatrix = field(repr=False)
+    version: int
+    error_correction: str
+    mask: int
+    image: Image.Image = field(repr=False, compare=False)
+    
+    @property
+    def modules_count(self) -> int:
+        """Кількість модулів по стороні (без границі)"""
+        return len(self.matrix)
+
+class QREngine:
+    """Рушій, що перетворює дані на QR-код за заданою конфігурацією"""
+    
+    def __init__(self, config: Optional[RenderConfig] = None,
+                 cache: Optional[MatrixCache] = matrix_cache,
+                 encoder: str = 'auto', segmentation: str = 'optimal',
+                 template=None):
+        """
+        Args:
+            config: Конфігурація генерації
+            cache: Кеш закодованих матриць (None - без кешування)
+            encoder: Кодер матриці (auto, qrcode або numpy); результати
+                кодерів побітово однакові, тому кеш у них спільний
+            segmentation: Розбиття даних на сегменти (optimal або qrcode)
+            template: Шаблон символу (template.SymbolTemplate) для масової
+                генерації фіксованої версії і маски; кеш при цьому не
+                використовується, бо дані пакету зазвичай унікальні
+        """
+        if encoder not in ENCODERS:
+            raise ValueError(f"Невідомий кодер матриці: {encoder}")
+        if segmentation not in SEGMENTATIONS:
+            raise ValueError(f"Невідомий спосіб розбиття на сегменти: {segmentation}")
+        if encoder == 'numpy' and find_spec('numpy') is None:
+            raise ValueError("Кодер numpy потребує встановленого пакета numpy")
+        
+        self.config = config if config is not None else RenderConfig()
+        if template is not None and template.error_correction != self.config.error_correction:
+            raise ValueError(f"Рівень корекції шаблону ({template.error_correction}) "
+                             f"не збігається з конфігурацією ({self.config.error_correction})")
+        
+        self.cache = cache
+        self.encoder = encoder
+        self.segmentation = segmentation
+        self.template = template
+    
+    def prepare(self, payload: str) -> qrcode.QRCode:
+        """
+        Розбиття даних на сегменти і вибір найменшої версії
+        
+        Якщо версія зафіксована у конфігурації, підбір не виконується:
+        дані лише перевіряються на вміщення у цю версію.
+        
+        Args:
+            payload: Рядок для кодування
+        
+        Returns:
+            Об'єкт qrcode.QRCode з даними і версією, ще без матриці
+        
+        Raises:
+            DataOverflowError: Дані не вміщуються у зафіксовану версію
+        """
+        qr = qrcode.QRCode(
+            version=1,
+            error_correction=ERROR_CORRECTION_LEVELS[self.config.error_correction],
+            box_size=self.config.box_size,
+            border=self.config.border,
+        )
+        
+        version = self.config.version
+        if self.segmentation == 'optimal':
+            from .segments import fit_segments, fixed_segments
+            
+            if version is None:
+                version, segments = fit_segments(payload, qr.error_correction)
+            else:
+                segments = fixed_segments(payload, qr.error_correction, version)
+            for segment in segments:
+                qr.add_data(segment)
+        else:
+            qr.add_data(payload)
+            if version is None:
+                version = qr.best_fit(start=qr.version)
+            else:
+                from .segments import ensure_fits
+                ensure_fits(qr.data_list, qr.error_correction, version)
+        qr.version = version
+        return qr
+    
+    def encode(self, payload: str) -> qrcode.QRCode:
+        """
+        Кодування даних у QR-код засобами qrcode
+        
+        Args:
+            payload: Рядок для кодування
+        
+        Returns:
+            Скомпільований об'єкт qrcode.QRCode
+        """
+        qr = self.prepare(payload)
+        
+        # Те саме, що make(fit=True), але з явним вибором маски,
+        # щоб її можна було зберегти у результаті
+        if self.config.mask is not None:
+            qr.mask_pattern = self.config.mask
+        else:
+            qr.mask_pattern = qr.best_mask_pattern()
+        qr.makeImpl(False, qr.mask_pattern)
+        
+        return qr
+    
+    def encode_matrix(self, payload: str) -> EncodedMatrix:
+        """
+        Кодування даних у матрицю модулів з використанням кешу
+        
+        Args:
+            payload: Рядок для кодування
+        
+        Returns:
+            Матриця модулів без границі, версія та маска
+        """
+        if self.template is not None:
+            return self.template.encode_matrix(payload)
+        if self.cache is None:
+            return self._encode_entry(payload)
+        
+        key = self._cache_key(payload)
+        return self.cache.get_or_encode(key, lambda: self._encode_entry(payload))
+    
+    def encode_matrices(self, payloads: Sequence[str]) -> List[EncodedMatrix]:
+        """
+        Кодування багатьох рядків за один виклик
+        
+        Символи групуються за версією, і кодові слова корекції для кожної
+        групи обчислюються разом (reed_solomon.create_data_batch), тож
+        пакетні задачі не платять накладні витрати інтерпретатора за
+        кожен символ окремо. Результати збігаються з encode_matrix.
+        
+        Args:
+            payloads: Рядки для кодування
+        
+        Returns:
+            Матриці у порядку payloads
+        """
+        if self.template is not None:
+            return self.template.encode_matrices(payloads)
+        if not self._use_numpy():
+            return [self.encode_matrix(payload) for payload in payloads]
+        
+        from .reed_solomon import create_data_batch
+        
+        results: List[Optional[EncodedMatrix]] = [None] * len(payloads)
+        pending: Dict[int, list] = {}
+        for index, payload in enumerate(payloads):
+            if self.cache is not None:
+                results[index] = self.cache.get(self._cache_key(payload))
+            if results[index] is None:
+                qr = self.prepare(payload)
+                pending.setdefault(qr.version, []).append((index, qr))
+        
+        for version, items in pending.items():
+            error_correction = items[0][1].error_correction
+            streams = create_data_batch(version, error_correction,
+                                        [qr.data_list for _, qr in items])
+            for (index, _), data in zip(items, streams):
+                entry = self._build_entry(version, error_correction, data)
+                if self.cache is not None:
+                    self.cache.put(self._cache_key(payloads[index]), entry)
+                results[index] = entry
+        
+        return results
+    
+    def _cache_key(self, payload: str):
+        """Ключ кешу для даних з параметрами кодування рушія"""
+        return make_key(payload, self.config.error_correction, self.config.version,
+                        self.config.mask, self.segmentation)
+    
+    def _encode_entry(self, payload: str) -> EncodedMatrix:
+        """Кодування без кешу"""
+        if self._use_numpy():
+            from .reed_solomon import create_data
+            
+            qr = self.prepare(payload)
+            data = create_data(qr.version, qr.error_correction, qr.data_list)
+            return self._build_entry(qr.version, qr.error_correction, data)
+        
+        qr = self.encode(payload)
+        return EncodedMatrix(
+            matrix=ModuleMatrix.from_rows(qr.modules),
+            version=qr.version,
+            mask=qr.mask_pattern
+        )
+    
+    def _build_entry(self, version: int, error_correction: int, data) -> EncodedMatrix:
+        """Матриця з готових кодових слів векторизованим кодером"""
+        from .numpy_encoder import build_matrix
+        
+        matrix, mask = build_matrix(version, error_correction, data, self.config.mask)
+        return EncodedMatrix(
+            matrix=ModuleMatrix.from_array(matrix),
+            version=version,
+            mask=mask
+        )
+    
+    def _use_numpy(self) -> bool:
+        """Чи кодувати векторизованим кодером"""
+        if self.encoder == 'auto':
+            from .numpy_encoder import NUMPY_AVAILABLE
+            return NUMPY_AVAILABLE
+        return self.encoder == 'numpy'
+    
+    def base_image(self, matrix) -> Image.Image:
+        """
+        Чорно-біле зображення матриці з box_size пікселів на модуль
+        
+        Args:
+            matrix: Матриця модулів без границі
+        
+        Returns:
+            Зображення у режимі '1', як у qrcode
+        """
+        image = matrix_to_mask(matrix, self.config.border)
+        total = image.size[0] * self.config.box_size
+        if self.config.box_size != 1:
+            image = image.resize((total, total), Image.Resampling.NEAREST)
+        return image.convert('1', dither=Image.Dither.NONE)
+    
+    def generate(self, payload: str) -> QRResult:
+        """
+        Генерація QR-коду з базовим чорно-білим зображенням
+        
+        Args:
+            payload: Рядок для кодування
+        
+        Returns:
+            Об'єкт QRResult з матрицею, параметрами кодування та зображенням
+        """
+        encoded = self.encode_matrix(payload)
+        
+        return QRResult(
+            payload=payload,
+            matrix=encoded.matrix,
+            version=encoded.version,
+            error_correction=self.config.error_correction,
+            mask=encoded.mask,
+            image=self.base_image(encoded.matrix)
+        )
+    
+    def pixels(self, result: QRResult, mode: str = 'RGBA', size: Optional[int] = None):
+        """
+        Пікселі результату у буфері без проміжних копій (core.pixels)
+        
+        Args:
+            result: Результат генерації
+            mode: Формат пікселів ('1', 'L' або 'RGBA'); кольори і прозорість
+                конфігурації застосовуються лише до 'RGBA'
+            size: Бажаний розмір у пікселях (None - box_size пікселів на модуль)
+        
+        Returns:
+            Об'єкт PixelBuffer з переглядами memoryview, NumPy і PIL
+        """
+        from .pixels import render_pixels
+        
+        scale = None if size else self.config.box_size
+        return render_pixels(result.matrix, mode, size, scale, self.config.border,
+                             self.config.fg_color, self.config.bg_color,
+                             self.config.transparent_bg)
+    
+    def render(self, result: QRResult) -> Image.Image:
+        """
+        Застосування кольорів конфігурації до базового зображення
+        
+        Args:
+            result: Результат генерації
+        
+        Returns:
+            Стилізоване зображення
+        """
+        return apply_colors(
+            result.image,
+            self.config.fg_color,
+            self.config.bg_color,
+            self.config.transparent_bg
+        )
+
+def generate_qr(payload: str, config: Optional[RenderConfig] = None) -> QRResult:
+    """Швидка генерація QR-коду без створення рушія вручну"""
+    return QREngine(config).generate(payload)
\ No newline at end of file
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Компактна матриця модулів QR-коду з бітовим пакуванням рядків
+
+Список списків bool з qrcode займає близько 8 байтів на модуль плюс
+накладні витрати списків: понад 250 КБ на символ версії 40. Тут кожен
+рядок упаковано у ceil(n / 8) байтів (старший біт - лівий модуль,
+1 - темний модуль, залишок останнього байта нульовий), а всі рядки
+зберігаються одним незмінним об'єктом bytes: близько 4 КБ на версію 40.
+
+Розкладка байтів збігається з np.packbits(..., axis=1) і з сирими
+даними зображень PIL у режимі '1' (з інверсією), тож перетворення у
+NumPy і PIL не потребують циклів Python.
+"""
+
+import re
+from itertools import chain
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+# Значення модулів для кожного байта рядка (старший біт перший)
+_BYTE_MODULES = tuple(tuple(bool(byte >> (7 - bit) & 1) for bit in range(8))
+                      for byte in range(256))
+
+# Відрізок темних модулів у двійковому записі рядка
+_DARK_RUN = re.compile('1+')
+
+class ModuleMatrix:
+    """
+    Незмінна квадратна матриця модулів без границі
+    
+    Підтримує протокол послідовності рядків (len, індексування, ітерація),
+    тож може передаватися туди, де очікується матриця з qrcode.
+    """
+    
+    __slots__ = ('size', 'stride', 'data')
+    
+    def __init__(self, size: int, data: bytes):
+        """
+        Args:
+            size: Кількість модулів по стороні
+            data: Упаковані рядки, size * ceil(size / 8) байтів
+        
+        Raises:
+            ValueError: Довжина даних не відповідає розміру
+        """
+        stride = (size + 7) // 8
+        if len(data) != size * stride:
+            raise ValueError(f"Очікується {size * stride} байтів для матриці {size}x{size}, "
+                             f"отримано {len(data)}")
+        self.size = size
+        self.stride = stride
+        self.data = bytes(data)
+    
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[bool]]) -> 'ModuleMatrix':
+        """
+        Пакування матриці з рядків значень bool (наприклад, qrcode.modules)
+        
+        Args:
+            rows: Рядки матриці
+        
+        Returns:
+            Нова матриця
+        """
+        rows = list(rows)
+        size = len(rows)
+        stride = (size + 7) // 8
+        padding = '0' * (stride * 8 - size)
+        data = b''.join(
+            int(''.join('1' if module else '0' for module in row) + padding, 2).to_bytes(stride, 'big')
+            for row in rows
+        )
+        return cls(size, data)
+    
+    @classmethod
+    def from_array(cls, array) -> 'ModuleMatrix':
+        """
+        Пакування булевого масиву NumPy форми (n, n)
+        
+        Args:
+            array: Масив модулів (True - темний)
+        
+        Returns:
+            Нова матриця
+        """
+        import numpy as np
+        
+        return cls(array.shape[0], np.packbits(array, axis=1).tobytes())
+    
+    @property
+    def nbytes(self) -> int:
+        """Обсяг упакованих даних у байтах"""
+        return len(self.data)
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def row(self, index: int) -> Tuple[bool, ...]:
+        """Рядок матриці як кортеж bool"""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("Номер рядка поза межами матриці")
+        start = index * self.stride
+        chunk = self.data[start:start + self.stride]
+        return tuple(chain.from_iterable(map(_BYTE_MODULES.__getitem__, chunk)))[:self.size]
+    
+    __getitem__ = row
+    
+    def __iter__(self) -> Iterator[Tuple[bool, ...]]:
+        for index in range(self.size):
+            yield self.row(index)
+    
+    def is_dark(self, row: int, col: int) -> bool:
+        """Чи темний модуль у заданій клітинці"""
+        return bool(self.data[row * self.stride + (col >> 3)] & (0x80 >> (col & 7)))
+    
+    def row_runs(self, index: int) -> List[Tuple[int, int]]:
+        """
+        Горизонтальні відрізки темних модулів рядка для векторних форматів
+        
+        Returns:
+            Список кортежів (початкова колонка, довжина)
+        """
+        start = index * self.stride
+        value = int.from_bytes(self.data[start:start + self.stride], 'big')
+        bits = format(value, f'0{self.stride * 8}b')
+        return [(match.start(), match.end() - match.start())
+                for match in _DARK_RUN.finditer(bits, 0, self.size)]
+    
+    def iter_runs(self) -> Iterator[List[Tuple[int, int]]]:
+        """Відрізки темних модулів кожного рядка по черзі"""
+        for index in range(self.size):
+            yield self.row_runs(index)
+    
+    def packed(self) -> memoryview:
+        """Упаковані рядки без копіювання (тільки читання)"""
+        return memoryview(self.data)
+    
+    def to_numpy(self, packed: bool = False):
+        """
+        Матриця у вигляді масиву NumPy
+        
+        Args:
+            packed: True - упаковані байти форми (n, stride) без копіювання
+                (масив лише для читання і спільний з матрицею);
+                False - булевий масив (n, n), розпакований однією операцією
+        
+        Returns:
+            Масив NumPy
+        """
+        import numpy as np
+        
+        view = np.frombuffer(self.data, dtype=np.uint8).reshape(self.size, self.stride)
+        if packed:
+            return view
+        return np.unpackbits(view, axis=1, count=self.size).view(bool)
+    
+    def to_image(self):
+        """
+        Зображення PIL у режимі '1' з одним пікселем на модуль
+        
+        Упаковані рядки декодуються PIL напряму (сирий режим '1;I'
+        інвертує біти, тож темний модуль стає чорним пікселем).
+        
+        Returns:
+            Зображення n x n без границі
+        """
+        from PIL import Image
+        
+        return Image.frombytes('1', (self.size, self.size), self.data, 'raw', '1;I', self.stride, 1)
+    
+    def to_rows(self) -> Tuple[Tuple[bool, ...], ...]:
+        """Матриця у вигляді кортежу кортежів bool"""
+        return tuple(self)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ModuleMatrix):
+            return NotImplemented
+        return self.size == other.size and self.data == other.data
+    
+    def __hash__(self) -> int:
+        return hash((self.size, self.data))
+    
+    def __repr__(self) -> str:
+        return f"ModuleMatrix(size={self.size}, nbytes={self.nbytes})"
\ No newline at end of file
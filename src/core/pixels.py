@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Сирі пікселі QR-коду для інтеграції без проміжних копій
+
+PixelBuffer - це пікселі у суцільному буфері, що реалізує протокол
+буфера (memoryview), з переглядами NumPy і PIL на ту саму пам'ять.
+Сервіси композиції можуть копіювати QR-код у власне полотно напряму,
+без перетворення зображення PIL.
+
+Контракт розкладки:
+    - рядки йдуть зверху вниз одним суцільним блоком, без проміжків
+      між рядками: байт рядка y починається з y * stride;
+    - 'RGBA': 4 байти на піксель (R, G, B, A), stride = width * 4;
+      прозорий фон має A = 0 і RGB = (255, 255, 255);
+    - 'L': 1 байт на піксель, 0 - темний модуль, 255 - фон,
+      stride = width (кольори конфігурації не застосовуються);
+    - '1': 1 біт на піксель, старший біт - лівий піксель, 1 - фон,
+      0 - темний модуль (як у PIL '1'), stride = ceil(width / 8),
+      зайві біти в кінці рядка нульові.
+
+Контракт володіння:
+    - буфер належить PixelBuffer і більше ніде не використовується;
+    - memoryview(), to_numpy() та to_image() (для 'L' і 'RGBA')
+      повертають перегляди тієї ж пам'яті без копіювання, і кожен
+      перегляд утримує буфер живим навіть після видалення PixelBuffer;
+    - усі перегляди лише для читання: PIL копіює буфер перед першою
+      зміною зображення, а для запису в масив NumPy потрібна копія
+      (array.copy());
+    - to_image() для '1' декодує біти у нове зображення (PIL не
+      підтримує спільну пам'ять для 1-бітних зображень).
+"""
+
+from typing import Optional
+
+from PIL import Image
+
+from ..design.colors import hex_to_rgb
+from .matrix import ModuleMatrix
+from .raster import render_matrix
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Підтримувані формати пікселів
+PIXEL_FORMATS = ('1', 'L', 'RGBA')
+
+# Байтів на піксель для форматів з цілими байтами
+_BYTES_PER_PIXEL = {'L': 1, 'RGBA': 4}
+
+class PixelBuffer:
+    """Незмінні пікселі QR-коду у суцільному буфері (див. контракт модуля)"""
+    
+    __slots__ = ('mode', 'width', 'height', 'stride', '_data')
+    
+    def __init__(self, mode: str, width: int, height: int, data):
+        """
+        Args:
+            mode: Формат пікселів ('1', 'L' або 'RGBA')
+            width: Ширина у пікселях
+            height: Висота у пікселях
+            data: Об'єкт з протоколом буфера розміром height * stride байтів;
+                PixelBuffer стає його єдиним власником
+        
+        Raises:
+            ValueError: Невідомий формат або невідповідний розмір даних
+        """
+        if mode not in PIXEL_FORMATS:
+            raise ValueError(f"Невідомий формат пікселів: {mode}")
+        
+        stride = (width + 7) // 8 if mode == '1' else width * _BYTES_PER_PIXEL[mode]
+        view = memoryview(data)
+        if view.nbytes != stride * height:
+            raise ValueError(f"Очікується {stride * height} байтів пікселів, отримано {view.nbytes}")
+        
+        if np is not None and isinstance(data, np.ndarray):
+            data.setflags(write=False)
+        self.mode = mode
+        self.width = width
+        self.height = height
+        self.stride = stride
+        self._data = data
+    
+    @property
+    def nbytes(self) -> int:
+        """Розмір буфера у байтах"""
+        return self.stride * self.height
+    
+    @property
+    def shape(self) -> tuple:
+        """Форма масиву to_numpy()"""
+        if self.mode == 'RGBA':
+            return (self.height, self.width, 4)
+        return (self.height, self.stride)
+    
+    def memoryview(self) -> memoryview:
+        """Плоский байтовий перегляд буфера лише для читання"""
+        return memoryview(self._data).cast('B').toreadonly()
+    
+    def to_numpy(self) -> 'np.ndarray':
+        """
+        Масив uint8 форми shape без копіювання (лише для читання)
+        
+        Для '1' це упаковані рядки (height, stride); розпакувати їх можна
+        через np.unpackbits(array, axis=1, count=width).
+        """
+        if np is None:
+            raise ValueError("Перегляд NumPy потребує встановленого пакета numpy")
+        array = np.frombuffer(self.memoryview(), dtype=np.uint8)
+        return array.reshape(self.shape)
+    
+    def to_image(self) -> Image.Image:
+        """Зображення PIL на тій самій пам'яті (для '1' - декодована копія)"""
+        if self.mode == '1':
+            return Image.frombytes('1', (self.width, self.height), bytes(self.memoryview()),
+                                   'raw', '1', self.stride, 1)
+        return Image.frombuffer(self.mode, (self.width, self.height), self._data,
+                                'raw', self.mode, self.stride, 1)
+    
+    def __repr__(self) -> str:
+        return (f"PixelBuffer(mode={self.mode!r}, width={self.width}, height={self.height}, "
+                f"stride={self.stride})")
+
+def render_pixels(matrix: ModuleMatrix, mode: str = 'L', size: Optional[int] = None,
+                  scale: Optional[int] = None, border: int = 4,
+                  fg_color: str = "#000000", bg_color: str = "#FFFFFF",
+                  transparent_bg: bool = False) -> PixelBuffer:
+    """
+    Растеризація матриці одразу у буфер пікселів
+    
+    З NumPy пікселі записуються у масив, який і стає буфером результату
+    (core.raster_batch); без NumPy зображення render_matrix копіюється
+    у буфер один раз.
+    
+    Args:
+        matrix: Матриця модулів без границі
+        mode: Формат пікселів ('1', 'L' або 'RGBA')
+        size: Бажаний розмір зображення у пікселях
+        scale: Кількість пікселів на модуль (якщо size не вказано)
+        border: Границя у модулях
+        fg_color: Колір модулів (лише для 'RGBA')
+        bg_color: Колір фону (лише для 'RGBA')
+        transparent_bg: Чи робити фон прозорим (лише для 'RGBA')
+    
+    Returns:
+        Буфер пікселів
+    """
+    if mode not in PIXEL_FORMATS:
+        raise ValueError(f"Невідомий формат пікселів: {mode}")
+    
+    if np is None:
+        if mode == 'RGBA':
+            image = render_matrix(matrix, size, scale, border, fg_color, bg_color, transparent_bg)
+        else:
+            image = render_matrix(matrix, size, scale, border)
+        image = image.convert(mode)
+        return PixelBuffer(mode, image.width, image.height, image.tobytes())
+    
+    from .raster_batch import render_stack
+    
+    if mode == 'L':
+        data = render_stack([matrix], size, scale, border)[0]
+        return PixelBuffer(mode, data.shape[1], data.shape[0], data)
+    
+    # Індекси: 0 - темний модуль, 1 - фон
+    index = render_stack([matrix], size, scale, border, 0, 1)[0]
+    height, width = index.shape
+    
+    if mode == '1':
+        data = np.packbits(index, axis=1)
+    else:
+        background = (255, 255, 255, 0) if transparent_bg else hex_to_rgb(bg_color) + (255,)
+        palette = np.array([hex_to_rgb(fg_color) + (255,), background], dtype=np.uint8)
+        # Піксель RGBA як одне 32-бітне слово: вибір без таблиці по каналах
+        dark, light = palette.view(np.uint32).ravel()
+        data = np.where(index.view(bool), light, dark).view(np.uint8).reshape(height, width, 4)
+    
+    return PixelBuffer(mode, width, height, data)
\ No newline at end of file
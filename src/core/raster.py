@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Растеризація QR-коду безпосередньо з матриці модулів
+
+Замість масштабування готового зображення з box_size (LANCZOS розмиває
+краї модулів) кожен модуль малюється цілою кількістю пікселів: матриця
+з одним пікселем на модуль збільшується методом NEAREST до потрібного
+розміру за одну алокацію.
+"""
+
+from typing import Optional, Sequence, Tuple, Union
+from PIL import Image
+
+from ..design.colors import apply_colors, hex_to_rgb
+from .matrix import ModuleMatrix
+
+# Значення пікселів у масці модулів
+DARK = 0
+LIGHT = 255
+
+def matrix_to_mask(matrix: Union[ModuleMatrix, Sequence[Sequence[bool]]],
+                   border: int = 4) -> Image.Image:
+    """
+    Зображення з одним пікселем на модуль (0 - темний, 255 - світлий)
+    
+    Упакована матриця ModuleMatrix декодується PIL без циклів Python;
+    інші послідовності рядків спершу пакуються.
+    
+    Args:
+        matrix: Матриця модулів без границі (ModuleMatrix або рядки bool)
+        border: Границя у модулях
+    
+    Returns:
+        Зображення у режимі 'L'
+    """
+    if not isinstance(matrix, ModuleMatrix):
+        matrix = ModuleMatrix.from_rows(matrix)
+    
+    modules = matrix.to_image().convert('L')
+    if border == 0:
+        return modules
+    
+    total = matrix.size + 2 * border
+    image = Image.new('L', (total, total), LIGHT)
+    image.paste(modules, (border, border))
+    return image
+
+def light_fill(mode: str, bg_color: str = "#FFFFFF",
+               transparent_bg: bool = False) -> Union[int, Tuple[int, ...]]:
+    """
+    Колір світлого модуля для зображення заданого режиму
+    
+    Args:
+        mode: Режим зображення ('L', 'RGB' або 'RGBA')
+        bg_color: Колір фону
+        transparent_bg: Чи прозорий фон
+    
+    Returns:
+        Значення пікселя для доповнення границі
+    """
+    if mode == 'L':
+        return LIGHT
+    if mode == 'RGBA':
+        return (255, 255, 255, 0) if transparent_bg else hex_to_rgb(bg_color) + (255,)
+    return hex_to_rgb(bg_color)
+
+def upscale(image: Image.Image, size: Optional[int] = None, scale: Optional[int] = None,
+            exact: bool = True, fill: Union[int, Tuple[int, ...]] = LIGHT) -> Image.Image:
+    """
+    Збільшення зображення з одним пікселем на модуль цілим множником
+    
+    Args:
+        image: Зображення з одним пікселем на модуль (з границею)
+        size: Бажаний розмір зображення у пікселях
+        scale: Кількість пікселів на модуль (якщо size не вказано)
+        exact: Доповнити границю до точного розміру size
+        fill: Колір доповнення (див. light_fill)
+    
+    Returns:
+        Збільшене зображення
+    """
+    total = image.size[0]
+    
+    if scale is None:
+        scale = max(1, size // total) if size else 1
+    
+    if scale != 1:
+        image = image.resize((total * scale, total * scale), Image.Resampling.NEAREST)
+    
+    # Доповнення світлою границею до точного розміру
+    if exact and size and size > image.size[0]:
+        canvas = Image.new(image.mode, (size, size), fill)
+        offset = (size - image.size[0]) // 2
+        canvas.paste(image, (offset, offset))
+        image = canvas
+    
+    return image
+
+def render_matrix(matrix: Sequence[Sequence[bool]], size: Optional[int] = None,
+                  scale: Optional[int] = None, border: int = 4,
+                  fg_color: str = "#000000", bg_color: str = "#FFFFFF",
+                  transparent_bg: bool = False, exact: bool = True) -> Image.Image:
+    """
+    Растеризація матриці модулів з чіткими краями
+    
+    Args:
+        matrix: Матриця модулів без границі
+        size: Бажаний розмір зображення у пікселях
+        scale: Кількість пікселів на модуль (якщо size не вказано)
+        border: Границя у модулях
+        fg_color: Колір модулів
+        bg_color: Колір фону
+        transparent_bg: Чи робити фон прозорим
+        exact: Доповнити границю до точного розміру size
+    
+    Returns:
+        Стилізоване зображення
+    """
+    image = upscale(matrix_to_mask(matrix, border), size, scale, exact)
+    
+    if fg_color == "#000000" and bg_color == "#FFFFFF" and not transparent_bg:
+        return image
+    
+    return apply_colors(image, fg_color, bg_color, transparent_bg)
\ No newline at end of file
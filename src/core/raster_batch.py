@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Пакетна растеризація QR-кодів однієї версії в один буфер NumPy
+
+render_matrix обробляє кожен символ окремо: маска, масштабування PIL і,
+для кольорових кодів, накладання кольорів попіксельно. Тут N матриць
+однакового розміру розпаковуються одним масивом, а масштабування, тиха
+зона і кольори застосовуються до всього стеку за один векторизований
+прохід. Результат - масив (N, H, W) uint8, а зображення PIL для
+кожного символу - це перегляди його зрізів без копіювання.
+
+Чорно-білі коди мають режим 'L' (0 - темний, 255 - світлий), кольорові
+і прозорі - режим 'P' з палітрою з двох кольорів (0 - модуль, 1 - фон),
+прозорий фон позначається індексом прозорості палітри. Пікселі
+збігаються з render_matrix для тих самих параметрів. Для 1-бітного PNG
+стек індексів пакується по 8 пікселів у байт (render_bits).
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+from PIL import Image
+
+from ..design.colors import hex_to_rgb
+from .matrix import ModuleMatrix
+from .pixels import PixelBuffer
+from .raster import DARK, LIGHT
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Чи доступна пакетна растеризація
+NUMPY_AVAILABLE = np is not None
+
+# Індекси палітри для кольорових кодів
+FG_INDEX = 0
+BG_INDEX = 1
+
+def stack_geometry(modules_count: int, size: Optional[int] = None,
+                   scale: Optional[int] = None, border: int = 4,
+                   exact: bool = True) -> Tuple[int, int, int]:
+    """
+    Розміри зображення за тими ж правилами, що й raster.upscale
+    
+    Returns:
+        Кортеж (сторона зображення, пікселів на модуль, зміщення символу з границею)
+    """
+    total = modules_count + 2 * border
+    if scale is None:
+        scale = max(1, size // total) if size else 1
+    side = total * scale
+    if exact and size and size > side:
+        return size, scale, (size - side) // 2
+    return side, scale, 0
+
+def render_stack(matrices: Sequence[ModuleMatrix], size: Optional[int] = None,
+                 scale: Optional[int] = None, border: int = 4, dark_value: int = DARK,
+                 light_value: int = LIGHT, exact: bool = True) -> 'np.ndarray':
+    """
+    Растеризація матриць однакового розміру в один масив
+    
+    Args:
+        matrices: Матриці одного розміру (однієї версії)
+        size: Бажаний розмір зображення у пікселях
+        scale: Кількість пікселів на модуль (якщо size не вказано)
+        border: Границя у модулях
+        dark_value: Значення пікселя темного модуля
+        light_value: Значення пікселя фону
+        exact: Доповнити границю до точного розміру size
+    
+    Returns:
+        Масив uint8 форми (N, сторона, сторона), C-неперервний
+    
+    Raises:
+        ValueError: Матриці різного розміру
+    """
+    count = len(matrices)
+    n = matrices[0].size if count else 0
+    if any(matrix.size != n for matrix in matrices):
+        raise ValueError("Пакетна растеризація потребує матриць однакового розміру")
+    
+    side, scale, offset = stack_geometry(n, size, scale, border, exact)
+    pixels = np.empty((count, side, side), dtype=np.uint8)
+    if not count:
+        return pixels
+    
+    packed = np.frombuffer(b''.join(matrix.data for matrix in matrices), dtype=np.uint8)
+    dark = np.unpackbits(packed.reshape(count, n, matrices[0].stride), axis=2, count=n).view(bool)
+    
+    # Рядок пікселів для кожного рядка модулів (масштаб по горизонталі)
+    row_pixels = np.where(np.repeat(dark, scale, axis=2),
+                          np.uint8(dark_value), np.uint8(light_value))
+    
+    # Тиха зона навколо символу, потім рядки модулів, розмножені по вертикалі
+    start = offset + border * scale
+    end = start + n * scale
+    pixels[:, :start] = light_value
+    pixels[:, end:] = light_value
+    body = pixels[:, start:end]
+    body[:, :, :start] = light_value
+    body[:, :, end:] = light_value
+    body[:, :, start:end].reshape(count, n, scale, n * scale)[:] = row_pixels[:, :, None, :]
+    return pixels
+
+def stack_images(pixels: 'np.ndarray', mode: str = 'L',
+                 palette: Optional[Sequence[int]] = None,
+                 transparency: Optional[int] = None) -> List[Image.Image]:
+    """
+    Зображення PIL, що спільно використовують пам'ять стеку
+    
+    Зображення лише для читання: PIL скопіює буфер перед першою зміною.
+    Стек живе, доки існує хоча б одне зображення.
+    
+    Args:
+        pixels: Масив з render_stack
+        mode: 'L' або 'P'
+        palette: Палітра RGB для режиму 'P'
+        transparency: Прозорий індекс палітри
+    
+    Returns:
+        Список зображень у порядку стеку
+    """
+    height, width = pixels.shape[1:]
+    images = []
+    for frame in pixels:
+        image = Image.frombuffer(mode, (width, height), frame, 'raw', mode, 0, 1)
+        if palette is not None:
+            image.putpalette(palette)
+        if transparency is not None:
+            image.info['transparency'] = transparency
+        images.append(image)
+    return images
+
+def render_batch(matrices: Sequence[ModuleMatrix], size: Optional[int] = None,
+                 scale: Optional[int] = None, border: int = 4,
+                 fg_color: str = "#000000", bg_color: str = "#FFFFFF",
+                 transparent_bg: bool = False, exact: bool = True) -> List[Image.Image]:
+    """
+    Пакетний аналог render_matrix для матриць однакового розміру
+    
+    Args:
+        matrices: Матриці одного розміру (однієї версії)
+        size: Бажаний розмір зображення у пікселях
+        scale: Кількість пікселів на модуль (якщо size не вказано)
+        border: Границя у модулях
+        fg_color: Колір модулів
+        bg_color: Колір фону
+        transparent_bg: Чи робити фон прозорим
+        exact: Доповнити границю до точного розміру size
+    
+    Returns:
+        Зображення 'L' для чорно-білих кодів або 'P' для кольорових
+    """
+    if fg_color == "#000000" and bg_color == "#FFFFFF" and not transparent_bg:
+        pixels = render_stack(matrices, size, scale, border, exact=exact)
+        return stack_images(pixels)
+    
+    # Прозорий фон у растрі залишається білим, як у light_fill
+    background = (255, 255, 255) if transparent_bg else hex_to_rgb(bg_color)
+    palette = list(hex_to_rgb(fg_color) + background)
+    pixels = render_stack(matrices, size, scale, border, FG_INDEX, BG_INDEX, exact)
+    return stack_images(pixels, 'P', palette, BG_INDEX if transparent_bg else None)
+
+def render_bits(matrices: Sequence[ModuleMatrix], size: Optional[int] = None,
+                scale: Optional[int] = None, border: int = 4,
+                exact: bool = True) -> List[PixelBuffer]:
+    """
+    Пакетна растеризація у 1-бітні буфери пікселів (формат '1')
+    
+    Стек індексів (0 - модуль, 1 - фон) пакується одним викликом
+    np.packbits; буфер кожного символу - зріз спільного масиву.
+    
+    Args:
+        matrices: Матриці одного розміру (однієї версії)
+        size: Бажаний розмір зображення у пікселях
+        scale: Кількість пікселів на модуль (якщо size не вказано)
+        border: Границя у модулях
+        exact: Доповнити границю до точного розміру size
+    
+    Returns:
+        Буфери пікселів у порядку matrices
+    """
+    index = render_stack(matrices, size, scale, border, FG_INDEX, BG_INDEX, exact)
+    side = index.shape[2]
+    return [PixelBuffer('1', side, side, frame) for frame in np.packbits(index, axis=2)]
\ No newline at end of file
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Табличний код Ріда-Соломона для кодових слів корекції помилок QR-коду
+
+qrcode обчислює кодові слова корекції для кожного блоку окремо, діленням
+поліномів з об'єктами Python. Тут множення в GF(256) виконується через
+таблиці логарифмів і антилогарифмів, твірні поліноми кешуються для
+кожної довжини корекції, а для багатьох блоків однакової довжини
+(наприклад, усіх блоків пакету символів однієї версії) ділення
+виконується одночасно операціями NumPy над масивом блоків.
+
+Результат create_data збігається з qrcode.util.create_data байт у байт.
+"""
+
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+from qrcode import base, util
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Примітивний поліном поля GF(256) для QR-коду: x^8 + x^4 + x^3 + x^2 + 1
+PRIMITIVE_POLY = 0x11D
+
+def _build_tables() -> Tuple[List[int], List[int]]:
+    """Таблиці антилогарифмів (з подвоєнням для обходу mod 255) і логарифмів"""
+    exp = [0] * 512
+    log = [0] * 256
+    value = 1
+    for power in range(255):
+        exp[power] = value
+        log[value] = power
+        value <<= 1
+        if value & 0x100:
+            value ^= PRIMITIVE_POLY
+    for power in range(255, 512):
+        exp[power] = exp[power - 255]
+    return exp, log
+
+GF_EXP, GF_LOG = _build_tables()
+
+def gf_mul(a: int, b: int) -> int:
+    """Множення в GF(256)"""
+    if a == 0 or b == 0:
+        return 0
+    return GF_EXP[GF_LOG[a] + GF_LOG[b]]
+
+@lru_cache(maxsize=None)
+def generator_poly(ecc_count: int) -> Tuple[int, ...]:
+    """
+    Твірний поліном (x - a^0)(x - a^1)...(x - a^(n-1))
+    
+    Args:
+        ecc_count: Кількість кодових слів корекції
+    
+    Returns:
+        Коефіцієнти від старшого степеня (перший завжди 1)
+    """
+    poly = [1]
+    for i in range(ecc_count):
+        factor = GF_EXP[i]
+        poly = [a ^ gf_mul(b, factor) for a, b in zip(poly + [0], [0] + poly)]
+    return tuple(poly)
+
+@lru_cache(maxsize=None)
+def _feedback_rows(ecc_count: int) -> Tuple[Tuple[int, ...], ...]:
+    """Добутки кожного байта зворотного зв'язку на коефіцієнти твірного полінома"""
+    poly = generator_poly(ecc_count)[1:]
+    return tuple(tuple(gf_mul(feedback, c) for c in poly) for feedback in range(256))
+
+@lru_cache(maxsize=None)
+def _feedback_table(ecc_count: int) -> 'np.ndarray':
+    """Те саме, що _feedback_rows, у вигляді масиву (256, ecc_count)"""
+    return np.array(_feedback_rows(ecc_count), dtype=np.uint8)
+
+def ecc_codewords(block: Sequence[int], ecc_count: int) -> List[int]:
+    """
+    Кодові слова корекції для одного блоку даних
+    
+    Args:
+        block: Кодові слова даних блоку
+        ecc_count: Кількість кодових слів корекції
+    
+    Returns:
+        Остача від ділення на твірний поліном
+    """
+    rows = _feedback_rows(ecc_count)
+    register = [0] * ecc_count
+    for value in block:
+        row = rows[value ^ register[0]]
+        register = [a ^ b for a, b in zip(register[1:] + [0], row)]
+    return register
+
+def ecc_batch(blocks: 'np.ndarray', ecc_count: int) -> 'np.ndarray':
+    """
+    Кодові слова корекції для багатьох блоків однакової довжини одночасно
+    
+    Цикл Python проходить лише по позиціях блоку (не більше 153), а кожен
+    крок обробляє всі блоки пакету однією операцією над масивом.
+    
+    Args:
+        blocks: Масив uint8 форми (кількість блоків, довжина блоку)
+        ecc_count: Кількість кодових слів корекції
+    
+    Returns:
+        Масив uint8 форми (кількість блоків, ecc_count)
+    """
+    table = _feedback_table(ecc_count)
+    register = np.zeros((blocks.shape[0], ecc_count), dtype=np.uint8)
+    for column in blocks.T:
+        feedback = column ^ register[:, 0]
+        register[:, :-1] = register[:, 1:]
+        register[:, -1] = 0
+        register ^= table[feedback]
+    return register
+
+class _BitWriter:
+    """Бітовий буфер на цілому числі Python (сумісний з QRData.write)"""
+    
+    __slots__ = ('value', 'length')
+    
+    def __init__(self):
+        self.value = 0
+        self.length = 0
+    
+    def put(self, num: int, length: int):
+        self.value = (self.value << length) | (num & ((1 << length) - 1))
+        self.length += length
+    
+    def __len__(self) -> int:
+        return self.length
+
+def data_codewords(version: int, error_correction: int, data_list) -> List[int]:
+    """
+    Кодові слова даних: сегменти, термінатор і доповнення до ємності версії
+    
+    Args:
+        version: Версія QR-коду
+        error_correction: Константа рівня корекції qrcode (ERROR_CORRECT_*)
+        data_list: Сегменти qrcode.util.QRData
+    
+    Returns:
+        Список кодових слів даних довжиною, що дорівнює ємності версії
+    
+    Raises:
+        DataOverflowError: Сегменти не вміщуються у версію
+    """
+    buffer = _BitWriter()
+    for data in data_list:
+        buffer.put(data.mode, 4)
+        buffer.put(len(data), util.length_in_bits(data.mode, version))
+        data.write(buffer)
+    
+    bit_limit = util.BIT_LIMIT_TABLE[error_correction][version]
+    if len(buffer) > bit_limit:
+        from qrcode.exceptions import DataOverflowError
+        raise DataOverflowError(
+            f"Code length overflow. Data size ({len(buffer)}) > size available ({bit_limit})"
+        )
+    
+    # Термінатор (до 4 нульових бітів) і вирівнювання до байта
+    length = len(buffer) + min(bit_limit - len(buffer), 4)
+    length += -length % 8
+    codewords = list((buffer.value << (length - len(buffer))).to_bytes(length // 8, 'big'))
+    
+    # Почергові байти доповнення
+    pads = (util.PAD0, util.PAD1)
+    codewords.extend(pads[i % 2] for i in range(bit_limit // 8 - len(codewords)))
+    return codewords
+
+def _split_blocks(version: int, error_correction: int,
+                  codewords: Sequence[int]) -> List[Tuple[Sequence[int], int]]:
+    """Розбиття кодових слів даних на блоки: (дані блоку, кількість слів корекції)"""
+    blocks = []
+    offset = 0
+    for rs_block in base.rs_blocks(version, error_correction):
+        data_count = rs_block.data_count
+        blocks.append((codewords[offset:offset + data_count],
+                       rs_block.total_count - data_count))
+        offset += data_count
+    return blocks
+
+def _interleave(data_blocks: Sequence[Sequence[int]],
+                ecc_blocks: Sequence[Sequence[int]]) -> List[int]:
+    """Перемежування блоків даних, а потім блоків корекції"""
+    result = []
+    for blocks in (data_blocks, ecc_blocks):
+        longest = max(len(block) for block in blocks)
+        for i in range(longest):
+            result.extend(block[i] for block in blocks if i < len(block))
+    return result
+
+def create_data(version: int, error_correction: int, data_list) -> List[int]:
+    """
+    Повний потік кодових слів символу (заміна qrcode.util.create_data)
+    
+    Args:
+        version: Версія QR-коду
+        error_correction: Константа рівня корекції qrcode (ERROR_CORRECT_*)
+        data_list: Сегменти qrcode.util.QRData
+    
+    Returns:
+        Перемежовані кодові слова даних і корекції
+    """
+    blocks = _split_blocks(version, error_correction,
+                           data_codewords(version, error_correction, data_list))
+    return _interleave([block for block, _ in blocks],
+                       [ecc_codewords(block, ecc_count) for block, ecc_count in blocks])
+
+def create_data_batch(version: int, error_correction: int, data_lists) -> List[List[int]]:
+    """
+    Потоки кодових слів для багатьох символів однієї версії
+    
+    Блоки всіх символів групуються за довжиною, і корекція для кожної
+    групи обчислюється одним викликом ecc_batch. Без NumPy блоки
+    обробляються по одному.
+    
+    Args:
+        version: Версія всіх символів
+        error_correction: Константа рівня корекції qrcode (ERROR_CORRECT_*)
+        data_lists: Сегменти кожного символу
+    
+    Returns:
+        Список потоків кодових слів у порядку data_lists
+    """
+    symbols = [_split_blocks(version, error_correction,
+                             data_codewords(version, error_correction, data_list))
+               for data_list in data_lists]
+    if not symbols:
+        return []
+    if np is None:
+        return [_interleave([block for block, _ in blocks],
+                            [ecc_codewords(block, ecc_count) for block, ecc_count in blocks])
+                for blocks in symbols]
+    
+    # У версії не більше двох різних довжин блоків; корекція однакова для всіх
+    ecc_count = symbols[0][0][1]
+    lengths = sorted({len(block) for block, _ in symbols[0]})
+    ecc_by_length = {}
+    for length in lengths:
+        group = np.array([block for blocks in symbols for block, _ in blocks
+                          if len(block) == length], dtype=np.uint8)
+        ecc_by_length[length] = iter(ecc_batch(group, ecc_count).tolist())
+    
+    return [_interleave([block for block, _ in blocks],
+                        [next(ecc_by_length[len(block)]) for block, _ in blocks])
+            for blocks in symbols]
\ No newline at end of file
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Оптимальне розбиття даних на сегменти QR-коду
+
+qrcode виділяє цифровий чи алфавітно-цифровий сегмент лише для довгих
+(від 20 символів) однорідних ділянок, а решту кодує байтами. Тут розбиття
+на цифрові, алфавітно-цифрові та байтові сегменти обирається динамічним
+програмуванням за мінімальною довжиною у бітах з урахуванням заголовків
+сегментів (режим і поле довжини), тож URL з числовими ідентифікаторами,
+номери телефонів і vCard часто вміщуються у меншу версію.
+
+Довжина поля лічильника залежить від групи версій (1-9, 10-26, 27-40),
+тому розбиття обчислюється для групи, у якій шукається версія.
+"""
+
+from typing import List, Optional, Tuple
+
+from qrcode import util
+from qrcode.exceptions import DataOverflowError
+
+# Режими у порядку розрахунку
+MODES = (util.MODE_NUMBER, util.MODE_ALPHA_NUM, util.MODE_8BIT_BYTE)
+
+# Групи версій з однаковою довжиною поля лічильника: (перша, остання)
+VERSION_GROUPS = ((1, 9), (10, 26), (27, 40))
+
+# Символи, допустимі у цифровому та алфавітно-цифровому режимах
+_NUMERIC = frozenset('0123456789')
+_ALPHANUMERIC = frozenset(util.ALPHA_NUM.decode('ascii'))
+
+# Вартість символу в шостих частках біта: цифра - 10/3 біта, символ
+# алфавітно-цифрового режиму - 5.5 біта; байт - 8 бітів
+_NUMERIC_COST = 20
+_ALPHANUMERIC_COST = 33
+_BYTE_COST = 48
+
+def _ceil_bits(cost: int) -> int:
+    """Округлення вартості у шостих частках біта вгору до цілого біта (у тих же одиницях)"""
+    return (cost + 5) // 6 * 6
+
+def _char_modes(text: str, version: int) -> Tuple[List[int], int]:
+    """
+    Оптимальний режим кожного символу для версії
+    
+    Returns:
+        Кортеж (режим кожного символу, загальна довжина у бітах)
+    """
+    head_costs = [(4 + util.length_in_bits(mode, version)) * 6 for mode in MODES]
+    costs = list(head_costs)
+    char_modes = []
+    
+    for char in text:
+        current = [None, None, None]
+        step = [None, None, None]
+        
+        # Продовження поточного сегмента
+        if char in _NUMERIC:
+            current[0] = costs[0] + _NUMERIC_COST
+            step[0] = 0
+        if char in _ALPHANUMERIC:
+            current[1] = costs[1] + _ALPHANUMERIC_COST
+            step[1] = 1
+        current[2] = costs[2] + _BYTE_COST * len(char.encode('utf-8'))
+        step[2] = 2
+        
+        # Завершення сегмента на цьому символі і початок нового
+        for target in range(3):
+            for source in range(3):
+                if current[source] is None:
+                    continue
+                cost = _ceil_bits(current[source]) + head_costs[target]
+                if current[target] is None or cost < current[target]:
+                    current[target] = cost
+                    step[target] = source
+        
+        char_modes.append(step)
+        costs = current
+    
+    # Відновлення режимів з кінця
+    best = min(range(3), key=lambda mode: _ceil_bits(costs[mode]))
+    total_bits = _ceil_bits(costs[best]) // 6
+    modes = [0] * len(text)
+    state = best
+    for index in range(len(text) - 1, -1, -1):
+        state = char_modes[index][state]
+        modes[index] = state
+    
+    return modes, total_bits
+
+# Ділянка тексту одного режиму: (початок, кінець, індекс режиму в MODES)
+SegmentRun = Tuple[int, int, int]
+
+def segment_runs(text: str, version: int) -> Tuple[List[SegmentRun], int]:
+    """
+    Оптимальні ділянки режимів для тексту
+    
+    Args:
+        text: Непорожній рядок для кодування
+        version: Будь-яка версія з групи, для якої обчислюється розбиття
+    
+    Returns:
+        Кортеж (ділянки, довжина потоку у бітах)
+    """
+    modes, total_bits = _char_modes(text, version)
+    
+    runs = []
+    start = 0
+    for index in range(1, len(text) + 1):
+        if index == len(text) or modes[index] != modes[start]:
+            runs.append((start, index, modes[start]))
+            start = index
+    
+    return runs, total_bits
+
+def segments_from_runs(text: str, runs: List[SegmentRun]) -> Optional[List[util.QRData]]:
+    """
+    Сегменти тексту за готовими ділянками режимів
+    
+    Дозволяє повторно використати розбиття, обчислене для іншого рядка
+    тієї ж структури (наприклад, серійних номерів зі спільним префіксом).
+    
+    Args:
+        text: Рядок для кодування
+        runs: Ділянки з segment_runs
+    
+    Returns:
+        Сегменти або None, якщо текст не відповідає ділянкам
+    """
+    if not runs or runs[-1][1] != len(text):
+        return None
+    
+    segments = []
+    for start, end, mode in runs:
+        chunk = text[start:end]
+        if mode == 0 and not (chunk.isascii() and chunk.isdigit()):
+            return None
+        if mode == 1 and not _ALPHANUMERIC.issuperset(chunk):
+            return None
+        segments.append(util.QRData(chunk.encode('utf-8'), mode=MODES[mode], check_data=False))
+    
+    return segments
+
+def optimal_segments(text: str, version: int) -> Tuple[List[util.QRData], int]:
+    """
+    Розбиття тексту на сегменти з мінімальною довжиною у бітах
+    
+    Args:
+        text: Рядок для кодування
+        version: Будь-яка версія з групи, для якої обчислюється розбиття
+    
+    Returns:
+        Кортеж (сегменти qrcode.util.QRData, довжина потоку у бітах)
+    """
+    if not text:
+        return [util.QRData(b'', mode=util.MODE_8BIT_BYTE)], 4 + util.length_in_bits(
+            util.MODE_8BIT_BYTE, version)
+    
+    runs, total_bits = segment_runs(text, version)
+    return segments_from_runs(text, runs), total_bits
+
+def fit_segments(text: str, error_correction: int,
+                 min_version: int = 1) -> Tuple[int, List[util.QRData]]:
+    """
+    Найменша версія, у яку вміщується оптимально розбитий текст
+    
+    Args:
+        text: Рядок для кодування
+        error_correction: Константа рівня корекції qrcode (ERROR_CORRECT_*)
+        min_version: Найменша допустима версія
+    
+    Returns:
+        Кортеж (версія, сегменти)
+    
+    Raises:
+        DataOverflowError: Дані не вміщуються у версію 40
+    """
+    limits = util.BIT_LIMIT_TABLE[error_correction]
+    for first, last in VERSION_GROUPS:
+        if last < min_version:
+            continue
+        segments, bits = optimal_segments(text, last)
+        for version in range(max(first, min_version), last + 1):
+            if bits <= limits[version]:
+                return version, segments
+    
+    raise DataOverflowError(f"Дані не вміщуються у QR-код версії 40 ({bits} бітів)")
+
+def stream_bits(data_list, version: int) -> int:
+    """
+    Довжина потоку сегментів у бітах для версії (без термінатора)
+    
+    Args:
+        data_list: Сегменти qrcode.util.QRData
+        version: Версія QR-коду
+    
+    Returns:
+        Кількість бітів
+    """
+    bits = 0
+    for data in data_list:
+        count = len(data)
+        bits += 4 + util.length_in_bits(data.mode, version)
+        if data.mode == util.MODE_NUMBER:
+            bits += count // 3 * 10 + (0, 4, 7)[count % 3]
+        elif data.mode == util.MODE_ALPHA_NUM:
+            bits += count // 2 * 11 + count % 2 * 6
+        else:
+            bits += count * 8
+    return bits
+
+def ensure_fits(data_list, error_correction: int, version: int):
+    """
+    Перевірка, що сегменти вміщуються у зафіксовану версію
+    
+    Args:
+        data_list: Сегменти qrcode.util.QRData
+        error_correction: Константа рівня корекції qrcode (ERROR_CORRECT_*)
+        version: Версія QR-коду
+    
+    Raises:
+        DataOverflowError: Дані не вміщуються у версію
+    """
+    bits = stream_bits(data_list, version)
+    limit = util.BIT_LIMIT_TABLE[error_correction][version]
+    if bits > limit:
+        raise DataOverflowError(
+            f"Дані не вміщуються у QR-код версії {version} ({bits} бітів з {limit})"
+        )
+
+def fixed_segments(text: str, error_correction: int, version: int) -> List[util.QRData]:
+    """
+    Оптимальне розбиття для зафіксованої версії без підбору
+    
+    Args:
+        text: Рядок для кодування
+        error_correction: Константа рівня корекції qrcode (ERROR_CORRECT_*)
+        version: Версія QR-коду
+    
+    Returns:
+        Сегменти qrcode.util.QRData
+    
+    Raises:
+        DataOverflowError: Дані не вміщуються у версію
+    """
+    limit = util.BIT_LIMIT_TABLE[error_correction][version]
+    
+    # Кожен символ займає не менше 10/3 біта, тож явне переповнення
+    # відкидається ще до динамічного програмування
+    least_bits = len(text) * _NUMERIC_COST // 6
+    if least_bits > limit:
+        raise DataOverflowError(
+            f"Дані не вміщуються у QR-код версії {version} (щонайменше {least_bits} бітів з {limit})"
+        )
+    
+    segments, bits = optimal_segments(text, version)
+    if bits > limit:
+        raise DataOverflowError(
+            f"Дані не вміщуються у QR-код версії {version} ({bits} бітів з {limit})"
+        )
+    return segments
\ No newline at end of file
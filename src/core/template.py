@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Шаблон символу для масової генерації QR-кодів фіксованої геометрії
+
+Квитки, етикетки і серійні номери - це мільйони символів однієї версії,
+що відрізняються лише даними. Шаблон один раз будує шар функціональних
+зразків разом з полями формату і версії для заданих версії, рівня
+корекції та маски, а також порядок розміщення бітів і значення маски
+у клітинках даних. Для кожного символу лишається обчислити кодові слова
+і записати біти даних у копію шару.
+
+Кодові слова пакету символів обчислюються разом: корекція - одним
+викликом reed_solomon.ecc_batch на групу блоків, перемежування і
+розміщення - індексуванням масивів за перестановками, обчисленими
+при створенні шаблону.
+
+Розбиття на сегменти обчислюється для першого рядка і повторно
+використовується, поки наступні рядки мають ту саму структуру (спільний
+префікс і цифри на тих самих позиціях). Символ при цьому коректний, хоча
+його кодові слова можуть відрізнятися від результату QREngine.
+"""
+
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from qrcode import base
+from qrcode.exceptions import DataOverflowError
+
+from .cache import EncodedMatrix
+from .matrix import ModuleMatrix
+from .engine import ERROR_CORRECTION_LEVELS
+from .numpy_encoder import MASK_COUNT, NUMPY_AVAILABLE, np
+from . import numpy_encoder, reed_solomon, segments
+
+# Кількість символів, що кодуються разом у generate
+DEFAULT_CHUNK_SIZE = 1024
+
+class SymbolTemplate:
+    """Попередньо обчислена розмітка символу для фіксованих версії, корекції і маски"""
+    
+    def __init__(self, version: int, error_correction: str = 'M', mask: int = 0):
+        """
+        Args:
+            version: Версія QR-коду (1-40)
+            error_correction: Рівень корекції помилок (L, M, Q, H)
+            mask: Номер маски (0-7)
+        
+        Raises:
+            ValueError: Невірні параметри або не встановлено numpy
+        """
+        if not NUMPY_AVAILABLE:
+            raise ValueError("Шаблон символу потребує встановленого пакета numpy")
+        if not 1 <= version <= 40:
+            raise ValueError(f"Версія повинна бути від 1 до 40: {version}")
+        if error_correction not in ERROR_CORRECTION_LEVELS:
+            raise ValueError(f"Невідомий рівень корекції помилок: {error_correction}")
+        if not 0 <= mask < MASK_COUNT:
+            raise ValueError(f"Маска повинна бути від 0 до {MASK_COUNT - 1}: {mask}")
+        
+        self.version = version
+        self.error_correction = error_correction
+        self.mask = mask
+        self._level = ERROR_CORRECTION_LEVELS[error_correction]
+        
+        # Шар функціональних зразків з полями формату і версії
+        layout = numpy_encoder.version_layout(version)
+        self.size = layout.size
+        self.base = layout.template.copy()
+        numpy_encoder._place_type_info(self.base, layout, version, self._level, mask)
+        self.base.setflags(write=False)
+        
+        # Плоскі індекси клітинок даних у порядку розміщення і значення маски в них
+        self._cells = layout.data_rows * self.size + layout.data_cols
+        self._mask_bits = layout.data_masks[mask]
+        
+        # Блоки: (зміщення в кодових словах даних, довжина блоку)
+        self._blocks = []
+        offset = 0
+        for rs_block in base.rs_blocks(version, self._level):
+            self._blocks.append((offset, rs_block.data_count))
+            offset += rs_block.data_count
+        self._data_count = offset
+        self._ecc_count = rs_block.total_count - rs_block.data_count
+        
+        # Перестановка, що перемежовує блоки даних і корекції
+        data_blocks = [list(range(start, start + length)) for start, length in self._blocks]
+        ecc_blocks = [list(range(offset + i * self._ecc_count, offset + (i + 1) * self._ecc_count))
+                      for i in range(len(self._blocks))]
+        self._order = np.array(reed_solomon._interleave(data_blocks, ecc_blocks), dtype=np.intp)
+        
+        # Розбиття попереднього рядка на сегменти, яке пробується першим
+        self._runs: List[segments.SegmentRun] = []
+    
+    @classmethod
+    def for_payload(cls, sample: str, error_correction: str = 'M',
+                    mask: Optional[int] = None,
+                    version: Optional[int] = None) -> 'SymbolTemplate':
+        """
+        Шаблон найменшої версії, у яку вміщується зразок даних
+        
+        Args:
+            sample: Типовий рядок пакету (наприклад, перший серійний номер)
+            error_correction: Рівень корекції помилок (L, M, Q, H)
+            mask: Номер маски; None - маска з найменшим штрафом для зразка
+            version: Зафіксована версія; None - найменша, що вміщує зразок
+        
+        Returns:
+            Новий шаблон
+        
+        Raises:
+            DataOverflowError: Зразок не вміщується у зафіксовану версію
+        """
+        level = ERROR_CORRECTION_LEVELS.get(error_correction)
+        if level is None:
+            raise ValueError(f"Невідомий рівень корекції помилок: {error_correction}")
+        
+        if version is None:
+            version, data_list = segments.fit_segments(sample, level)
+        else:
+            data_list = segments.fixed_segments(sample, level, version)
+        template = cls(version, error_correction, 0 if mask is None else mask)
+        if mask is None:
+            data = reed_solomon.create_data(version, level, data_list)
+            _, mask = numpy_encoder.build_matrix(version, level, data)
+            if mask != template.mask:
+                template = cls(version, error_correction, mask)
+        return template
+    
+    def _data_codewords(self, payload: str) -> List[int]:
+        """Кодові слова даних одного рядка з повторним використанням розбиття"""
+        data_list = segments.segments_from_runs(payload, self._runs)
+        if data_list is not None:
+            try:
+                return reed_solomon.data_codewords(self.version, self._level, data_list)
+            except DataOverflowError:
+                pass
+        
+        data_list = segments.fixed_segments(payload, self._level, self.version)
+        if payload:
+            self._runs, _ = segments.segment_runs(payload, self.version)
+        return reed_solomon.data_codewords(self.version, self._level, data_list)
+    
+    def codewords(self, payloads: Sequence[str]) -> 'np.ndarray':
+        """
+        Перемежовані кодові слова даних і корекції для пакету рядків
+        
+        Args:
+            payloads: Рядки для кодування
+        
+        Returns:
+            Масив uint8 форми (len(payloads), кількість кодових слів)
+        
+        Raises:
+            DataOverflowError: Рядок не вміщується у версію шаблону
+        """
+        data = np.array([self._data_codewords(payload) for payload in payloads],
+                        dtype=np.uint8).reshape(len(payloads), self._data_count)
+        
+        # Блоки однакової довжини всіх символів обробляються одним викликом
+        ecc = np.empty((len(payloads), len(self._blocks), self._ecc_count), dtype=np.uint8)
+        for length in {length for _, length in self._blocks}:
+            indices = [i for i, (_, block_length) in enumerate(self._blocks)
+                       if block_length == length]
+            group = np.stack([data[:, start:start + length]
+                              for start, _ in (self._blocks[i] for i in indices)], axis=1)
+            ecc[:, indices] = reed_solomon.ecc_batch(
+                group.reshape(-1, length), self._ecc_count
+            ).reshape(len(payloads), len(indices), self._ecc_count)
+        
+        stream = np.concatenate((data, ecc.reshape(len(payloads), -1)), axis=1)
+        return stream[:, self._order]
+    
+    def fill(self, payloads: Sequence[str]) -> 'np.ndarray':
+        """
+        Матриці модулів для пакету рядків
+        
+        Args:
+            payloads: Рядки для кодування
+        
+        Returns:
+            Булевий масив форми (len(payloads), n, n) без границі
+        """
+        bits = np.unpackbits(self.codewords(payloads), axis=1)
+        
+        # Залишкові біти після кодових слів нульові (але теж маскуються)
+        cell_count = len(self._cells)
+        values = np.zeros((len(payloads), cell_count), dtype=bool)
+        values[:, :bits.shape[1]] = bits[:, :cell_count]
+        values ^= self._mask_bits
+        
+        matrices = np.repeat(self.base.reshape(1, -1), len(payloads), axis=0)
+        matrices[:, self._cells] = values
+        return matrices.reshape(len(payloads), self.size, self.size)
+    
+    def generate(self, payloads: Iterable[str],
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator['np.ndarray']:
+        """
+        Потокова генерація матриць з будь-якого ітерованого джерела
+        
+        Рядки читаються блоками по chunk_size, тож пам'ять не залежить від
+        кількості символів. Кожна видана матриця - окремий масив (n, n),
+        який можна зберігати без копіювання.
+        
+        Args:
+            payloads: Рядки для кодування (наприклад, serial_payloads)
+            chunk_size: Кількість символів, що кодуються разом
+        
+        Yields:
+            Булеві матриці n x n без границі
+        """
+        chunk = []
+        for payload in payloads:
+            chunk.append(payload)
+            if len(chunk) >= chunk_size:
+                yield from self.fill(chunk)
+                chunk = []
+        if chunk:
+            yield from self.fill(chunk)
+    
+    def encode_matrix(self, payload: str) -> EncodedMatrix:
+        """Кодування одного рядка у формат кешу рушія"""
+        return self.encode_matrices([payload])[0]
+    
+    def encode_matrices(self, payloads: Sequence[str]) -> List[EncodedMatrix]:
+        """Кодування пакету рядків у формат кешу рушія"""
+        if not payloads:
+            return []
+        packed = np.packbits(self.fill(payloads), axis=2)
+        return [EncodedMatrix(matrix=ModuleMatrix(self.size, rows.tobytes()),
+                              version=self.version, mask=self.mask)
+                for rows in packed]
+
+def serial_payloads(pattern: str, start: int = 0, count: int = 1,
+                    step: int = 1) -> Iterator[str]:
+    """
+    Рядки із серійними номерами за шаблоном форматування
+    
+    Args:
+        pattern: Шаблон str.format з одним полем, наприклад 'TICKET-2024-{:09d}'
+        start: Перший номер
+        count: Кількість номерів
+        step: Крок між номерами
+    
+    Yields:
+        Відформатовані рядки
+    """
+    for number in range(start, start + count * step, step):
+        yield pattern.format(number)
\ No newline at end of file
@@ -1,7 +1,15 @@
 """
 Модуль дизайну та експорту
+
+Експортери завантажуються при першому зверненні.
 """
 
-from .export import QRExporter, QRStyler
+_EXPORT_NAMES = ('QRExporter', 'QRStyler')
+
+def __getattr__(name):
+    if name in _EXPORT_NAMES:
+        from . import export
+        return getattr(export, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = ['QRExporter', 'QRStyler']
\ No newline at end of file
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Модуль роботи з кольорами QR-кодів
+"""
+
+from typing import List, Tuple, Optional
+from PIL import Image, ImageChops
+
+def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    """
+    Конвертація кольору з формату #RRGGBB у кортеж RGB
+    
+    Args:
+        hex_color: Колір у форматі #RRGGBB
+    
+    Returns:
+        Кортеж (R, G, B)
+    """
+    return tuple(int(hex_color[i:i+2], 16) for i in (1, 3, 5))
+
+def _band_lut(dark_value: int, light_value: int) -> List[int]:
+    """
+    Таблиця перетворення одного каналу: 0 -> колір модуля, 255 -> колір фону,
+    проміжні значення залишаються без змін
+    """
+    lut = list(range(256))
+    lut[0] = dark_value
+    lut[255] = light_value
+    return lut
+
+# Маски чисто чорних та чисто білих пікселів
+_BLACK_MASK_LUT = [255] + [0] * 255
+_WHITE_MASK_LUT = [0] * 255 + [255]
+
+# Альфа прозорого фону: лише чисто білі пікселі прозорі
+_ALPHA_LUT = [255] * 255 + [0]
+
+def apply_colors(qr_image: Image.Image, fg_color: str = "#000000",
+                 bg_color: Optional[str] = "#FFFFFF",
+                 transparent_bg: bool = False) -> Image.Image:
+    """
+    Перефарбування чорно-білого QR-коду у вибрані кольори
+    
+    Чорні пікселі замінюються кольором модулів, білі - кольором фону
+    (або прозорістю), решта залишаються без змін. Перетворення виконується
+    таблицями PIL за один прохід по кожному каналу, без циклу по пікселях.
+    
+    Args:
+        qr_image: Базове чорно-біле зображення QR-коду
+        fg_color: Колір модулів
+        bg_color: Колір фону
+        transparent_bg: Чи робити фон прозорим
+    
+    Returns:
+        Нове стилізоване зображення
+    """
+    if fg_color == "#000000" and bg_color == "#FFFFFF" and not transparent_bg:
+        return qr_image.copy()
+    
+    fg_rgb = hex_to_rgb(fg_color)
+    bg_rgb = (255, 255, 255) if transparent_bg else hex_to_rgb(bg_color)
+    
+    if qr_image.mode in ('1', 'L'):
+        # Відтінки сірого: по одній таблиці на канал
+        gray = qr_image.convert('L')
+        bands = [gray.point(_band_lut(fg_rgb[i], bg_rgb[i])) for i in range(3)]
+        
+        if not transparent_bg:
+            return Image.merge('RGB', bands)
+        
+        alpha = gray.point(_ALPHA_LUT)
+        return Image.merge('RGBA', bands + [alpha])
+    
+    # Кольорові зображення: маски чисто чорних та чисто білих пікселів
+    styled_image = qr_image.convert('RGBA')
+    red, green, blue, _ = styled_image.split()
+    
+    black_mask = ImageChops.lighter(ImageChops.lighter(red, green), blue).point(_BLACK_MASK_LUT)
+    white_mask = ImageChops.darker(ImageChops.darker(red, green), blue).point(_WHITE_MASK_LUT)
+    
+    styled_image.paste(fg_rgb + (255,), mask=black_mask)
+    styled_image.paste(bg_rgb + (0 if transparent_bg else 255,), mask=white_mask)
+    
+    # Конвертація назад в RGB якщо фон не прозорий
+    if not transparent_bg:
+        styled_image = styled_image.convert('RGB')
+    
+    return styled_image
\ No newline at end of file
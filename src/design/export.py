@@ -4,103 +4,303 @@
 Модуль експорту QR-кодів у різні формати
 """
 
+import io
 import os
-from typing import Dict, Any
+from contextlib import contextmanager
+from typing import (Dict, Any, BinaryIO, Callable, Iterator, List, Optional, Sequence,
+                    Union, TYPE_CHECKING)
 from PIL import Image
 
-# Спроба імпорту для SVG
-try:
-    import svgwrite
-    SVG_AVAILABLE = True
-except ImportError:
-    SVG_AVAILABLE = False
+from .colors import hex_to_rgb
+from .png_writer import iter_png
+from .svg_writer import iter_svg
+from ..core.pixels import PixelBuffer, render_pixels
+from ..core.raster import render_matrix
+
+if TYPE_CHECKING:
+    from ..core.engine import QRResult
+    from ..core.matrix import ModuleMatrix
+
+# Розмір фрагмента для iter_bytes
+CHUNK_SIZE = 64 * 1024
+
+# Ціль експорту: шлях до файлу або двійковий потік з методом write
+ExportTarget = Union[str, 'os.PathLike', BinaryIO]
+
+@contextmanager
+def open_target(target: ExportTarget) -> Iterator[BinaryIO]:
+    """
+    Двійковий потік для запису експорту
+    
+    Шлях відкривається і закривається тут; переданий потік лише
+    використовується і залишається відкритим для викликача.
+    """
+    if hasattr(target, 'write'):
+        yield target
+    else:
+        with open(target, 'wb') as stream:
+            yield stream
 
 class QRExporter:
-    """Клас для експорту QR-кодів у різні формати"""
+    """
+    Клас для експорту QR-кодів у різні формати
+    
+    Кожен формат записується у двійковий потік, тому ціллю може бути
+    шлях до файлу, будь-який об'єкт з методом write (BytesIO, відповідь
+    сервера, запис ZipFile.open(..., 'w')) або результат у вигляді bytes.
+    Дані надходять у потік фрагментами по мірі кодування.
+    """
     
     def __init__(self):
-        self.supported_formats = ['png', 'jpg', 'jpeg']
-        if SVG_AVAILABLE:
-            self.supported_formats.append('svg')
+        self.supported_formats = ['png', 'jpg', 'jpeg', 'svg']
+        # Растрові формати: запис готового зображення у потік
+        self.raster_writers: Dict[str, Callable[[Image.Image, BinaryIO, Dict[str, Any]], None]] = {
+            'png': self._export_png,
+            'jpg': self._export_jpg,
+            'jpeg': self._export_jpg
+        }
     
-    def export_qr(self, qr_image: Image.Image, filepath: str, settings: Dict[str, Any]) -> bool:
+    def export_qr(self, qr_result: 'QRResult', target: ExportTarget, settings: Dict[str, Any],
+                  format_name: Optional[str] = None) -> bool:
         """
         Експорт QR-коду з налаштуваннями дизайну
         
         Args:
-            qr_image: Базове зображення QR-коду
-            filepath: Шлях для збереження
+            qr_result: Результат генерації з матрицею модулів
+            target: Шлях для збереження або двійковий потік
             settings: Налаштування дизайну
-            
+            format_name: Формат (png, jpg, jpeg, svg); за замовчуванням
+                визначається з розширення шляху або імені потоку, тому для
+                потоку без імені (io.BytesIO) його потрібно вказати
+        
         Returns:
             True якщо експорт успішний
         """
         try:
-            # Визначення формату з розширення файлу
-            format_ext = os.path.splitext(filepath)[1].lower().lstrip('.')
+            format_ext = self._resolve_format(target, format_name)
             
             if format_ext not in self.supported_formats:
                 print(f"Непідтримуваний формат: {format_ext}")
                 return False
             
-            # Створення стилізованого зображення
-            styled_image = self._apply_styling(qr_image, settings)
-            
-            # Визначення розміру
-            target_size = self._get_target_size(settings)
-            if target_size != styled_image.size:
-                styled_image = styled_image.resize(target_size, Image.Resampling.LANCZOS)
-            
-            # Експорт у відповідному форматі
+            # Векторний формат малюється з матриці, растр не потрібен
             if format_ext == 'svg':
-                return self._export_svg(filepath, qr_image, settings)
-            elif format_ext in ['jpg', 'jpeg']:
-                return self._export_jpg(styled_image, filepath, settings)
-            elif format_ext == 'png':
-                return self._export_png(styled_image, filepath, settings)
+                return self._export_svg(target, qr_result.matrix, settings)
             
-            return False
+            # Двоколірний PNG пишеться з 1-бітних пікселів матриці
+            if format_ext == 'png':
+                return self._export_png_matrix(target, qr_result.matrix, settings)
             
+            styled_image = self.render_image(qr_result, settings)
+            return self.export_image(styled_image, target, settings, format_ext)
+        
         except Exception as e:
             print(f"Помилка експорту: {e}")
             return False
     
-    def _apply_styling(self, qr_image: Image.Image, settings: Dict[str, Any]) -> Image.Image:
-        """Застосування стилізації до QR-коду"""
-        styled_image = qr_image.copy()
-        
-        fg_color = settings.get('fg_color', '#000000')
-        bg_color = settings.get('bg_color', '#FFFFFF')
-        transparent_bg = settings.get('transparent_bg', False)
-        
-        # Застосування кольорів
-        if fg_color != "#000000" or bg_color != "#FFFFFF" or transparent_bg:
-            styled_image = styled_image.convert("RGBA")
-            data = styled_image.getdata()
-            
-            new_data = []
-            for item in data:
-                # Заміна чорного на вибраний колір переднього плану
-                if item[:3] == (0, 0, 0):  # чорний піксель
-                    rgb = tuple(int(fg_color[i:i+2], 16) for i in (1, 3, 5))
-                    new_data.append(rgb + (255,))
-                # Заміна білого на колір фону або прозорий
-                elif item[:3] == (255, 255, 255):  # білий піксель
-                    if transparent_bg:
-                        new_data.append((255, 255, 255, 0))  # прозорий
-                    else:
-                        rgb = tuple(int(bg_color[i:i+2], 16) for i in (1, 3, 5))
-                        new_data.append(rgb + (255,))
-                else:
-                    new_data.append(item)
-            
-            styled_image.putdata(new_data)
-            
-            # Конвертація назад в RGB якщо фон не прозорий
-            if not transparent_bg:
-                styled_image = styled_image.convert("RGB")
+    def export_bytes(self, qr_result: 'QRResult', settings: Dict[str, Any],
+                     format_name: str = 'png') -> Optional[bytes]:
+        """
+        Експорт QR-коду у пам'ять
+        
+        Args:
+            qr_result: Результат генерації з матрицею модулів
+            settings: Налаштування дизайну
+            format_name: Формат (png, jpg, jpeg, svg)
+        
+        Returns:
+            Вміст файлу або None у разі помилки
+        """
+        buffer = io.BytesIO()
+        if not self.export_qr(qr_result, buffer, settings, format_name):
+            return None
+        return buffer.getvalue()
+    
+    def iter_bytes(self, qr_result: 'QRResult', settings: Dict[str, Any],
+                   format_name: str = 'png', chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Експорт QR-коду фрагментами для потокової передачі
+        
+        SVG і PNG кодуються по мірі генерації і не збираються в пам'яті
+        цілком. JPG PIL кодує за один виклик, тому він віддається
+        фрагментами вже закодованого файлу.
+        
+        Args:
+            qr_result: Результат генерації з матрицею модулів
+            settings: Налаштування дизайну
+            format_name: Формат (png, jpg, jpeg, svg)
+            chunk_size: Орієнтовний розмір фрагмента у байтах
+        
+        Yields:
+            Фрагменти файлу
+        
+        Raises:
+            ValueError: Непідтримуваний формат або помилка експорту
+        """
+        format_ext = format_name.lower()
+        if format_ext not in self.supported_formats:
+            raise ValueError(f"Непідтримуваний формат: {format_ext}")
+        
+        if format_ext == 'svg':
+            parts = []
+            pending = 0
+            for text in iter_svg(qr_result.matrix, **self._svg_options(settings)):
+                data = text.encode('utf-8')
+                parts.append(data)
+                pending += len(data)
+                if pending >= chunk_size:
+                    yield b''.join(parts)
+                    parts = []
+                    pending = 0
+            if parts:
+                yield b''.join(parts)
+            return
+        
+        if format_ext == 'png':
+            yield from self._iter_png(qr_result.matrix, settings)
+            return
+        
+        data = self.export_bytes(qr_result, settings, format_ext)
+        if data is None:
+            raise ValueError(f"Не вдалося експортувати QR-код у {format_ext}")
+        view = memoryview(data)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start:start + chunk_size])
+    
+    def export_image(self, image: Image.Image, target: ExportTarget, settings: Dict[str, Any],
+                     format_name: Optional[str] = None) -> bool:
+        """
+        Збереження вже растеризованого QR-коду у растровому форматі
         
-        return styled_image
+        Args:
+            image: Стилізоване зображення (render_image або render_images)
+            target: Шлях для збереження (.png, .jpg, .jpeg) або двійковий потік
+            settings: Налаштування дизайну
+            format_name: Формат, якщо його не видно з шляху чи імені потоку
+        
+        Returns:
+            True якщо експорт успішний
+        """
+        try:
+            format_ext = self._resolve_format(target, format_name)
+        except ValueError as e:
+            print(f"Помилка експорту: {e}")
+            return False
+        
+        writer = self.raster_writers.get(format_ext)
+        if writer is None:
+            print(f"Непідтримуваний растровий формат: {format_ext}")
+            return False
+        
+        try:
+            with open_target(target) as stream:
+                writer(image, stream, settings)
+            return True
+        except Exception as e:
+            print(f"Помилка збереження {format_ext.upper()}: {e}")
+            return False
+    
+    def render_image(self, qr_result: 'QRResult', settings: Dict[str, Any]) -> Image.Image:
+        """
+        Растеризація QR-коду у цільовому розмірі з налаштуваннями дизайну
+        
+        Args:
+            qr_result: Результат генерації з матрицею модулів
+            settings: Налаштування дизайну
+        
+        Returns:
+            Стилізоване зображення з цілою кількістю пікселів на модуль
+        """
+        return render_matrix(qr_result.matrix, **self._render_style(settings))
+    
+    def render_images(self, matrices: Sequence['ModuleMatrix'],
+                      settings: Dict[str, Any]) -> List[Image.Image]:
+        """
+        Растеризація багатьох QR-кодів з однаковими налаштуваннями дизайну
+        
+        Матриці однієї версії растеризуються разом в один буфер
+        (core.raster_batch); без NumPy кожна растеризується окремо.
+        
+        Args:
+            matrices: Матриці модулів
+            settings: Налаштування дизайну
+        
+        Returns:
+            Зображення у порядку matrices
+        """
+        from ..core.raster_batch import NUMPY_AVAILABLE, render_batch
+        
+        style = self._render_style(settings)
+        if not NUMPY_AVAILABLE:
+            return [render_matrix(matrix, **style) for matrix in matrices]
+        return self._render_groups(matrices, lambda group: render_batch(group, **style))
+    
+    def render_bits(self, matrices: Sequence['ModuleMatrix'],
+                    settings: Dict[str, Any]) -> List['PixelBuffer']:
+        """
+        Растеризація багатьох QR-кодів у 1-бітні буфери пікселів для PNG
+        
+        Матриці однієї версії растеризуються разом (core.raster_batch);
+        кольори не застосовуються, їх задає палітра PNG (export_bits).
+        
+        Args:
+            matrices: Матриці модулів
+            settings: Налаштування дизайну
+        
+        Returns:
+            Буфери пікселів у форматі '1' у порядку matrices
+        """
+        from ..core.raster_batch import NUMPY_AVAILABLE, render_bits
+        
+        style = self._render_style(settings)
+        geometry = {'size': style['size'], 'border': style['border']}
+        if not NUMPY_AVAILABLE:
+            return [render_pixels(matrix, '1', **geometry) for matrix in matrices]
+        return self._render_groups(matrices, lambda group: render_bits(group, **geometry))
+    
+    def export_bits(self, pixels: 'PixelBuffer', target: ExportTarget,
+                    settings: Dict[str, Any]) -> bool:
+        """
+        Збереження 1-бітних пікселів (render_bits) у PNG з кольорами дизайну
+        
+        Args:
+            pixels: Пікселі у форматі '1'
+            target: Шлях для збереження або двійковий потік
+            settings: Налаштування дизайну
+        
+        Returns:
+            True якщо експорт успішний
+        """
+        try:
+            with open_target(target) as stream:
+                stream.writelines(self._iter_png_bits(pixels, settings))
+            return True
+        except Exception as e:
+            print(f"Помилка збереження PNG: {e}")
+            return False
+    
+    def _render_groups(self, matrices: Sequence['ModuleMatrix'], render: Callable) -> list:
+        """Растеризація матриць групами однакового розміру зі збереженням порядку"""
+        groups: Dict[int, List[int]] = {}
+        for index, matrix in enumerate(matrices):
+            groups.setdefault(len(matrix), []).append(index)
+        
+        results: list = [None] * len(matrices)
+        for indices in groups.values():
+            rendered = render([matrices[i] for i in indices])
+            for index, item in zip(indices, rendered):
+                results[index] = item
+        return results
+    
+    def _render_style(self, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """Параметри растеризації з налаштувань дизайну"""
+        return {
+            'size': self._get_target_size(settings)[0],
+            'border': settings.get('border', 4),
+            'fg_color': settings.get('fg_color', '#000000'),
+            'bg_color': settings.get('bg_color', '#FFFFFF'),
+            'transparent_bg': settings.get('transparent_bg', False)
+        }
     
     def _get_target_size(self, settings: Dict[str, Any]) -> tuple:
         """Визначення цільового розміру зображення"""
@@ -110,107 +310,160 @@ class QRExporter:
             custom_size = settings.get('size', 400)
             return (custom_size, custom_size)
     
-    def _export_png(self, image: Image.Image, filepath: str, settings: Dict[str, Any]) -> bool:
-        """Експорт у PNG формат"""
+    def _resolve_format(self, target: ExportTarget, format_name: Optional[str]) -> str:
+        """
+        Формат експорту: явно заданий або з розширення шляху чи імені потоку
+        
+        Raises:
+            ValueError: Формат не задано і його не видно з цілі
+        """
+        if format_name:
+            return format_name.lower().lstrip('.')
+        name = target if not hasattr(target, 'write') else getattr(target, 'name', None)
+        if not isinstance(name, (str, os.PathLike)):
+            raise ValueError("Потік без імені файлу: вкажіть формат через format_name")
+        format_ext = os.path.splitext(os.fspath(name))[1].lower().lstrip('.')
+        if not format_ext:
+            raise ValueError(f"Шлях {os.fspath(name)} без розширення: вкажіть формат "
+                             f"через format_name")
+        return format_ext
+    
+    def _iter_png(self, matrix: 'ModuleMatrix', settings: Dict[str, Any]) -> Iterator[bytes]:
+        """1-бітний PNG з матриці: відтінки сірого або палітра з двох кольорів"""
+        style = self._render_style(settings)
+        pixels = render_pixels(matrix, '1', size=style['size'], border=style['border'])
+        return self._iter_png_bits(pixels, settings)
+    
+    def _iter_png_bits(self, pixels: 'PixelBuffer', settings: Dict[str, Any]) -> Iterator[bytes]:
+        """1-бітний PNG з пікселів '1' і кольорів дизайну"""
+        style = self._render_style(settings)
+        foreground = hex_to_rgb(style['fg_color'])
+        background = hex_to_rgb(style['bg_color'])
+        transparent = style['transparent_bg']
+        if foreground == (0, 0, 0) and background == (255, 255, 255) and not transparent:
+            return iter_png(pixels)
+        
+        # Прозорий фон у палітрі залишається білим, як у light_fill
+        if transparent:
+            background = (255, 255, 255)
+        return iter_png(pixels, palette=(foreground, background),
+                        alpha=(255, 0 if transparent else 255))
+    
+    def _export_png_matrix(self, target: ExportTarget, matrix: 'ModuleMatrix',
+                           settings: Dict[str, Any]) -> bool:
+        """Експорт у PNG формат без растеризації у 8 біт"""
         try:
-            # PNG підтримує прозорість
-            image.save(filepath, 'PNG', optimize=True)
+            with open_target(target) as stream:
+                stream.writelines(self._iter_png(matrix, settings))
             return True
         except Exception as e:
             print(f"Помилка збереження PNG: {e}")
             return False
     
-    def _export_jpg(self, image: Image.Image, filepath: str, settings: Dict[str, Any]) -> bool:
+    def _export_png(self, image: Image.Image, stream: BinaryIO, settings: Dict[str, Any]):
+        """Експорт у PNG формат"""
+        # PNG підтримує прозорість: двоколірні зображення записуються
+        # png_writer з 1 бітом на піксель і прозорістю у tRNS
+        image = self._bilevel_image(image)
+        if image.mode == '1':
+            pixels = PixelBuffer('1', image.width, image.height, image.tobytes())
+            stream.writelines(iter_png(pixels))
+            return
+        
+        palette = image.getpalette() if image.mode == 'P' else None
+        if palette is not None and len(palette) <= 6:
+            # Біти індексів палітри у тій самій розкладці, що й '1'
+            colors = [tuple(palette[i:i + 3]) for i in range(0, len(palette), 3)]
+            colors += colors[-1:] * (2 - len(colors))
+            transparency = image.info.get('transparency')
+            if isinstance(transparency, int):
+                alpha = tuple(0 if index == transparency else 255 for index in range(2))
+            elif transparency is not None:
+                alpha = tuple(transparency[:2]) + (255,) * (2 - len(transparency[:2]))
+            else:
+                alpha = None
+            pixels = PixelBuffer('1', image.width, image.height, image.tobytes('raw', 'P;1'))
+            stream.writelines(iter_png(pixels, palette=colors, alpha=alpha))
+            return
+        
+        # Багатоколірні зображення (наприклад, з логотипом) зберігає PIL
+        image.save(stream, 'PNG', optimize=True)
+    
+    def _bilevel_image(self, image: Image.Image) -> Image.Image:
+        """
+        Двоколірне зображення у режимі '1' або 'P' з палітрою з двох кольорів
+        
+        PIL записує такі зображення у PNG з глибиною 1 біт. Зображення з
+        більшою кількістю кольорів (наприклад, з логотипом) не змінюються.
+        """
+        if image.mode == 'L':
+            # Чорно-біле зображення render_matrix: лише значення 0 і 255
+            histogram = image.histogram()
+            if not any(histogram[1:255]):
+                return image.convert('1', dither=Image.Dither.NONE)
+            return image
+        
+        if image.mode not in ('RGB', 'RGBA'):
+            return image
+        
+        colors = image.getcolors(2)
+        if colors is None:
+            return image
+        
+        colors = [color for _, color in colors]
+        if len(colors) == 1:
+            indexed = Image.new('L', image.size, 0)
+        else:
+            # Канал, у якому кольори відрізняються, однозначно задає індекс
+            channel = next(i for i, (a, b) in enumerate(zip(*colors)) if a != b)
+            table = [0] * 256
+            table[colors[1][channel]] = 1
+            indexed = image.getchannel(channel).point(table)
+        
+        indexed.putpalette(bytes(value for color in colors for value in color[:3]))
+        if image.mode == 'RGBA' and any(color[3] != 255 for color in colors):
+            indexed.info['transparency'] = bytes(color[3] for color in colors)
+        return indexed
+    
+    def _export_jpg(self, image: Image.Image, stream: BinaryIO, settings: Dict[str, Any]):
         """Експорт у JPG формат"""
-        try:
-            # JPG не підтримує прозорість
-            if image.mode == 'RGBA':
-                # Створюємо білий фон
-                jpg_image = Image.new('RGB', image.size, 'white')
-                jpg_image.paste(image, mask=image.split()[-1] if len(image.split()) == 4 else None)
-                image = jpg_image
-            elif image.mode != 'RGB':
-                image = image.convert('RGB')
-            
-            quality = 95 if settings.get('high_quality', True) else 85
-            image.save(filepath, 'JPEG', quality=quality, optimize=True)
-            return True
-        except Exception as e:
-            print(f"Помилка збереження JPG: {e}")
-            return False
+        # JPG не підтримує прозорість
+        if image.mode == 'RGBA':
+            # Створюємо білий фон
+            jpg_image = Image.new('RGB', image.size, 'white')
+            jpg_image.paste(image, mask=image.split()[-1] if len(image.split()) == 4 else None)
+            image = jpg_image
+        elif image.mode != 'RGB':
+            image = image.convert('RGB')
+        
+        quality = 95 if settings.get('high_quality', True) else 85
+        image.save(stream, 'JPEG', quality=quality, optimize=True)
+    
+    def _svg_options(self, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """Параметри iter_svg з налаштувань дизайну"""
+        return {
+            'module_size': 10,
+            'border': settings.get('border', 4),
+            'fg_color': settings.get('fg_color', '#000000'),
+            'bg_color': settings.get('bg_color', '#FFFFFF'),
+            'transparent_bg': settings.get('transparent_bg', False),
+            'module_style': settings.get('module_style', 'square')
+        }
     
-    def _export_svg(self, filepath: str, qr_image: Image.Image, settings: Dict[str, Any]) -> bool:
+    def _export_svg(self, target: ExportTarget, matrix: Optional[Sequence[Sequence[bool]]],
+                    settings: Dict[str, Any]) -> bool:
         """Експорт у SVG формат"""
-        if not SVG_AVAILABLE:
-            print("SVG експорт недоступний. Встановіть svgwrite: pip install svgwrite")
+        if matrix is None:
+            print("SVG експорт потребує матрицю модулів QR-коду")
             return False
         
         try:
-            # Отримання матриці QR-коду
-            # Для цього потрібно пересоздати QR-код, але поки використаємо простий підхід
-            
-            # Параметри
-            fg_color = settings.get('fg_color', '#000000')
-            bg_color = settings.get('bg_color', '#FFFFFF')
-            transparent_bg = settings.get('transparent_bg', False)
-            module_style = settings.get('module_style', 'square')
-            
-            # Визначення розміру
-            qr_size = qr_image.size[0]
-            module_size = 10  # Розмір одного модуля в SVG
-            border_size = 40  # Розмір границі
-            svg_size = qr_size * module_size + 2 * border_size
-            
-            # Створення SVG
-            dwg = svgwrite.Drawing(filepath, size=(svg_size, svg_size))
-            
-            # Фон
-            if not transparent_bg:
-                dwg.add(dwg.rect(
-                    insert=(0, 0),
-                    size=(svg_size, svg_size),
-                    fill=bg_color
-                ))
-            
-            # Конвертація зображення в матрицю
-            qr_bw = qr_image.convert('L')  # Чорно-біле
-            pixels = list(qr_bw.getdata())
-            
-            # Створення модулів
-            for y in range(qr_size):
-                for x in range(qr_size):
-                    pixel_index = y * qr_size + x
-                    if pixel_index < len(pixels) and pixels[pixel_index] < 128:  # Чорний піксель
-                        svg_x = x * module_size + border_size
-                        svg_y = y * module_size + border_size
-                        
-                        if module_style == "circle":
-                            # Круглі модулі
-                            dwg.add(dwg.circle(
-                                center=(svg_x + module_size/2, svg_y + module_size/2),
-                                r=module_size/2,
-                                fill=fg_color
-                            ))
-                        elif module_style == "rounded":
-                            # Закруглені модулі
-                            dwg.add(dwg.rect(
-                                insert=(svg_x, svg_y),
-                                size=(module_size, module_size),
-                                fill=fg_color,
-                                rx=module_size/4,
-                                ry=module_size/4
-                            ))
-                        else:
-                            # Квадратні модулі
-                            dwg.add(dwg.rect(
-                                insert=(svg_x, svg_y),
-                                size=(module_size, module_size),
-                                fill=fg_color
-                            ))
-            
-            dwg.save()
+            # Потоковий запис без побудови DOM: текст кодується фрагментами
+            with open_target(target) as stream:
+                for text in iter_svg(matrix, **self._svg_options(settings)):
+                    stream.write(text.encode('utf-8'))
             return True
-            
+        
         except Exception as e:
             print(f"Помилка збереження SVG: {e}")
             return False
@@ -235,7 +488,7 @@ class QRStyler:
             qr_image: Зображення QR-коду
             logo_path: Шлях до логотипу
             logo_size_percent: Розмір логотипу у відсотках від QR-коду
-            
+        
         Returns:
             QR-код з логотипом
         """
@@ -276,7 +529,7 @@ class QRStyler:
             result_image.paste(logo_bg, logo_pos)
             
             return result_image
-            
+        
         except Exception as e:
             print(f"Помилка додавання логотипу: {e}")
             return qr_image
@@ -290,7 +543,7 @@ class QRStyler:
             qr_image: Зображення QR-коду
             frame_width: Товщина рамки
             frame_color: Колір рамки
-            
+        
         Returns:
             QR-код з рамкою
         """
@@ -313,7 +566,7 @@ class QRStyler:
             framed_image.paste(qr_image, (frame_width, frame_width))
             
             return framed_image
-            
+        
         except Exception as e:
             print(f"Помилка додавання рамки: {e}")
             return qr_image
\ No newline at end of file
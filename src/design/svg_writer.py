@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Потоковий запис QR-коду у SVG без побудови DOM
+
+Квадратні модулі об'єднуються у горизонтальні відрізки і записуються
+одним елементом <path>; круглі та закруглені модулі посилаються через
+<use> на спільний <symbol>. Координати задаються в модулях, а розмір у
+пікселях визначається атрибутами width/height і viewBox.
+"""
+
+from itertools import groupby
+from typing import Iterator, Sequence, TextIO, Tuple
+
+from ..core.matrix import ModuleMatrix
+
+# Кількість відрізків у одному фрагменті тексту, що передається у файл
+RUNS_PER_CHUNK = 256
+
+# Форми модулів для <symbol> у координатах одиничного квадрата
+SYMBOL_SHAPES = {
+    'circle': '<circle cx=".5" cy=".5" r=".5"/>',
+    'rounded': '<rect width="1" height="1" rx=".25" ry=".25"/>'
+}
+
+def iter_runs(row: Sequence[bool]) -> Iterator[Tuple[int, int]]:
+    """
+    Горизонтальні відрізки темних модулів у рядку
+    
+    Yields:
+        Кортежі (початкова колонка, довжина)
+    """
+    col = 0
+    for is_dark, group in groupby(row):
+        length = sum(1 for _ in group)
+        if is_dark:
+            yield col, length
+        col += length
+
+def iter_svg(matrix: Sequence[Sequence[bool]], module_size: int = 10, border: int = 4,
+             fg_color: str = "#000000", bg_color: str = "#FFFFFF",
+             transparent_bg: bool = False, module_style: str = "square") -> Iterator[str]:
+    """
+    Генерація тексту SVG фрагментами
+    
+    Args:
+        matrix: Матриця модулів без границі
+        module_size: Розмір модуля у пікселях
+        border: Границя у модулях
+        fg_color: Колір модулів
+        bg_color: Колір фону
+        transparent_bg: Чи робити фон прозорим
+        module_style: Стиль модулів (square, circle, rounded)
+    
+    Yields:
+        Фрагменти тексту SVG
+    """
+    total = len(matrix) + 2 * border
+    size = total * module_size
+    
+    yield ('<?xml version="1.0" encoding="utf-8"?>\n'
+           f'<svg xmlns="http://www.w3.org/2000/svg" '
+           f'xmlns:xlink="http://www.w3.org/1999/xlink" version="1.1" '
+           f'width="{size}" height="{size}" viewBox="0 0 {total} {total}">\n')
+    
+    # Фон
+    if not transparent_bg:
+        yield f'<rect width="{total}" height="{total}" fill="{bg_color}"/>\n'
+    
+    shape = SYMBOL_SHAPES.get(module_style)
+    
+    # Упакована матриця віддає відрізки рядків напряму
+    if isinstance(matrix, ModuleMatrix):
+        row_runs = matrix.iter_runs()
+    else:
+        row_runs = (iter_runs(row) for row in matrix)
+    
+    if shape is None:
+        # Квадратні модулі: один шлях з об'єднаних відрізків
+        yield f'<path fill="{fg_color}" shape-rendering="crispEdges" d="'
+        parts = []
+        for r, runs in enumerate(row_runs):
+            y = r + border
+            for col, length in runs:
+                parts.append(f'M{col + border} {y}h{length}v1h-{length}z')
+                if len(parts) >= RUNS_PER_CHUNK:
+                    yield ''.join(parts)
+                    parts = []
+        parts.append('"/>\n')
+        yield ''.join(parts)
+    else:
+        # Фігурні модулі: спільний символ та посилання на нього
+        yield (f'<defs><symbol id="m" overflow="visible">{shape}</symbol></defs>\n'
+               f'<g fill="{fg_color}">\n')
+        parts = []
+        for r, runs in enumerate(row_runs):
+            y = r + border
+            for col, length in runs:
+                for x in range(col + border, col + border + length):
+                    parts.append(f'<use xlink:href="#m" x="{x}" y="{y}"/>')
+            if len(parts) >= RUNS_PER_CHUNK:
+                parts.append('\n')
+                yield ''.join(parts)
+                parts = []
+        parts.append('\n</g>\n')
+        yield ''.join(parts)
+    
+    yield '</svg>\n'
+
+def write_svg(stream: TextIO, matrix: Sequence[Sequence[bool]], **options) -> None:
+    """
+    Запис SVG у текстовий потік
+    
+    Args:
+        stream: Відкритий текстовий потік
+        matrix: Матриця модулів без границі
+        **options: Параметри iter_svg
+    """
+    stream.writelines(iter_svg(matrix, **options))
\ No newline at end of file
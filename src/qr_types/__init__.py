@@ -1,9 +1,26 @@
 """
 Модуль типів QR-кодів
+
+Моделі даних (models) не залежать від tkinter і доступні одразу.
+Представлення Tk (base та модулі *_qr) завантажуються лише при першому
+зверненні до них, тому пакет можна імпортувати без GUI; модуль *_qr
+конкретного типу імпортується, коли цей тип запитано вперше.
 """
 
-from .base import BaseQRType, get_qr_type, get_all_qr_types, register_qr_type
-# Імпорти для автоматичної реєстрації типів
-from . import text_qr, url_qr, email_qr
+from .models import (
+    PayloadModel, PayloadField, get_payload_model, get_all_payload_models,
+    register_payload_model
+)
+
+# Імена, що надаються модулем base з представленнями Tk
+_VIEW_EXPORTS = ('BaseQRType', 'get_qr_type', 'get_all_qr_types', 'register_qr_type')
+
+def __getattr__(name):
+    if name in _VIEW_EXPORTS:
+        from . import base
+        return getattr(base, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__all__ = ['BaseQRType', 'get_qr_type', 'get_all_qr_types', 'register_qr_type']
\ No newline at end of file
+__all__ = ['PayloadModel', 'PayloadField', 'get_payload_model', 'get_all_payload_models',
+           'register_payload_model', 'BaseQRType', 'get_qr_type', 'get_all_qr_types',
+           'register_qr_type']
\ No newline at end of file
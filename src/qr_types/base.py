@@ -1,20 +1,27 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Базовий клас для всіх типів QR-кодів
+Базовий клас представлень Tk для всіх типів QR-кодів
+
+Логіка даних (валідація, побудова рядка) знаходиться у моделях
+models.py; представлення створює віджети і делегує їй решту.
 """
 
+import importlib
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Tuple, Optional
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 
+from .models import PayloadModel
+
 class BaseQRType(ABC):
-    """Абстрактний базовий клас для всіх типів QR-кодів"""
+    """Абстрактний базовий клас представлень типів QR-кодів"""
     
-    def __init__(self, name: str, icon: str = "📝"):
-        self.name = name
-        self.icon = icon
+    def __init__(self, model: PayloadModel):
+        self.model = model
+        self.name = model.name
+        self.icon = model.icon
         self.input_widgets = {}
     
     @property
@@ -36,7 +43,6 @@ class BaseQRType(ABC):
         """
         pass
     
-    @abstractmethod
     def validate_input(self, data: Dict[str, Any]) -> Tuple[bool, str]:
         """
         Валідація введених даних
@@ -47,9 +53,8 @@ class BaseQRType(ABC):
         Returns:
             Кортеж (успішність, повідомлення про помилку)
         """
-        pass
+        return self.model.validate(data)
     
-    @abstractmethod
     def generate_qr_data(self, data: Dict[str, Any]) -> str:
         """
         Генерація рядка даних для QR-коду
@@ -60,11 +65,11 @@ class BaseQRType(ABC):
         Returns:
             Рядок для генерації QR-коду
         """
-        pass
+        return self.model.build_payload(data)
     
     def get_info_text(self) -> str:
         """Повертає інформаційний текст про тип QR-коду"""
-        return f"QR-код типу {self.name}"
+        return self.model.info_text or f"QR-код типу {self.name}"
     
     def get_input_data(self) -> Dict[str, Any]:
         """Отримання даних з полів вводу"""
@@ -185,16 +190,45 @@ class BaseQRType(ABC):
 # Реєстр всіх доступних типів QR-кодів
 QR_TYPES_REGISTRY = {}
 
+# Створені екземпляри представлень (по одному на тип)
+QR_TYPE_INSTANCES: Dict[str, BaseQRType] = {}
+
+# Модулі представлень вбудованих типів; імпортуються при першому зверненні
+VIEW_MODULES = {
+    'text': 'text_qr',
+    'url': 'url_qr',
+    'email': 'email_qr',
+    'phone': 'phone_qr',
+}
+
 def register_qr_type(type_key: str, qr_type_class: type):
     """Реєстрація нового типу QR-коду"""
     QR_TYPES_REGISTRY[type_key] = qr_type_class
+    QR_TYPE_INSTANCES.pop(type_key, None)
+
+def load_qr_type(type_key: str) -> Optional[type]:
+    """Отримання класу представлення з імпортом його модуля за потреби"""
+    if type_key not in QR_TYPES_REGISTRY and type_key in VIEW_MODULES:
+        importlib.import_module(f'.{VIEW_MODULES[type_key]}', __package__)
+    return QR_TYPES_REGISTRY.get(type_key)
 
 def get_qr_type(type_key: str) -> Optional[BaseQRType]:
-    """Отримання екземпляру типу QR-коду за ключем"""
-    if type_key in QR_TYPES_REGISTRY:
-        return QR_TYPES_REGISTRY[type_key]()
-    return None
+    """
+    Отримання екземпляру типу QR-коду за ключем
+    
+    Екземпляр створюється один раз і повторно повертається при наступних
+    викликах разом зі своїми віджетами вводу.
+    """
+    instance = QR_TYPE_INSTANCES.get(type_key)
+    if instance is None:
+        qr_type_class = load_qr_type(type_key)
+        if qr_type_class is None:
+            return None
+        instance = QR_TYPE_INSTANCES[type_key] = qr_type_class()
+    return instance
 
 def get_all_qr_types() -> Dict[str, BaseQRType]:
     """Отримання всіх доступних типів QR-кодів"""
-    return {key: cls() for key, cls in QR_TYPES_REGISTRY.items()}
\ No newline at end of file
+    for type_key in VIEW_MODULES:
+        load_qr_type(type_key)
+    return {key: get_qr_type(key) for key in QR_TYPES_REGISTRY}
\ No newline at end of file
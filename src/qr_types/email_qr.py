@@ -1,21 +1,20 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Email тип QR-коду
+Email тип QR-коду (представлення Tk)
 """
 
 import tkinter as tk
-import re
-import urllib.parse
-from typing import Dict, Any, Tuple
+from typing import Dict
 from .base import BaseQRType, register_qr_type
+from .models import get_payload_model
 from ..utils.clipboard import setup_clipboard_menu, auto_paste_if_valid, is_email
 
 class EmailQRType(BaseQRType):
     """Клас для створення Email QR-кодів"""
     
     def __init__(self):
-        super().__init__("Email", "📧")
+        super().__init__(get_payload_model('email'))
     
     def create_input_fields(self, parent: tk.Widget, clipboard_manager=None) -> Dict[str, tk.Widget]:
         """Створення полів для email"""
@@ -95,91 +94,6 @@ class EmailQRType(BaseQRType):
                 fg='blue', justify='left', wraplength=500).pack(anchor='w')
         
         return self.input_widgets
-    
-    def validate_input(self, data: Dict[str, Any]) -> Tuple[bool, str]:
-        """Валідація email даних"""
-        email = data.get('email', '').strip()
-        
-        if not email:
-            return False, "Будь ласка, введіть email адресу"
-        
-        # Валідація основного email
-        if not self._validate_email(email):
-            return False, "Невірний формат email адреси"
-        
-        # Валідація CC emails
-        cc = data.get('cc', '').strip()
-        if cc:
-            cc_emails = [e.strip() for e in cc.split(',') if e.strip()]
-            for cc_email in cc_emails:
-                if not self._validate_email(cc_email):
-                    return False, f"Невірний формат CC email: {cc_email}"
-        
-        # Валідація BCC emails
-        bcc = data.get('bcc', '').strip()
-        if bcc:
-            bcc_emails = [e.strip() for e in bcc.split(',') if e.strip()]
-            for bcc_email in bcc_emails:
-                if not self._validate_email(bcc_email):
-                    return False, f"Невірний формат BCC email: {bcc_email}"
-        
-        # Перевірка довжини теми
-        subject = data.get('subject', '').strip()
-        if len(subject) > 200:
-            return False, "Тема листа занадто довга (максимум 200 символів)"
-        
-        # Перевірка довжини тексту
-        body = data.get('body', '').strip()
-        if len(body) > 2000:
-            return False, "Текст листа занадто довгий (максимум 2000 символів)"
-        
-        return True, email
-    
-    def _validate_email(self, email: str) -> bool:
-        """Валідація email адреси"""
-        email_pattern = re.compile(
-            r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        )
-        return bool(email_pattern.match(email.strip()))
-    
-    def generate_qr_data(self, data: Dict[str, Any]) -> str:
-        """Генерація mailto URL"""
-        email = data.get('email', '').strip()
-        subject = data.get('subject', '').strip()
-        body = data.get('body', '').strip()
-        cc = data.get('cc', '').strip()
-        bcc = data.get('bcc', '').strip()
-        
-        mailto_url = f"mailto:{email}"
-        params = []
-        
-        if subject:
-            params.append(f"subject={urllib.parse.quote(subject)}")
-        
-        if body:
-            params.append(f"body={urllib.parse.quote(body)}")
-        
-        if cc:
-            # Очищуємо та форматуємо CC emails
-            cc_emails = [e.strip() for e in cc.split(',') if e.strip()]
-            if cc_emails:
-                params.append(f"cc={urllib.parse.quote(','.join(cc_emails))}")
-        
-        if bcc:
-            # Очищуємо та форматуємо BCC emails
-            bcc_emails = [e.strip() for e in bcc.split(',') if e.strip()]
-            if bcc_emails:
-                params.append(f"bcc={urllib.parse.quote(','.join(bcc_emails))}")
-        
-        if params:
-            mailto_url += "?" + "&".join(params)
-        
-        return mailto_url
-    
-    def get_info_text(self) -> str:
-        """Інформація про Email тип QR-коду"""
-        return ("Email QR-код створює новий лист з вказаною адресою, темою та текстом "
-                "в поштовому клієнті користувача. Підтримує CC, BCC та форматування тексту.")
 
 # Реєстрація типу
 register_qr_type('email', EmailQRType)
\ No newline at end of file
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Моделі даних типів QR-кодів без залежності від tkinter
+
+Модель описує поля типу (схему), перевіряє дані та будує рядок для
+кодування. Представлення Tk (модулі *_qr) лише створюють віджети і
+делегують логіку моделі, тому пакетні процеси, сервери та інші
+виклики без GUI імпортують тільки цей модуль.
+"""
+
+import re
+import urllib.parse
+from abc import ABC, abstractmethod
+from typing import Dict, Any, NamedTuple, Optional, Tuple
+
+from ..utils.validators import Validators
+
+# Значення, що вважаються істинними для логічних полів з CSV/JSON
+TRUE_VALUES = ('1', 'true', 'yes', 'on', 'так', 'да')
+
+class PayloadField(NamedTuple):
+    """Опис поля вводу"""
+    key: str
+    label: str
+    kind: str = 'entry'  # entry, text, bool
+    required: bool = False
+
+class PayloadModel(ABC):
+    """Базова модель даних типу QR-коду"""
+    
+    key: str = ''
+    name: str = ''
+    icon: str = "📝"
+    fields: Tuple[PayloadField, ...] = ()
+    info_text: str = ''
+    
+    @property
+    def display_name(self) -> str:
+        """Повертає ім'я для відображення в UI"""
+        return f"{self.icon} {self.name}"
+    
+    def coerce(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Приведення сирих даних (наприклад, рядків CSV) до типів полів схеми
+        
+        Args:
+            data: Словник з даними
+        
+        Returns:
+            Новий словник, де логічні поля мають тип bool
+        """
+        coerced = dict(data)
+        for field in self.fields:
+            if field.kind == 'bool' and field.key in coerced:
+                value = coerced[field.key]
+                if not isinstance(value, bool):
+                    coerced[field.key] = str(value).strip().lower() in TRUE_VALUES
+        return coerced
+    
+    @abstractmethod
+    def validate(self, data: Dict[str, Any]) -> Tuple[bool, str]:
+        """
+        Валідація даних
+        
+        Args:
+            data: Словник з даними полів
+        
+        Returns:
+            Кортеж (успішність, повідомлення про помилку або нормалізоване значення)
+        """
+        pass
+    
+    @abstractmethod
+    def build_payload(self, data: Dict[str, Any]) -> str:
+        """
+        Побудова рядка для кодування у QR-код
+        
+        Args:
+            data: Валідовані дані
+        
+        Returns:
+            Рядок для генерації QR-коду
+        """
+        pass
+
+class TextPayload(PayloadModel):
+    """Звичайний текст"""
+    
+    key = 'text'
+    name = "Звичайний текст"
+    icon = "📝"
+    fields = (
+        PayloadField('text', "Текст для кодування:", 'text', required=True),
+    )
+    info_text = ("Звичайний текст - найпростіший тип QR-коду. Може містити будь-який текст "
+                 "до 4296 символів. Підтримує UTF-8 кодування для міжнародних символів.")
+    
+    # Максимальна довжина тексту
+    MAX_LENGTH = 4296
+    
+    def validate(self, data: Dict[str, Any]) -> Tuple[bool, str]:
+        text = data.get('text', '').strip()
+        
+        if not text:
+            return False, "Будь ласка, введіть текст для кодування"
+        
+        if len(text) > self.MAX_LENGTH:
+            return False, (f"Текст занадто довгий ({len(text)} символів). "
+                           f"Максимум: {self.MAX_LENGTH} символів")
+        
+        # Перевірка на підтримувані символи
+        try:
+            text.encode('utf-8')
+        except UnicodeEncodeError:
+            return False, "Текст містить непідтримувані символи"
+        
+        return True, text
+    
+    def build_payload(self, data: Dict[str, Any]) -> str:
+        return data.get('text', '').strip()
+
+class URLPayload(PayloadModel):
+    """Посилання на веб-сайт"""
+    
+    key = 'url'
+    name = "Веб-сайт (URL)"
+    icon = "🌐"
+    fields = (
+        PayloadField('url', "URL веб-сайту:", required=True),
+        PayloadField('warn_long', "Показати попередження для довгих URL (>100 символів)", 'bool'),
+        PayloadField('check_availability', "Перевірити доступність URL (потребує інтернет)", 'bool'),
+    )
+    info_text = ("URL QR-код перенаправляє користувача на веб-сайт при скануванні. "
+                 "Автоматично додається https:// якщо протокол не вказано. "
+                 "Підтримуються протоколи: http, https, ftp, ftps.")
+    
+    # Протоколи, що не потребують доповнення
+    SCHEMES = ('http://', 'https://', 'ftp://', 'ftps://')
+    
+    def normalize_url(self, url: str) -> str:
+        """Автоматичне додавання протоколу"""
+        url = url.strip()
+        if url and not url.startswith(self.SCHEMES):
+            url = 'https://' + url
+        return url
+    
+    def validate(self, data: Dict[str, Any]) -> Tuple[bool, str]:
+        url = data.get('url', '').strip()
+        
+        if not url:
+            return False, "Будь ласка, введіть URL"
+        
+        url = self.normalize_url(url)
+        
+        # Валідація URL
+        try:
+            result = urllib.parse.urlparse(url)
+            if not all([result.scheme, result.netloc]):
+                return False, "Невірний формат URL. Переконайтесь, що URL містить домен."
+        except Exception:
+            return False, "Невірний формат URL"
+        
+        # Перевірка довжини
+        if data.get('warn_long', False) and len(url) > 100:
+            return False, (f"URL занадто довгий ({len(url)} символів). "
+                           f"Рекомендується використовувати короткі URL.")
+        
+        # Перевірка доступності (опціонально)
+        if data.get('check_availability', False):
+            if not self.check_availability(url):
+                return False, "URL недоступний або не відповідає. Перевірте правильність адреси."
+        
+        return True, url
+    
+    def check_availability(self, url: str) -> bool:
+        """Перевірка доступності URL"""
+        try:
+            import urllib.request
+            import urllib.error
+            
+            # Створюємо запит з таймаутом
+            req = urllib.request.Request(url)
+            req.add_header('User-Agent', 'QR-Generator/2.0')
+            
+            with urllib.request.urlopen(req, timeout=5) as response:
+                return response.getcode() == 200
+        except Exception:
+            return False
+    
+    def build_payload(self, data: Dict[str, Any]) -> str:
+        return self.normalize_url(data.get('url', ''))
+
+class EmailPayload(PayloadModel):
+    """Лист електронної пошти (mailto)"""
+    
+    key = 'email'
+    name = "Email"
+    icon = "📧"
+    fields = (
+        PayloadField('email', "Email адреса:", required=True),
+        PayloadField('subject', "Тема листа (необов'язково):"),
+        PayloadField('body', "Текст листа (необов'язково):", 'text'),
+        PayloadField('cc', "CC (копія) - через кому:"),
+        PayloadField('bcc', "BCC (прихована копія) - через кому:"),
+    )
+    info_text = ("Email QR-код створює новий лист з вказаною адресою, темою та текстом "
+                 "в поштовому клієнті користувача. Підтримує CC, BCC та форматування тексту.")
+    
+    EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+    
+    def is_valid_email(self, email: str) -> bool:
+        """Валідація email адреси"""
+        return bool(self.EMAIL_PATTERN.match(email.strip()))
+    
+    @staticmethod
+    def split_emails(value: str) -> list:
+        """Розбиття списку адрес через кому"""
+        return [e.strip() for e in value.split(',') if e.strip()]
+    
+    def validate(self, data: Dict[str, Any]) -> Tuple[bool, str]:
+        email = data.get('email', '').strip()
+        
+        if not email:
+            return False, "Будь ласка, введіть email адресу"
+        
+        # Валідація основного email
+        if not self.is_valid_email(email):
+            return False, "Невірний формат email адреси"
+        
+        # Валідація CC та BCC
+        for field, label in (('cc', 'CC'), ('bcc', 'BCC')):
+            for address in self.split_emails(data.get(field, '')):
+                if not self.is_valid_email(address):
+                    return False, f"Невірний формат {label} email: {address}"
+        
+        # Перевірка довжини теми
+        if len(data.get('subject', '').strip()) > 200:
+            return False, "Тема листа занадто довга (максимум 200 символів)"
+        
+        # Перевірка довжини тексту
+        if len(data.get('body', '').strip()) > 2000:
+            return False, "Текст листа занадто довгий (максимум 2000 символів)"
+        
+        return True, email
+    
+    def build_payload(self, data: Dict[str, Any]) -> str:
+        email = data.get('email', '').strip()
+        subject = data.get('subject', '').strip()
+        body = data.get('body', '').strip()
+        
+        mailto_url = f"mailto:{email}"
+        params = []
+        
+        if subject:
+            params.append(f"subject={urllib.parse.quote(subject)}")
+        
+        if body:
+            params.append(f"body={urllib.parse.quote(body)}")
+        
+        # Очищені та відформатовані списки копій
+        for field in ('cc', 'bcc'):
+            addresses = self.split_emails(data.get(field, ''))
+            if addresses:
+                params.append(f"{field}={urllib.parse.quote(','.join(addresses))}")
+        
+        if params:
+            mailto_url += "?" + "&".join(params)
+        
+        return mailto_url
+
+class PhonePayload(PayloadModel):
+    """Номер телефону (tel:)"""
+    
+    key = 'phone'
+    name = "Телефон"
+    icon = "📞"
+    fields = (
+        PayloadField('phone', "Номер телефону:", required=True),
+        PayloadField('show_format', "Показати допомогу з форматування", 'bool'),
+    )
+    info_text = ("Телефонний QR-код дозволяє користувачеві зателефонувати на вказаний номер "
+                 "одним дотиком. Підтримує міжнародний формат з кодом країни.")
+    
+    def validate(self, data: Dict[str, Any]) -> Tuple[bool, str]:
+        return Validators.validate_phone(data.get('phone', '').strip())
+    
+    def build_payload(self, data: Dict[str, Any]) -> str:
+        # Очищення номера (залишаємо тільки + та цифри)
+        phone_clean = re.sub(r'[^\d+]', '', data.get('phone', '').strip())
+        return f"tel:{phone_clean}"
+
+# Реєстр моделей даних
+PAYLOAD_MODELS: Dict[str, PayloadModel] = {}
+
+def register_payload_model(model: PayloadModel):
+    """Реєстрація моделі даних за її ключем"""
+    PAYLOAD_MODELS[model.key] = model
+
+def get_payload_model(type_key: str) -> Optional[PayloadModel]:
+    """Отримання моделі даних за ключем типу"""
+    return PAYLOAD_MODELS.get(type_key)
+
+def get_all_payload_models() -> Dict[str, PayloadModel]:
+    """Отримання всіх моделей даних"""
+    return dict(PAYLOAD_MODELS)
+
+for _model in (TextPayload(), URLPayload(), EmailPayload(), PhonePayload()):
+    register_payload_model(_model)
\ No newline at end of file
@@ -1,20 +1,20 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Телефонний тип QR-коду
+Телефонний тип QR-коду (представлення Tk)
 """
 
 import tkinter as tk
-from typing import Dict, Any, Tuple
+from typing import Dict
 from .base import BaseQRType, register_qr_type
+from .models import get_payload_model
 from ..utils.clipboard import setup_clipboard_menu, auto_paste_if_valid, is_phone
-from ..utils.validators import Validators
 
 class PhoneQRType(BaseQRType):
     """Клас для створення телефонних QR-кодів"""
     
     def __init__(self):
-        super().__init__("Телефон", "📞")
+        super().__init__(get_payload_model('phone'))
     
     def create_input_fields(self, parent: tk.Widget, clipboard_manager=None) -> Dict[str, tk.Widget]:
         """Створення полів для телефону"""
@@ -91,27 +91,6 @@ class PhoneQRType(BaseQRType):
                 fg='gray', justify='left').pack(anchor='w')
         
         return self.input_widgets
-    
-    def validate_input(self, data: Dict[str, Any]) -> Tuple[bool, str]:
-        """Валідація телефонних даних"""
-        phone = data.get('phone', '').strip()
-        
-        return Validators.validate_phone(phone)
-    
-    def generate_qr_data(self, data: Dict[str, Any]) -> str:
-        """Генерація tel: URL"""
-        phone = data.get('phone', '').strip()
-        
-        # Очищення номера (залишаємо тільки + та цифри)
-        import re
-        phone_clean = re.sub(r'[^\d+]', '', phone)
-        
-        return f"tel:{phone_clean}"
-    
-    def get_info_text(self) -> str:
-        """Інформація про телефонний тип QR-коду"""
-        return ("Телефонний QR-код дозволяє користувачеві зателефонувати на вказаний номер "
-                "одним дотиком. Підтримує міжнародний формат з кодом країни.")
 
 # Реєстрація типу
 register_qr_type('phone', PhoneQRType)
\ No newline at end of file
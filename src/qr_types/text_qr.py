@@ -1,19 +1,20 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Текстовий тип QR-коду
+Текстовий тип QR-коду (представлення Tk)
 """
 
 import tkinter as tk
-from typing import Dict, Any, Tuple
+from typing import Dict
 from .base import BaseQRType, register_qr_type
+from .models import get_payload_model
 from ..utils.clipboard import setup_clipboard_menu, auto_paste_if_valid
 
 class TextQRType(BaseQRType):
     """Клас для створення текстових QR-кодів"""
     
     def __init__(self):
-        super().__init__("Звичайний текст", "📝")
+        super().__init__(get_payload_model('text'))
     
     def create_input_fields(self, parent: tk.Widget, clipboard_manager=None) -> Dict[str, tk.Widget]:
         """Створення полів для введення тексту"""
@@ -70,33 +71,6 @@ class TextQRType(BaseQRType):
         text_widget.bind('<FocusOut>', update_char_count)
         
         return self.input_widgets
-    
-    def validate_input(self, data: Dict[str, Any]) -> Tuple[bool, str]:
-        """Валідація текстових даних"""
-        text = data.get('text', '').strip()
-        
-        if not text:
-            return False, "Будь ласка, введіть текст для кодування"
-        
-        if len(text) > 4296:
-            return False, f"Текст занадто довгий ({len(text)} символів). Максимум: 4296 символів"
-        
-        # Перевірка на підтримувані символи
-        try:
-            text.encode('utf-8')
-        except UnicodeEncodeError:
-            return False, "Текст містить непідтримувані символи"
-        
-        return True, text
-    
-    def generate_qr_data(self, data: Dict[str, Any]) -> str:
-        """Генерація даних для QR-коду"""
-        return data.get('text', '').strip()
-    
-    def get_info_text(self) -> str:
-        """Інформація про текстовий тип QR-коду"""
-        return ("Звичайний текст - найпростіший тип QR-коду. Може містити будь-який текст "
-                "до 4296 символів. Підтримує UTF-8 кодування для міжнародних символів.")
 
 # Реєстрація типу
 register_qr_type('text', TextQRType)
\ No newline at end of file
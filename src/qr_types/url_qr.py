@@ -1,20 +1,20 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-URL тип QR-коду
+URL тип QR-коду (представлення Tk)
 """
 
 import tkinter as tk
 from typing import Dict, Any, Tuple
-from urllib.parse import urlparse
 from .base import BaseQRType, register_qr_type
+from .models import get_payload_model
 from ..utils.clipboard import setup_clipboard_menu, auto_paste_if_valid, is_url
 
 class URLQRType(BaseQRType):
     """Клас для створення URL QR-кодів"""
     
     def __init__(self):
-        super().__init__("Веб-сайт (URL)", "🌐")
+        super().__init__(get_payload_model('url'))
     
     def create_input_fields(self, parent: tk.Widget, clipboard_manager=None) -> Dict[str, tk.Widget]:
         """Створення полів для введення URL"""
@@ -71,63 +71,16 @@ class URLQRType(BaseQRType):
         return self.input_widgets
     
     def validate_input(self, data: Dict[str, Any]) -> Tuple[bool, str]:
-        """Валідація URL"""
-        url = data.get('url', '').strip()
-        
-        if not url:
-            return False, "Будь ласка, введіть URL"
-        
-        # Автоматичне додавання протоколу
-        if not url.startswith(('http://', 'https://', 'ftp://', 'ftps://')):
-            url = 'https://' + url
-            # Оновлюємо поле
-            if 'url' in self.input_widgets:
-                self.input_widgets['url'].delete(0, tk.END)
-                self.input_widgets['url'].insert(0, url)
-        
-        # Валідація URL
-        try:
-            result = urlparse(url)
-            if not all([result.scheme, result.netloc]):
-                return False, "Невірний формат URL. Переконайтесь, що URL містить домен."
-        except Exception:
-            return False, "Невірний формат URL"
-        
-        # Перевірка довжини
-        if data.get('warn_long', False) and len(url) > 100:
-            return False, f"URL занадто довгий ({len(url)} символів). Рекомендується використовувати короткі URL."
+        """Валідація URL з оновленням поля, якщо протокол додано автоматично"""
+        is_valid, result = self.model.validate(data)
         
-        # Перевірка доступності (опціонально)
-        if data.get('check_availability', False):
-            if not self._check_url_availability(url):
-                return False, f"URL недоступний або не відповідає. Перевірте правильність адреси."
+        url = data.get('url', '').strip()
+        normalized = self.model.normalize_url(url)
+        if url and normalized != url and 'url' in self.input_widgets:
+            self.input_widgets['url'].delete(0, tk.END)
+            self.input_widgets['url'].insert(0, normalized)
         
-        return True, url
-    
-    def _check_url_availability(self, url: str) -> bool:
-        """Перевірка доступності URL"""
-        try:
-            import urllib.request
-            import urllib.error
-            
-            # Створюємо запит з таймаутом
-            req = urllib.request.Request(url)
-            req.add_header('User-Agent', 'QR-Generator/2.0')
-            
-            with urllib.request.urlopen(req, timeout=5) as response:
-                return response.getcode() == 200
-        except (urllib.error.URLError, urllib.error.HTTPError, Exception):
-            return False
-    
-    def generate_qr_data(self, data: Dict[str, Any]) -> str:
-        """Генерація даних для QR-коду"""
-        return data.get('url', '').strip()
-    
-    def get_info_text(self) -> str:
-        """Інформація про URL тип QR-коду"""
-        return ("URL QR-код перенаправляє користувача на веб-сайт при скануванні. "
-                "Автоматично додається https:// якщо протокол не вказано. "
-                "Підтримуються протоколи: http, https, ftp, ftps.")
+        return is_valid, result
 
 # Реєстрація типу
 register_qr_type('url', URLQRType)
\ No newline at end of file
@@ -6,10 +6,10 @@
 
 import tkinter as tk
 from tkinter import ttk, colorchooser
-from PIL import Image, ImageTk
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 
 from ..config.settings import app_settings
+from .utils import BackgroundRenderer
 
 class DesignTab:
     """Клас для управління вкладкою дизайну"""
@@ -41,15 +41,43 @@ class DesignTab:
         }
         
         # Поточний QR код для превью
-        self.current_qr_image = None
+        self.current_qr_result = None
         self.preview_qr = None
         
-        # Створення UI
-        self.create_widgets()
+        # Змінні дизайну потрібні головному вікну одразу, віджети вкладки
+        # будуються при першому її відкритті (build)
+        self.built = False
+        self.create_variables()
+        
+        # Рендеринг превью у фоновому потоці
+        self.renderer = BackgroundRenderer(self.frame, self.render_views, self.show_views)
         
         # Завантаження збережених налаштувань
         self.load_settings()
     
+    def create_variables(self):
+        """Створення змінних дизайну"""
+        self.color_preset_var = tk.StringVar(value="Класичний")
+        self.fg_color_var = tk.StringVar(value="#000000")
+        self.bg_color_var = tk.StringVar(value="#FFFFFF")
+        self.transparent_var = tk.BooleanVar(value=False)
+        self.module_style_var = tk.StringVar(value="square")
+        self.export_format_var = tk.StringVar(value="PNG")
+        self.high_quality_var = tk.BooleanVar(value=True)
+        self.size_var = tk.IntVar(value=400)
+    
+    def build(self):
+        """Побудова віджетів вкладки (один раз, при першому відкритті)"""
+        if self.built:
+            return
+        
+        self.create_widgets()
+        self.built = True
+        
+        # Превью для вже згенерованого QR-коду
+        if self.current_qr_result:
+            self.update_preview()
+    
     def create_widgets(self):
         """Створення віджетів вкладки дизайну"""
         # Налаштування сітки
@@ -87,7 +115,6 @@ class DesignTab:
         # Предустановлені схеми
         ttk.Label(colors_frame, text="Готові схеми:").pack(anchor='w', pady=(0, 5))
         
-        self.color_preset_var = tk.StringVar(value="Класичний")
         preset_combo = ttk.Combobox(
             colors_frame,
             textvariable=self.color_preset_var,
@@ -102,7 +129,6 @@ class DesignTab:
         fg_frame.pack(fill='x', pady=(0, 5))
         
         ttk.Label(fg_frame, text="Колір QR-коду:").pack(side='left')
-        self.fg_color_var = tk.StringVar(value="#000000")
         self.fg_color_btn = tk.Button(
             fg_frame,
             text="   ",
@@ -117,7 +143,6 @@ class DesignTab:
         bg_frame.pack(fill='x', pady=(0, 5))
         
         ttk.Label(bg_frame, text="Колір фону:").pack(side='left')
-        self.bg_color_var = tk.StringVar(value="#FFFFFF")
         self.bg_color_btn = tk.Button(
             bg_frame,
             text="   ",
@@ -128,7 +153,6 @@ class DesignTab:
         self.bg_color_btn.pack(side='right')
         
         # Прозорий фон
-        self.transparent_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(
             colors_frame,
             text="Прозорий фон (PNG)",
@@ -141,8 +165,6 @@ class DesignTab:
         style_frame = ttk.LabelFrame(parent, text="Стиль модулів", padding="10")
         style_frame.pack(fill='x', pady=(0, 10))
         
-        self.module_style_var = tk.StringVar(value="square")
-        
         for style_key, style_name in self.module_styles.items():
             ttk.Radiobutton(
                 style_frame,
@@ -157,8 +179,6 @@ class DesignTab:
         export_frame = ttk.LabelFrame(parent, text="Формат експорту", padding="10")
         export_frame.pack(fill='x', pady=(0, 10))
         
-        self.export_format_var = tk.StringVar(value="PNG")
-        
         # Доступні формати
         formats = ['PNG', 'JPG', 'SVG']
         
@@ -175,7 +195,6 @@ class DesignTab:
         quality_frame = ttk.Frame(export_frame)
         quality_frame.pack(fill='x', pady=(10, 0))
         
-        self.high_quality_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(
             quality_frame,
             text="Висока якість (800x800)",
@@ -187,7 +206,6 @@ class DesignTab:
         size_frame.pack(fill='x', pady=(5, 0))
         
         ttk.Label(size_frame, text="Розмір (пікселі):").pack(side='left')
-        self.size_var = tk.IntVar(value=400)
         size_scale = ttk.Scale(
             size_frame,
             from_=200,
@@ -197,7 +215,7 @@ class DesignTab:
         )
         size_scale.pack(side='left', fill='x', expand=True, padx=(10, 5))
         
-        self.size_label = ttk.Label(size_frame, text="400")
+        self.size_label = ttk.Label(size_frame, text=str(self.size_var.get()))
         self.size_label.pack(side='right')
         
         # Оновлення лейблу розміру
@@ -254,8 +272,9 @@ class DesignTab:
         self.transparent_var.set(app_settings.get('transparent_bg', False))
         
         # Оновлення кнопок кольорів
-        self.fg_color_btn.config(bg=self.fg_color_var.get())
-        self.bg_color_btn.config(bg=self.bg_color_var.get())
+        if self.built:
+            self.fg_color_btn.config(bg=self.fg_color_var.get())
+            self.bg_color_btn.config(bg=self.bg_color_var.get())
     
     def on_preset_change(self, event=None):
         """Обробка зміни кольорової схеми"""
@@ -309,32 +328,62 @@ class DesignTab:
         self.size_var.set(400)
         self.update_preview()
     
-    def update_preview(self, qr_image: Optional[Image.Image] = None):
-        """Оновлення превью QR-коду"""
-        if qr_image:
-            self.current_qr_image = qr_image
+    def update_preview(self, qr_result=None):
+        """
+        Запит на оновлення превью QR-коду
         
-        if not self.current_qr_image:
+        Рендеринг виконується у фоновому потоці; швидкі послідовні зміни
+        об'єднуються, і відображається лише результат останньої.
+        """
+        if qr_result:
+            self.current_qr_result = qr_result
+        
+        if not self.current_qr_result:
             return
         
-        try:
-            # Створення стилізованого зображення
-            preview_image = self.create_styled_qr_image(self.current_qr_image, preview=True)
-            
-            # Зміна розміру для превью
-            display_size = (250, 250)
-            preview_display = preview_image.resize(display_size, Image.Resampling.LANCZOS)
-            
-            # Конвертація для tkinter
-            self.preview_qr = ImageTk.PhotoImage(preview_display)
-            self.preview_label.configure(image=self.preview_qr, text="")
-            
-            # Оновлення інформації
+        # Оновлення інформації
+        if self.built:
             self.update_preview_info()
+        
+        # Параметри знімаються у потоці Tk, рендеринг - у фоновому
+        self.renderer.request(self.current_qr_result, self.get_render_style())
+    
+    def render_views(self, qr_result, style: Dict[str, Any]):
+        """
+        Рендеринг превью та основного відображення (у фоновому потоці)
+        
+        Стилізація виконується один раз для зображення з одним пікселем на
+        модуль, обидва розміри отримуються з нього цілочисельним збільшенням.
+        
+        Returns:
+            Кортеж (превью 250px, основне відображення 300px)
+        """
+        from ..core.raster import render_matrix, upscale, light_fill
+        
+        styled = render_matrix(qr_result.matrix, scale=1, **style)
+        fill = light_fill(styled.mode, style['bg_color'], style['transparent_bg'])
+        
+        return (
+            upscale(styled, 250, fill=fill),
+            upscale(styled, 300, fill=fill)
+        )
+    
+    def show_views(self, images):
+        """Відображення готових зображень (у потоці Tk)"""
+        preview_display, main_display = images
+        
+        try:
+            # Одне зображення Tk на весь сеанс, оновлюється на місці
+            if self.built:
+                if self.preview_qr is None:
+                    from PIL import ImageTk
+                    self.preview_qr = ImageTk.PhotoImage('RGBA', preview_display.size)
+                self.preview_qr.paste(preview_display)
+                self.preview_label.configure(image=self.preview_qr, text="")
             
             # Оновлення основного відображення
             if hasattr(self.main_window, 'display_qr_image'):
-                self.main_window.display_qr_image()
+                self.main_window.display_qr_image(main_display)
             
         except Exception as e:
             print(f"Помилка оновлення превью: {e}")
@@ -351,51 +400,25 @@ class DesignTab:
     
     def clear_preview(self):
         """Очищення превью"""
-        self.current_qr_image = None
-        self.preview_qr = None
+        self.renderer.cancel()
+        self.current_qr_result = None
+        if not self.built:
+            return
+        
         self.preview_label.configure(
             image='',
             text="Превью з'явиться після генерації QR-коду"
         )
         self.preview_info_label.config(text="")
     
-    def create_styled_qr_image(self, base_qr_image: Image.Image, preview: bool = False) -> Image.Image:
-        """Створення стилізованого QR-коду"""
-        # Отримання кольорів
-        fg_color = self.fg_color_var.get()
-        bg_color = self.bg_color_var.get() if not self.transparent_var.get() else None
-        
-        # Копіювання базового зображення
-        styled_image = base_qr_image.copy()
-        
-        # Застосування кольорів
-        if fg_color != "#000000" or bg_color != "#FFFFFF" or self.transparent_var.get():
-            styled_image = styled_image.convert("RGBA")
-            data = styled_image.getdata()
-            
-            new_data = []
-            for item in data:
-                # Заміна чорного на вибраний колір переднього плану
-                if item[:3] == (0, 0, 0):  # чорний піксель
-                    rgb = tuple(int(fg_color[i:i+2], 16) for i in (1, 3, 5))
-                    new_data.append(rgb + (255,))
-                # Заміна білого на колір фону або прозорий
-                elif item[:3] == (255, 255, 255):  # білий піксель
-                    if self.transparent_var.get():
-                        new_data.append((255, 255, 255, 0))  # прозорий
-                    else:
-                        rgb = tuple(int(bg_color[i:i+2], 16) for i in (1, 3, 5))
-                        new_data.append(rgb + (255,))
-                else:
-                    new_data.append(item)
-            
-            styled_image.putdata(new_data)
-            
-            # Конвертація назад в RGB якщо фон не прозорий
-            if not self.transparent_var.get():
-                styled_image = styled_image.convert("RGB")
-        
-        return styled_image
+    def get_render_style(self) -> Dict[str, Any]:
+        """Знімок поточних параметрів дизайну для рендерингу"""
+        return {
+            'border': app_settings.get('border', 4),
+            'fg_color': self.fg_color_var.get(),
+            'bg_color': self.bg_color_var.get(),
+            'transparent_bg': self.transparent_var.get()
+        }
     
     def get_export_format(self) -> str:
         """Отримання формату експорту"""
@@ -410,7 +433,8 @@ class DesignTab:
             'module_style': self.module_style_var.get(),
             'format': self.export_format_var.get(),
             'high_quality': self.high_quality_var.get(),
-            'size': self.size_var.get()
+            'size': self.size_var.get(),
+            'border': app_settings.get('border', 4)
         }
     
     def get_current_settings(self) -> Dict[str, Any]:
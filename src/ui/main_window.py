@@ -6,47 +6,82 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import qrcode
-from PIL import Image, ImageTk
+import io
 import os
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-# Імпорти модулів
+# Імпорти модулів (PIL, qrcode, експортери та модулі типів
+# завантажуються при першому використанні)
 from ..config.settings import app_settings
 from ..utils.clipboard import ClipboardManager
-from ..qr_types.base import get_all_qr_types, get_qr_type
-from ..design.export import QRExporter
+from ..utils.profiling import startup_profiler
+from ..qr_types.models import get_payload_model
+from ..qr_types.base import get_qr_type
 from .design_tab import DesignTab
-from .settings_dialog import SettingsDialog
+from .utils import BackgroundRenderer
 
-# Імпорт всіх типів QR-кодів для їх реєстрації
-from ..qr_types import text_qr, url_qr, email_qr
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Затримка живого режиму після останнього натискання клавіші (мс)
+LIVE_DEBOUNCE_MS = 250
+
+# Типи QR-кодів, доступні у головному вікні
+GUI_QR_TYPES = ('text', 'url', 'email')
 
 class QRCodeGenerator:
     """Головний клас додатку QR Code Generator"""
     
     def __init__(self, root: tk.Tk):
         self.root = root
-        self.setup_window()
+        with startup_profiler.phase("вікно"):
+            self.setup_window()
         
         # Ініціалізація компонентів
         self.clipboard_manager = ClipboardManager(root)
-        self.qr_exporter = QRExporter()
+        self._qr_exporter = None
+        self.settings_dialog = None
+        # Останнє зображення для буфера обміну: (результат, налаштування, PNG)
+        self._clipboard_render = None
         
         # QR код змінні
-        self.current_qr_image = None
+        self.current_qr_result = None
         self.qr_photo = None
         self.current_qr_type = app_settings.get("last_qr_type", "text")
         
-        # Отримання всіх доступних типів QR-кодів
-        self.qr_types = get_all_qr_types()
+        # Моделі доступних типів; представлення створюються при виборі типу
+        self.qr_types = {key: get_payload_model(key) for key in GUI_QR_TYPES}
         self.current_qr_instance = None
         
+        # Фрейми полів вводу за типом: будуються при першому виборі і
+        # далі лише ховаються, тому введені дані зберігаються
+        self.input_frames = {}
+        self.current_input_frame = None
+        
+        # Живий режим: кодування у фоновому потоці під час введення
+        self.live_renderer = BackgroundRenderer(
+            self.root, self.encode_live, self.show_qr_result, delay_ms=0,
+            on_error=lambda error: self.show_live_error(f"Помилка генерації: {error}")
+        )
+        self._live_after_id = None
+        self._live_request = None
+        
         # Створення інтерфейсу
-        self.create_widgets()
+        with startup_profiler.phase("вкладки"):
+            self.create_widgets()
         
         # Встановлення поточного типу
-        self.set_qr_type(self.current_qr_type)
+        with startup_profiler.phase("поля вводу"):
+            self.set_qr_type(self.current_qr_type)
+    
+    @property
+    def qr_exporter(self):
+        """Експортер, що створюється при першому збереженні або копіюванні"""
+        if self._qr_exporter is None:
+            from ..design.export import QRExporter
+            self._qr_exporter = QRExporter()
+        return self._qr_exporter
     
     def setup_window(self):
         """Налаштування головного вікна"""
@@ -80,16 +115,24 @@ class QRCodeGenerator:
         self.create_tab_frame = ttk.Frame(self.main_notebook, padding="10")
         self.main_notebook.add(self.create_tab_frame, text="Створення QR-коду")
         
-        # Вкладка дизайну
-        self.design_tab = DesignTab(self.main_notebook, self)
-        self.main_notebook.add(self.design_tab.frame, text="Дизайн")
+        # Вкладка дизайну (віджети будуються при першому відкритті)
+        with startup_profiler.phase("вкладка дизайну"):
+            self.design_tab = DesignTab(self.main_notebook, self)
+            self.main_notebook.add(self.design_tab.frame, text="Дизайн")
+        self.main_notebook.bind('<<NotebookTabChanged>>', self.on_tab_change)
         
         # Створення основної вкладки
-        self.create_main_tab()
+        with startup_profiler.phase("основна вкладка"):
+            self.create_main_tab()
         
         # Статус бар
         self.create_status_bar()
     
+    def on_tab_change(self, event=None):
+        """Побудова вкладки дизайну при першому переході на неї"""
+        if self.main_notebook.select() == str(self.design_tab.frame):
+            self.design_tab.build()
+    
     def create_main_tab(self):
         """Створення основної вкладки"""
         # Налаштування сітки
@@ -202,6 +245,15 @@ class QRCodeGenerator:
             command=self.open_settings
         )
         self.settings_btn.grid(row=0, column=3, padx=(5, 0), sticky=(tk.W, tk.E))
+        
+        # Живий режим
+        self.live_mode_var = tk.BooleanVar(value=app_settings.get('live_mode', False))
+        ttk.Checkbutton(
+            buttons_frame,
+            text="⚡ Генерувати під час введення",
+            variable=self.live_mode_var,
+            command=self.schedule_live_update
+        ).grid(row=1, column=0, columnspan=4, sticky=tk.W, pady=(5, 0))
     
     def create_qr_display(self):
         """Створення області відображення QR-коду"""
@@ -290,12 +342,91 @@ class QRCodeGenerator:
         self.clear_qr_display()
     
     def create_input_fields(self):
-        """Створення полів вводу для поточного типу"""
-        if self.current_qr_instance:
-            self.current_qr_instance.create_input_fields(
-                self.input_container, 
-                self.clipboard_manager
-            )
+        """Показ полів вводу поточного типу (побудова при першому виборі)"""
+        if not self.current_qr_instance:
+            return
+        
+        frame = self.input_frames.get(self.current_qr_type)
+        if frame is None:
+            frame = ttk.Frame(self.input_container)
+            self.current_qr_instance.create_input_fields(frame, self.clipboard_manager)
+            self.bind_live_updates(frame)
+            self.input_frames[self.current_qr_type] = frame
+        
+        if frame is not self.current_input_frame:
+            if self.current_input_frame is not None:
+                self.current_input_frame.pack_forget()
+            frame.pack(fill='both', expand=True)
+            self.current_input_frame = frame
+    
+    def bind_live_updates(self, widget: tk.Widget):
+        """Прив'язка живого режиму до всіх полів вводу"""
+        for child in widget.winfo_children():
+            for sequence in ('<KeyRelease>', '<ButtonRelease-1>',
+                             '<<ComboboxSelected>>', '<<Paste>>'):
+                child.bind(sequence, self.schedule_live_update, add='+')
+            self.bind_live_updates(child)
+    
+    def schedule_live_update(self, event=None):
+        """
+        Відкладене оновлення QR-коду в живому режимі
+        
+        На кожне натискання лише переплановується таймер, тому затримка
+        введення не залежить від довжини даних.
+        """
+        if not self.live_mode_var.get():
+            return
+        
+        if self._live_after_id is not None:
+            self.root.after_cancel(self._live_after_id)
+        self._live_after_id = self.root.after(LIVE_DEBOUNCE_MS, self.submit_live_update)
+    
+    def submit_live_update(self):
+        """Передача поточних даних на кодування у фоновий потік"""
+        self._live_after_id = None
+        if not self.current_qr_instance or not self.live_mode_var.get():
+            return
+        
+        try:
+            input_data = self.current_qr_instance.get_input_data()
+            
+            is_valid, message = self.current_qr_instance.validate_input(input_data)
+            if not is_valid:
+                self.show_live_error(message)
+                return
+            
+            qr_text = self.current_qr_instance.generate_qr_data(input_data)
+            from ..core.engine import RenderConfig
+            config = RenderConfig.from_settings(app_settings)
+        except Exception as e:
+            self.show_live_error(f"Помилка даних: {e}")
+            return
+        
+        # Дані не змінились - показаний QR-код актуальний
+        request = (qr_text, config)
+        if request == self._live_request and self.current_qr_result:
+            return
+        
+        self._live_request = request
+        self.live_renderer.request(qr_text, config)
+    
+    def encode_live(self, qr_text: str, config):
+        """Кодування у фоновому потоці (матриці беруться з кешу рушія)"""
+        from ..core.engine import QREngine
+        return QREngine(config).generate(qr_text)
+    
+    def show_live_error(self, message: str):
+        """
+        Скидання застарілого QR-коду живого режиму з поясненням у статусі
+        
+        Показаний код уже не відповідає введеним даним, тому його не можна
+        зберегти чи скопіювати.
+        
+        Args:
+            message: Повідомлення для рядка статусу
+        """
+        self.clear_qr_display()
+        self.status_var.set(message)
     
     def clear_fields(self):
         """Очищення всіх полів вводу"""
@@ -304,8 +435,9 @@ class QRCodeGenerator:
     
     def clear_qr_display(self):
         """Очищення відображення QR-коду"""
-        self.current_qr_image = None
-        self.qr_photo = None
+        self.live_renderer.cancel()
+        self._live_request = None
+        self.current_qr_result = None
         self.qr_label.configure(image='', text="QR-код з'явиться тут після генерації")
         self.save_btn.configure(state='disabled')
         self.copy_btn.configure(state='disabled')
@@ -338,65 +470,56 @@ class QRCodeGenerator:
             # Генерація тексту для QR-коду
             qr_text = self.current_qr_instance.generate_qr_data(input_data)
             
-            # Створення QR-коду
-            error_levels = {
-                'L': qrcode.constants.ERROR_CORRECT_L,
-                'M': qrcode.constants.ERROR_CORRECT_M,
-                'Q': qrcode.constants.ERROR_CORRECT_Q,
-                'H': qrcode.constants.ERROR_CORRECT_H
-            }
-            
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=error_levels.get(
-                    app_settings.get('error_correction', 'M'), 
-                    qrcode.constants.ERROR_CORRECT_M
-                ),
-                box_size=app_settings.get('box_size', 10),
-                border=app_settings.get('border', 4),
-            )
-            
-            qr.add_data(qr_text)
-            qr.make(fit=True)
+            # Результат живого режиму, що ще кодується, вже не потрібен
+            self.live_renderer.cancel()
             
-            # Створення базового зображення
-            self.current_qr_image = qr.make_image(fill_color="black", back_color="white")
-            
-            # Відображення QR-коду
-            self.display_qr_image()
-            
-            # Оновлення превью в дизайні
-            self.design_tab.update_preview(self.current_qr_image)
-            
-            # Активація кнопок
-            self.save_btn.configure(state='normal')
-            self.copy_btn.configure(state='normal')
-            
-            # Оновлення статусу
-            data_length = len(qr_text.encode('utf-8'))
-            type_name = self.current_qr_instance.name
-            self.status_var.set(
-                f"QR-код згенеровано ({type_name}) | Розмір даних: {data_length} байт"
-            )
+            # Створення QR-коду через рушій генерації
+            from ..core.engine import QREngine, RenderConfig
+            engine = QREngine(RenderConfig.from_settings(app_settings))
+            self.show_qr_result(engine.generate(qr_text))
             
         except Exception as e:
             messagebox.showerror("Помилка", f"Помилка при генерації QR-коду:\n{str(e)}")
     
-    def display_qr_image(self):
-        """Відображення QR-коду в основному вікні"""
-        if not self.current_qr_image:
+    def show_qr_result(self, qr_result):
+        """
+        Відображення нового результату генерації
+        
+        Args:
+            qr_result: Результат генерації QR-коду
+        """
+        self.current_qr_result = qr_result
+        
+        # Відображення QR-коду і превью в дизайні (фоновий рендеринг)
+        self.design_tab.update_preview(qr_result)
+        
+        # Активація кнопок
+        self.save_btn.configure(state='normal')
+        self.copy_btn.configure(state='normal')
+        
+        # Оновлення статусу
+        data_length = len(qr_result.payload.encode('utf-8'))
+        type_name = self.current_qr_instance.name
+        self.status_var.set(
+            f"QR-код згенеровано ({type_name}) | Розмір даних: {data_length} байт"
+        )
+    
+    def display_qr_image(self, display_image: 'Image.Image'):
+        """
+        Відображення QR-коду в основному вікні
+        
+        Args:
+            display_image: Готове зображення 300x300 з фонового рендерингу
+        """
+        if not self.current_qr_result:
             return
         
         try:
-            # Створення стилізованого зображення для відображення
-            styled_image = self.design_tab.create_styled_qr_image(self.current_qr_image)
-            
-            # Зміна розміру для відображення
-            display_size = (300, 300)
-            display_image = styled_image.resize(display_size, Image.Resampling.LANCZOS)
-            
-            # Конвертація для tkinter
-            self.qr_photo = ImageTk.PhotoImage(display_image)
+            # Одне зображення Tk на весь сеанс, оновлюється на місці
+            if self.qr_photo is None:
+                from PIL import ImageTk
+                self.qr_photo = ImageTk.PhotoImage('RGBA', display_image.size)
+            self.qr_photo.paste(display_image)
             self.qr_label.configure(image=self.qr_photo, text="")
             
         except Exception as e:
@@ -404,7 +527,7 @@ class QRCodeGenerator:
     
     def save_qr(self):
         """Збереження QR-коду"""
-        if not self.current_qr_image:
+        if not self.current_qr_result:
             messagebox.showwarning("Попередження", "Спочатку згенеруйте QR-код")
             return
         
@@ -423,7 +546,7 @@ class QRCodeGenerator:
             
             # Експорт через дизайн модуль
             success = self.qr_exporter.export_qr(
-                self.current_qr_image,
+                self.current_qr_result,
                 filepath,
                 self.design_tab.get_export_settings()
             )
@@ -439,62 +562,69 @@ class QRCodeGenerator:
     
     def copy_qr_to_clipboard(self):
         """Копіювання QR-коду в буфер обміну"""
-        if not self.current_qr_image:
+        if not self.current_qr_result:
             messagebox.showwarning("Попередження", "Спочатку згенеруйте QR-код")
             return
         
         try:
-            # Створення стилізованого зображення
-            styled_image = self.design_tab.create_styled_qr_image(self.current_qr_image)
+            png_data = self.get_clipboard_render()
             
-            # Збереження у тимчасовий файл для буфера обміну
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-                styled_image.save(tmp_file.name, 'PNG')
-                
-                # Копіювання в буфер обміну (Windows)
-                try:
-                    import win32clipboard
-                    from PIL import Image
-                    
-                    win32clipboard.OpenClipboard()
-                    win32clipboard.EmptyClipboard()
-                    
-                    # Конвертація в формат буфера обміну
-                    output = io.BytesIO()
-                    styled_image.convert('RGB').save(output, 'BMP')
-                    data = output.getvalue()[14:]  # Видаляємо BMP заголовок
-                    
-                    win32clipboard.SetClipboardData(win32clipboard.CF_DIB, data)
-                    win32clipboard.CloseClipboard()
-                    
-                    self.status_var.set("QR-код скопійовано в буфер обміну")
-                    messagebox.showinfo("Успіх", "QR-код скопійовано в буфер обміну")
-                    
-                except ImportError:
-                    # Альтернативний метод без win32clipboard
-                    self.clipboard_manager.set_text(f"QR код збережено у: {tmp_file.name}")
-                    messagebox.showinfo("Інформація", 
-                                      f"QR-код збережено у тимчасовий файл:\n{tmp_file.name}")
-                
+            if self.clipboard_manager.set_image(png_data):
+                self.status_var.set("QR-код скопійовано в буфер обміну")
+                messagebox.showinfo("Успіх", "QR-код скопійовано в буфер обміну")
+            else:
+                messagebox.showwarning(
+                    "Попередження",
+                    "Копіювання зображень у буфер обміну не підтримується на цій системі.\n"
+                    "Збережіть QR-код у файл."
+                )
+        
         except Exception as e:
             messagebox.showerror("Помилка", f"Помилка копіювання в буфер:\n{str(e)}")
     
+    def get_clipboard_render(self) -> bytes:
+        """
+        Стилізований поточний QR-код, закодований у PNG в пам'яті
+        
+        PNG пишеться з 1-бітних пікселів матриці (QRExporter.export_bytes)
+        один раз для кожної пари результату і налаштувань дизайну;
+        повторне копіювання бере готові дані.
+        
+        Returns:
+            Байти PNG
+        """
+        settings = self.design_tab.get_export_settings()
+        cached = self._clipboard_render
+        if cached and cached[0] is self.current_qr_result and cached[1] == settings:
+            return cached[2]
+        
+        png_data = self.qr_exporter.export_bytes(self.current_qr_result, settings, 'png')
+        if png_data is None:
+            raise ValueError("Не вдалося закодувати зображення у PNG")
+        
+        self._clipboard_render = (self.current_qr_result, settings, png_data)
+        return png_data
+    
     def open_settings(self):
         """Відкриття вікна налаштувань"""
-        dialog = SettingsDialog(self.root, app_settings)
-        if dialog.result:
+        # Діалог створюється один раз і далі лише показується
+        if self.settings_dialog is None or not self.settings_dialog.exists():
+            from .settings_dialog import SettingsDialog
+            self.settings_dialog = SettingsDialog(self.root, app_settings)
+        
+        if self.settings_dialog.show():
             # Оновлення статусу після зміни налаштувань
             self.status_var.set(f"Папка збереження: {app_settings.get('save_folder')}")
             
             # Перегенерація QR-коду якщо змінились базові параметри
-            if self.current_qr_image:
+            if self.current_qr_result:
                 self.generate_qr()
     
     def save_settings(self):
         """Збереження налаштувань при закритті"""
         # Збереження поточного типу QR-коду
         app_settings.set("last_qr_type", self.current_qr_type)
+        app_settings.set("live_mode", self.live_mode_var.get())
         
         # Збереження налаштувань дизайну
         design_settings = self.design_tab.get_current_settings()
@@ -506,7 +636,4 @@ class QRCodeGenerator:
     def on_closing(self):
         """Обробка закриття додатку"""
         self.save_settings()
-        self.root.destroy()
-
-# Імпортуємо io для роботи з буфером обміну
-import io
\ No newline at end of file
+        self.root.destroy()
\ No newline at end of file
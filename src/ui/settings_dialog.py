@@ -9,46 +9,90 @@ from tkinter import ttk, filedialog, messagebox
 import os
 from typing import Optional
 
+# Розмір діалогового вікна
+DIALOG_WIDTH = 650
+DIALOG_HEIGHT = 610
+
+# Значення списку для автоматичного вибору версії та маски
+AUTO_VALUE = "Авто"
+
 class SettingsDialog:
-    """Діалог налаштувань програми"""
+    """
+    Діалог налаштувань програми
+    
+    Вікно створюється один раз і між відкриттями лише ховається;
+    вміст вкладок будується при першому переході на них.
+    """
     
     def __init__(self, parent: tk.Tk, settings):
         self.parent = parent
         self.settings = settings
         self.result = False
         
-        # Створення діалогового вікна
+        # Створення прихованого діалогового вікна
         self.dialog = tk.Toplevel(parent)
+        self.dialog.withdraw()
         self.dialog.title("Налаштування")
-        self.dialog.geometry("650x550")
+        self.dialog.geometry(f"{DIALOG_WIDTH}x{DIALOG_HEIGHT}")
         self.dialog.resizable(False, False)
-        
-        # Центрування вікна
-        self.center_window()
-        
-        # Модальність
         self.dialog.transient(parent)
-        self.dialog.grab_set()
+        self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
         
         # Змінні для налаштувань
         self.setup_variables()
+        self.visible_var = tk.BooleanVar(value=False)
+        
+        # Знищення вікна разом з батьківським завершує очікування у show()
+        self.dialog.bind('<Destroy>', self.on_destroy)
         
         # Створення інтерфейсу
         self.create_widgets()
+    
+    def on_destroy(self, event):
+        """Обробка знищення вікна діалогу"""
+        if event.widget is self.dialog:
+            self.visible_var.set(False)
+    
+    def exists(self) -> bool:
+        """Чи існує ще вікно діалогу"""
+        try:
+            return bool(self.dialog.winfo_exists())
+        except tk.TclError:
+            return False
+    
+    def show(self) -> bool:
+        """
+        Показ модального діалогу
+        
+        Returns:
+            True, якщо налаштування збережено
+        """
+        self.result = False
         
         # Завантаження поточних налаштувань
         self.load_current_settings()
+        self.build_current_tab()
+        
+        self.center_window()
+        self.dialog.deiconify()
+        self.dialog.grab_set()
         
         # Очікування закриття діалогу
-        self.dialog.wait_window()
+        self.visible_var.set(True)
+        self.dialog.wait_variable(self.visible_var)
+        return self.result
+    
+    def hide(self):
+        """Приховування діалогу до наступного відкриття"""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        self.visible_var.set(False)
     
     def center_window(self):
         """Центрування вікна відносно батьківського"""
-        self.dialog.update_idletasks()
-        
         # Розміри вікон
-        dialog_width = self.dialog.winfo_width()
-        dialog_height = self.dialog.winfo_height()
+        dialog_width = DIALOG_WIDTH
+        dialog_height = DIALOG_HEIGHT
         parent_x = self.parent.winfo_x()
         parent_y = self.parent.winfo_y()
         parent_width = self.parent.winfo_width()
@@ -66,6 +110,8 @@ class SettingsDialog:
         self.error_var = tk.StringVar()
         self.box_size_var = tk.IntVar()
         self.border_var = tk.IntVar()
+        self.version_var = tk.StringVar()
+        self.mask_var = tk.StringVar()
         self.default_type_var = tk.StringVar()
         self.auto_save_var = tk.BooleanVar()
         self.show_tips_var = tk.BooleanVar()
@@ -77,21 +123,32 @@ class SettingsDialog:
         main_frame.pack(fill='both', expand=True)
         
         # Створення notebook для вкладок
-        notebook = ttk.Notebook(main_frame)
-        notebook.pack(fill='both', expand=True, pady=(0, 15))
+        self.notebook = ttk.Notebook(main_frame)
+        self.notebook.pack(fill='both', expand=True, pady=(0, 15))
+        
+        # Вкладки: порожні фрейми, вміст будується при першому відкритті
+        self.tab_builders = {}
+        for text, builder in (("Загальні", self.create_general_tab),
+                              ("QR-код", self.create_qr_tab),
+                              ("Розширені", self.create_advanced_tab)):
+            frame = ttk.Frame(self.notebook, padding="10")
+            self.notebook.add(frame, text=text)
+            self.tab_builders[str(frame)] = (frame, builder)
         
-        # Вкладки
-        self.create_general_tab(notebook)
-        self.create_qr_tab(notebook)
-        self.create_advanced_tab(notebook)
+        self.notebook.bind('<<NotebookTabChanged>>', self.build_current_tab)
         
         # Кнопки
         self.create_buttons(main_frame)
     
-    def create_general_tab(self, notebook):
+    def build_current_tab(self, event=None):
+        """Побудова вмісту вибраної вкладки, якщо її ще не побудовано"""
+        entry = self.tab_builders.pop(self.notebook.select(), None)
+        if entry:
+            frame, builder = entry
+            builder(frame)
+    
+    def create_general_tab(self, general_frame):
         """Створення вкладки загальних налаштувань"""
-        general_frame = ttk.Frame(notebook, padding="10")
-        notebook.add(general_frame, text="Загальні")
         
         # Папка збереження
         ttk.Label(general_frame, text="Папка для збереження QR-кодів:").pack(anchor='w', pady=(0, 5))
@@ -138,10 +195,8 @@ class SettingsDialog:
             variable=self.show_tips_var
         ).pack(anchor='w', pady=2)
     
-    def create_qr_tab(self, notebook):
+    def create_qr_tab(self, qr_frame):
         """Створення вкладки налаштувань QR-коду"""
-        qr_frame = ttk.Frame(notebook, padding="10")
-        notebook.add(qr_frame, text="QR-код")
         
         # Рівень корекції помилок
         ttk.Label(qr_frame, text="Рівень корекції помилок:").pack(anchor='w', pady=(0, 5))
@@ -178,7 +233,7 @@ class SettingsDialog:
             orient='horizontal'
         ).pack(side='left', fill='x', expand=True, padx=(0, 10))
         
-        self.box_size_label = ttk.Label(box_size_frame, text="10", width=3)
+        self.box_size_label = ttk.Label(box_size_frame, text=str(self.box_size_var.get()), width=3)
         self.box_size_label.pack(side='right')
         
         # Оновлення лейблу
@@ -200,7 +255,7 @@ class SettingsDialog:
             orient='horizontal'
         ).pack(side='left', fill='x', expand=True, padx=(0, 10))
         
-        self.border_label = ttk.Label(border_frame, text="4", width=3)
+        self.border_label = ttk.Label(border_frame, text=str(self.border_var.get()), width=3)
         self.border_label.pack(side='right')
         
         # Оновлення лейблу границі
@@ -208,20 +263,42 @@ class SettingsDialog:
             self.border_label.config(text=str(self.border_var.get()))
         self.border_var.trace('w', update_border_label)
         
+        # Фіксована геометрія для друку: однакова версія (і маска) всіх кодів
+        geometry_frame = ttk.LabelFrame(qr_frame, text="Фіксована геометрія", padding="5")
+        geometry_frame.pack(fill='x', pady=(0, 15))
+        
+        ttk.Label(geometry_frame, text="Версія:").grid(row=0, column=0, sticky='w', padx=(0, 5))
+        ttk.Combobox(
+            geometry_frame,
+            textvariable=self.version_var,
+            values=[AUTO_VALUE] + [str(v) for v in range(1, 41)],
+            state="readonly",
+            width=8
+        ).grid(row=0, column=1, sticky='w', padx=(0, 20))
+        
+        ttk.Label(geometry_frame, text="Маска:").grid(row=0, column=2, sticky='w', padx=(0, 5))
+        ttk.Combobox(
+            geometry_frame,
+            textvariable=self.mask_var,
+            values=[AUTO_VALUE] + [str(m) for m in range(8)],
+            state="readonly",
+            width=8
+        ).grid(row=0, column=3, sticky='w')
+        
         # Інформація про налаштування
         info_frame = ttk.LabelFrame(qr_frame, text="Інформація", padding="5")
         info_frame.pack(fill='x', pady=(10, 0))
         
         info_text = ("• Вищий рівень корекції дозволяє сканувати пошкоджені QR-коди\n"
                     "• Більший розмір блоку створює більші QR-коди\n"
-                    "• Границя допомагає сканерам краще розпізнавати QR-код")
+                    "• Границя допомагає сканерам краще розпізнавати QR-код\n"
+                    "• Фіксована версія вирівнює розмір кодів при друку; дані, що не\n"
+                    "  вміщуються, дають помилку замість збільшення версії")
         
         ttk.Label(info_frame, text=info_text, font=('Arial', 9), justify='left').pack(anchor='w')
     
-    def create_advanced_tab(self, notebook):
+    def create_advanced_tab(self, advanced_frame):
         """Створення вкладки розширених налаштувань"""
-        advanced_frame = ttk.Frame(notebook, padding="10")
-        notebook.add(advanced_frame, text="Розширені")
         
         # Продуктивність
         performance_frame = ttk.LabelFrame(advanced_frame, text="Продуктивність", padding="5")
@@ -303,11 +380,23 @@ class SettingsDialog:
         self.error_var.set(self.settings.get('error_correction', 'M'))
         self.box_size_var.set(self.settings.get('box_size', 10))
         self.border_var.set(self.settings.get('border', 4))
+        self.version_var.set(self._choice_text(self.settings.get('version')))
+        self.mask_var.set(self._choice_text(self.settings.get('mask')))
         self.default_type_var.set(self.settings.get('last_qr_type', 'text'))
         self.auto_save_var.set(self.settings.get('auto_save', False))
         self.show_tips_var.set(self.settings.get('show_tips', True))
         self.language_var.set(self.settings.get('language', 'uk'))
     
+    @staticmethod
+    def _choice_text(value) -> str:
+        """Текст списку для числового налаштування (None - автоматично)"""
+        return AUTO_VALUE if value is None else str(value)
+    
+    @staticmethod
+    def _choice_value(text: str):
+        """Числове налаштування з тексту списку"""
+        return None if text in ('', AUTO_VALUE) else int(text)
+    
     def browse_folder(self):
         """Вибір папки для збереження"""
         folder = filedialog.askdirectory(initialdir=self.folder_var.get())
@@ -380,6 +469,8 @@ class SettingsDialog:
             self.error_var.set("M")
             self.box_size_var.set(10)
             self.border_var.set(4)
+            self.version_var.set(AUTO_VALUE)
+            self.mask_var.set(AUTO_VALUE)
             self.default_type_var.set("text")
             self.auto_save_var.set(False)
             self.show_tips_var.set(True)
@@ -406,6 +497,8 @@ class SettingsDialog:
             self.settings.set('error_correction', self.error_var.get())
             self.settings.set('box_size', self.box_size_var.get())
             self.settings.set('border', self.border_var.get())
+            self.settings.set('version', self._choice_value(self.version_var.get()))
+            self.settings.set('mask', self._choice_value(self.mask_var.get()))
             self.settings.set('last_qr_type', self.default_type_var.get())
             self.settings.set('auto_save', self.auto_save_var.get())
             self.settings.set('show_tips', self.show_tips_var.get())
@@ -414,7 +507,7 @@ class SettingsDialog:
             # Збереження у файл
             if self.settings.save_settings():
                 self.result = True
-                self.dialog.destroy()
+                self.hide()
                 messagebox.showinfo("Успіх", "Налаштування збережено")
             else:
                 messagebox.showerror("Помилка", "Не вдалося зберегти налаштування")
@@ -425,4 +518,4 @@ class SettingsDialog:
     def cancel(self):
         """Скасування змін"""
         self.result = False
-        self.dialog.destroy()
\ No newline at end of file
+        self.hide()
\ No newline at end of file
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Допоміжні класи для інтерфейсу
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Затримка перед рендерингом, за яку швидкі зміни об'єднуються в один запит
+DEFAULT_DEBOUNCE_MS = 40
+
+# Інтервал перевірки готових результатів
+DEFAULT_POLL_MS = 15
+
+class BackgroundRenderer:
+    """
+    Рендеринг у фоновому потоці з об'єднанням запитів
+    
+    Потік Tk лише запам'ятовує останні параметри та забирає готовий
+    результат через after(); сам рендеринг виконується у робочому потоці.
+    Запити, що надійшли під час затримки або рендерингу, замінюють
+    попередні, а застарілі результати відкидаються.
+    """
+    
+    def __init__(self, widget, render: Callable[..., Any], deliver: Callable[[Any], None],
+                 delay_ms: int = DEFAULT_DEBOUNCE_MS, poll_ms: int = DEFAULT_POLL_MS,
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        """
+        Args:
+            widget: Віджет Tk для планування через after()
+            render: Функція рендерингу; виконується у робочому потоці і не
+                повинна звертатися до віджетів або змінних Tk
+            deliver: Функція, що отримує результат у потоці Tk
+            delay_ms: Затримка об'єднання запитів у мілісекундах
+            poll_ms: Інтервал перевірки готових результатів
+            on_error: Функція, що отримує помилку рендерингу останнього
+                запиту у потоці Tk; без неї помилка лише виводиться
+        """
+        self.widget = widget
+        self.render = render
+        self.deliver = deliver
+        self.on_error = on_error
+        self.delay_ms = delay_ms
+        self.poll_ms = poll_ms
+        
+        # Номер останнього запиту; результати інших номерів застарілі
+        self._generation = 0
+        self._pending_args: Tuple = ()
+        self._after_id = None
+        self._poll_id = None
+        
+        # Стан робочого потоку
+        self._condition = threading.Condition()
+        self._job: Optional[Tuple[int, Tuple]] = None
+        self._busy = False
+        self._results: 'queue.Queue[Tuple[int, Any, Optional[Exception]]]' = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        
+        # Статистика часу, проведеного у потоці Tk
+        self.ui_calls = 0
+        self.ui_time_total = 0.0
+        self.ui_time_max = 0.0
+        self.rendered = 0
+        self.dropped = 0
+    
+    def request(self, *args):
+        """
+        Запит рендерингу з новими параметрами (викликається у потоці Tk)
+        
+        Args:
+            *args: Аргументи для функції render
+        """
+        start = time.perf_counter()
+        
+        self._generation += 1
+        self._pending_args = args
+        
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+        self._after_id = self.widget.after(self.delay_ms, self._submit)
+        
+        self._record_ui_time(start)
+    
+    def cancel(self):
+        """Скасування запланованого рендерингу і відкидання поточних результатів"""
+        self._generation += 1
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        with self._condition:
+            self._job = None
+    
+    def _submit(self):
+        """Передача останнього запиту робочому потоку"""
+        self._after_id = None
+        
+        with self._condition:
+            # Незабраний попередній запит просто замінюється
+            if self._job is not None:
+                self.dropped += 1
+            self._job = (self._generation, self._pending_args)
+            self._condition.notify()
+        
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker_loop, daemon=True)
+            self._thread.start()
+        
+        if self._poll_id is None:
+            self._poll_id = self.widget.after(self.poll_ms, self._poll)
+    
+    def _worker_loop(self):
+        """Цикл робочого потоку"""
+        while True:
+            with self._condition:
+                while self._job is None:
+                    self._condition.wait()
+                generation, args = self._job
+                self._job = None
+                self._busy = True
+            
+            try:
+                # Запит міг застаріти, поки чекав у черзі
+                if generation != self._generation:
+                    self.dropped += 1
+                    continue
+                
+                try:
+                    self._results.put((generation, self.render(*args), None))
+                except Exception as e:
+                    self._results.put((generation, None, e))
+            finally:
+                with self._condition:
+                    self._busy = False
+    
+    def _poll(self):
+        """Отримання готових результатів у потоці Tk"""
+        start = time.perf_counter()
+        self._poll_id = None
+        
+        with self._condition:
+            still_running = self._busy or self._job is not None
+        
+        # Доставляється лише результат останнього запиту
+        latest = None
+        while True:
+            try:
+                item = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if item[0] == self._generation:
+                latest = item
+            else:
+                self.dropped += 1
+        
+        if latest is not None:
+            _, result, error = latest
+            if error is not None:
+                if self.on_error is not None:
+                    self.on_error(error)
+                else:
+                    print(f"Помилка фонового рендерингу: {error}")
+            else:
+                self.rendered += 1
+                self.deliver(result)
+        
+        if still_running or not self._results.empty():
+            self._poll_id = self.widget.after(self.poll_ms, self._poll)
+        
+        self._record_ui_time(start)
+    
+    def _record_ui_time(self, start: float):
+        """Облік часу, проведеного у потоці Tk"""
+        elapsed = time.perf_counter() - start
+        self.ui_calls += 1
+        self.ui_time_total += elapsed
+        if elapsed > self.ui_time_max:
+            self.ui_time_max = elapsed
+    
+    def stats(self) -> Dict[str, Any]:
+        """Статистика роботи у мілісекундах"""
+        return {
+            'ui_calls': self.ui_calls,
+            'ui_time_max_ms': self.ui_time_max * 1000,
+            'ui_time_avg_ms': self.ui_time_total / self.ui_calls * 1000 if self.ui_calls else 0.0,
+            'rendered': self.rendered,
+            'dropped': self.dropped
+        }
\ No newline at end of file
@@ -2,7 +2,15 @@
 Модуль утиліт
 """
 
-from .clipboard import ClipboardManager, setup_clipboard_menu, auto_paste_if_valid
 from .validators import *
 
+# Функції буфера обміну залежать від tkinter і завантажуються при першому зверненні
+_CLIPBOARD_EXPORTS = ('ClipboardManager', 'setup_clipboard_menu', 'auto_paste_if_valid')
+
+def __getattr__(name):
+    if name in _CLIPBOARD_EXPORTS:
+        from . import clipboard
+        return getattr(clipboard, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = ['ClipboardManager', 'setup_clipboard_menu', 'auto_paste_if_valid']
\ No newline at end of file
@@ -30,6 +30,58 @@ class ClipboardManager:
         except tk.TclError:
             return False
     
+    def set_image(self, png_data: bytes) -> bool:
+        """
+        Копіювання зображення PNG у буфер обміну без тимчасових файлів
+        
+        X11: буфер публікує ціль image/png через механізм виділень Tk.
+        Tk передає дані у форматі STRING, перетворюючи символи в
+        ISO 8859-1, тому байти, декодовані як latin-1, доходять до
+        отримувача без змін (великі дані Tk віддає частинами INCR).
+        
+        Windows: формат "PNG" (зберігає прозорість) і CF_DIB, декодований
+        з того ж PNG, для програм, що не читають PNG.
+        
+        Args:
+            png_data: Закодований PNG
+        
+        Returns:
+            True якщо зображення скопійовано; False, якщо система
+            не підтримується або буфер недоступний
+        """
+        system = self.root.tk.call('tk', 'windowingsystem')
+        if system == 'x11':
+            try:
+                self.root.clipboard_clear()
+                self.root.clipboard_append(png_data.decode('latin-1'), type='image/png')
+                return True
+            except tk.TclError:
+                return False
+        
+        if system == 'win32':
+            try:
+                import win32clipboard
+            except ImportError:
+                return False
+            
+            win32clipboard.OpenClipboard()
+            try:
+                win32clipboard.EmptyClipboard()
+                win32clipboard.SetClipboardData(win32clipboard.RegisterClipboardFormat('PNG'), png_data)
+                import io
+                from PIL import Image
+                
+                output = io.BytesIO()
+                with Image.open(io.BytesIO(png_data)) as image:
+                    image.convert('RGB').save(output, 'BMP')
+                # CF_DIB - це BMP без 14-байтового заголовка файлу
+                win32clipboard.SetClipboardData(win32clipboard.CF_DIB, output.getbuffer()[14:].tobytes())
+            finally:
+                win32clipboard.CloseClipboard()
+            return True
+        
+        return False
+    
     def has_text(self) -> bool:
         """Перевірка наявності тексту в буфері обміну"""
         try:
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Профілювання запуску додатку
+
+Фази запуску (імпорти, налаштування, вікно, вкладки) обгортаються у
+startup_profiler.phase(); поки профілювання не ввімкнено ключем
+--startup-profile, обгортки нічого не вимірюють.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+class StartupProfiler:
+    """Облік тривалості фаз запуску"""
+    
+    def __init__(self):
+        self.enabled = False
+        self.started = time.perf_counter()
+        self.phases: List[Tuple[int, str, float]] = []
+        self.marks: List[Tuple[str, float]] = []
+        self._depth = 0
+    
+    def enable(self):
+        """Увімкнення профілювання з відліком від поточного моменту"""
+        self.enabled = True
+        self.started = time.perf_counter()
+    
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Вимірювання тривалості фази
+        
+        Args:
+            name: Назва фази у звіті
+        """
+        if not self.enabled:
+            yield
+            return
+        
+        index = len(self.phases)
+        self.phases.append((self._depth, name, 0.0))
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.phases[index] = (self._depth, name, time.perf_counter() - start)
+    
+    def mark(self, name: str):
+        """Позначка моменту від початку запуску"""
+        if self.enabled:
+            self.marks.append((name, time.perf_counter() - self.started))
+    
+    def format_report(self) -> str:
+        """Текстовий звіт про фази запуску"""
+        lines = ["Профіль запуску:"]
+        for depth, name, elapsed in self.phases:
+            label = "  " * depth + name
+            lines.append(f"  {label:<40}{elapsed * 1000:>9.1f} мс")
+        for name, elapsed in self.marks:
+            lines.append(f"  {name:<40}{elapsed * 1000:>9.1f} мс від старту")
+        return "\n".join(lines)
+
+# Глобальний профайлер запуску
+startup_profiler = StartupProfiler()
\ No newline at end of file